@@ -16,6 +16,7 @@ from app.models.plan import Plan
 from app.models.dedication_type import DedicationType
 from app.models.document_type import DocumentType
 from app.models.specialty_type import SpecialtyType
+from app.models.certificate_job import CertificateJob
 
 
 @admin.register(University)
@@ -145,3 +146,9 @@ class DocumentTypeAdmin(admin.ModelAdmin):
 class SpecialtyTypeAdmin(admin.ModelAdmin):
     list_display = ["id", "name"]
     search_fields = ["name"]
+
+
+@admin.register(CertificateJob)
+class CertificateJobAdmin(admin.ModelAdmin):
+    list_display = ["id", "student", "document_type", "status", "created_at"]
+    list_filter = ["status", "document_type"]
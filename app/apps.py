@@ -5,3 +5,12 @@ class AppConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "app"
     verbose = "Sysacad"
+
+    def ready(self):
+        from app.repositories.reference_cache import ReferenceCache
+        from app.services.certificate_job import CertificateJobService
+        from app.utils.hierarchy_cache import HierarchyCache
+
+        ReferenceCache.connect_signals()
+        HierarchyCache.connect_signals()
+        CertificateJobService.connect_signals()
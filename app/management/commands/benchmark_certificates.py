@@ -0,0 +1,272 @@
+import datetime
+import json
+import multiprocessing
+import platform
+import statistics
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from app.utils.renderer_pool import get_peak_rss
+
+SUPPORTED_FORMATS = ("pdf", "odt", "docx")
+
+
+def _build_context(index: int) -> dict:
+    """Build a certificate context from unsaved model instances."""
+    from app.models import DocumentType, Faculty, Specialty, Student, University
+    from app.services.student import StudentService
+
+    university = University(name="Universidad Tecnológica Nacional", acronym="UTN")
+    faculty = Faculty(
+        name="Facultad Regional San Rafael",
+        abbreviation="FRSR",
+        city="San Rafael",
+        university=university,
+    )
+    specialty = Specialty(name="Ingeniería en Sistemas de Información", faculty=faculty)
+    student = Student(
+        id=index,
+        first_name="Juan",
+        last_name=f"Pérez {index}",
+        document_number=str(30000000 + index),
+        birth_date=datetime.date(2000, 1, 1),
+        student_number=10000 + index,
+        enrollment_date=datetime.date(2020, 3, 1),
+        document_type=DocumentType(dni=30000000 + index),
+        specialty=specialty,
+    )
+    return StudentService._get_student_data(student)
+
+
+def _run_renders(document_type: str, iterations: int, warmup: int) -> Dict:
+    """Render certificates in the current process and time each render."""
+    from app.services.student import CERTIFICATE_FOLDER, CERTIFICATE_TEMPLATE
+    from app.utils import get_document_generator
+
+    document_generator = get_document_generator(document_type)
+    latencies = []
+    errors = 0
+    error = None
+    started = None
+
+    for index in range(warmup + iterations):
+        if index == warmup:
+            started = time.time()
+
+        context = _build_context(index + 1)
+        start = time.perf_counter()
+        try:
+            document_generator.generate(
+                folder=CERTIFICATE_FOLDER,
+                template=CERTIFICATE_TEMPLATE,
+                context=context,
+            )
+        except Exception as e:
+            errors += 1
+            error = error or str(e)
+            continue
+        finally:
+            elapsed = time.perf_counter() - start
+
+        if index >= warmup:
+            latencies.append(elapsed)
+
+    return {
+        "latencies": latencies,
+        "errors": errors,
+        "error": error,
+        "started": started,
+        "finished": time.time(),
+        "peak_rss_bytes": get_peak_rss(),
+    }
+
+
+def _summarize(latencies: List[float]) -> Optional[Dict[str, float]]:
+    """Latency statistics in milliseconds."""
+    if not latencies:
+        return None
+
+    milliseconds = sorted(latency * 1000 for latency in latencies)
+    if len(milliseconds) > 1:
+        percentiles = statistics.quantiles(milliseconds, n=100, method="inclusive")
+    else:
+        percentiles = milliseconds * 99
+
+    return {
+        "min": round(milliseconds[0], 3),
+        "mean": round(statistics.fmean(milliseconds), 3),
+        "p50": round(percentiles[49], 3),
+        "p95": round(percentiles[94], 3),
+        "p99": round(percentiles[98], 3),
+        "max": round(milliseconds[-1], 3),
+    }
+
+
+def _get_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=settings.BASE_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark certificate generation with the real templates, reporting "
+        "latency percentiles, throughput and peak RSS per format."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--formats",
+            default=",".join(SUPPORTED_FORMATS),
+            help="Comma separated formats to benchmark (default: pdf,odt,docx)",
+        )
+        parser.add_argument(
+            "--iterations",
+            type=int,
+            default=20,
+            help="Timed renders per worker in warm runs (default: 20)",
+        )
+        parser.add_argument(
+            "--warmup",
+            type=int,
+            default=2,
+            help="Untimed renders per worker before warm runs (default: 2)",
+        )
+        parser.add_argument(
+            "--cold-runs",
+            type=int,
+            default=3,
+            help="Fresh processes started to time the first render (default: 3)",
+        )
+        parser.add_argument(
+            "--concurrency",
+            default="1,2,4",
+            help="Comma separated worker process counts (default: 1,2,4)",
+        )
+        parser.add_argument(
+            "--output",
+            default="certificate_benchmark.json",
+            help="JSON file the results are written to",
+        )
+
+    def handle(self, *args, **options):
+        formats = [f.strip().lower() for f in options["formats"].split(",") if f]
+        unsupported = set(formats) - set(SUPPORTED_FORMATS)
+        if unsupported:
+            raise CommandError(f"Unsupported formats: {', '.join(sorted(unsupported))}")
+
+        if options["iterations"] < 1:
+            raise CommandError("Iterations must be at least 1")
+
+        try:
+            concurrency_levels = [int(c) for c in options["concurrency"].split(",")]
+        except ValueError:
+            raise CommandError("Concurrency must be a comma separated list of integers")
+
+        results = []
+        for document_type in formats:
+            results.append(self._run_cold(document_type, options["cold_runs"]))
+            for workers in concurrency_levels:
+                results.append(
+                    self._run_warm(
+                        document_type, workers, options["iterations"], options["warmup"]
+                    )
+                )
+
+        report = {
+            "commit": _get_commit(),
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": multiprocessing.cpu_count(),
+            "results": results,
+        }
+
+        with open(options["output"], "w") as f:
+            json.dump(report, f, indent=2)
+
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+    def _run_workers(
+        self, document_type: str, workers: int, iterations: int, warmup: int
+    ) -> List[Dict]:
+        # Spawned workers start from a fresh interpreter with no cached templates
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=django.setup,
+        ) as executor:
+            futures = [
+                executor.submit(_run_renders, document_type, iterations, warmup)
+                for _ in range(workers)
+            ]
+            return [future.result() for future in futures]
+
+    def _run_cold(self, document_type: str, runs: int) -> Dict:
+        runs_results = []
+        for _ in range(runs):
+            runs_results.extend(self._run_workers(document_type, 1, 1, 0))
+
+        return self._build_result(document_type, "cold", 1, runs_results)
+
+    def _run_warm(
+        self, document_type: str, workers: int, iterations: int, warmup: int
+    ) -> Dict:
+        runs_results = self._run_workers(document_type, workers, iterations, warmup)
+        return self._build_result(document_type, "warm", workers, runs_results)
+
+    def _build_result(
+        self, document_type: str, mode: str, workers: int, runs_results: List[Dict]
+    ) -> Dict:
+        latencies = [
+            latency for result in runs_results for latency in result["latencies"]
+        ]
+        errors = sum(result["errors"] for result in runs_results)
+        peak_rss = [
+            result["peak_rss_bytes"]
+            for result in runs_results
+            if result["peak_rss_bytes"] is not None
+        ]
+
+        throughput = None
+        if mode == "warm" and latencies:
+            elapsed = max(result["finished"] for result in runs_results) - min(
+                result["started"] for result in runs_results
+            )
+            throughput = round(len(latencies) / elapsed, 3) if elapsed > 0 else None
+
+        result = {
+            "format": document_type,
+            "mode": mode,
+            "concurrency": workers,
+            "renders": len(latencies),
+            "errors": errors,
+            "error": next(
+                (result["error"] for result in runs_results if result["error"]), None
+            ),
+            "latency_ms": _summarize(latencies),
+            "throughput_per_s": throughput,
+            "peak_rss_bytes": max(peak_rss) if peak_rss else None,
+        }
+
+        summary = result["latency_ms"] or {}
+        self.stdout.write(
+            f"{document_type:<5} {mode:<5} workers={workers:<3} "
+            f"renders={len(latencies):<5} errors={errors:<3} "
+            f"p50={summary.get('p50', '-')}ms p95={summary.get('p95', '-')}ms "
+            f"throughput={throughput or '-'}/s"
+        )
+        return result
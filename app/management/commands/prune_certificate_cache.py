@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from app.utils import DocumentCache
+
+
+class Command(BaseCommand):
+    help = "Delete cached certificates older than CERTIFICATE_CACHE_MAX_AGE."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-age",
+            type=int,
+            default=None,
+            help="Age in seconds to prune from (default: CERTIFICATE_CACHE_MAX_AGE)",
+        )
+
+    def handle(self, *args, **options):
+        deleted = DocumentCache.prune(options["max_age"])
+        self.stdout.write(f"Deleted {deleted} cached certificates")
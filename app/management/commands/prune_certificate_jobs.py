@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from app.services import CertificateJobService
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete finished certificate jobs older than CERTIFICATE_JOB_MAX_AGE, "
+        "with their result files."
+    )
+
+    def handle(self, *args, **options):
+        deleted = CertificateJobService.delete_expired()
+        self.stdout.write(f"Deleted {deleted} certificate jobs")
@@ -0,0 +1,12 @@
+from app.repositories.identity_map import IdentityMap
+
+
+class IdentityMapMiddleware:
+    """Share one repository identity map across the handling of a request."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with IdentityMap.scope():
+            return self.get_response(request)
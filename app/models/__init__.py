@@ -15,3 +15,4 @@ from .position import Position
 from .orientation import Orientation
 from .authority import Authority
 from .faculty import Faculty
+from .certificate_job import CertificateJob
@@ -0,0 +1,45 @@
+from django.db import models
+
+
+class CertificateJob(models.Model):
+    STATUS_PENDING = "pending"
+    STATUS_RUNNING = "running"
+    STATUS_DONE = "done"
+    STATUS_FAILED = "failed"
+
+    student = models.ForeignKey(
+        "Student",
+        on_delete=models.CASCADE,
+        related_name="certificate_jobs",
+    )
+    document_type = models.CharField(max_length=10, help_text="pdf, odt or docx")
+    status = models.CharField(
+        max_length=10,
+        choices=[
+            (STATUS_PENDING, "Pending"),
+            (STATUS_RUNNING, "Running"),
+            (STATUS_DONE, "Done"),
+            (STATUS_FAILED, "Failed"),
+        ],
+        default=STATUS_PENDING,
+    )
+    result = models.FileField(upload_to="certificates/jobs/", null=True, blank=True)
+    error = models.CharField(max_length=255, null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Certificate job {self.id} ({self.document_type}) - {self.status}"
+
+    def __repr__(self):
+        return f"<CertificateJob: {self.id} - {self.status}>"
+
+    class Meta:
+        db_table = "certificate_jobs"
+        verbose_name = "Certificate Job"
+        verbose_name_plural = "Certificate Jobs"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status"]),
+        ]
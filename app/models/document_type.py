@@ -21,6 +21,19 @@ class DocumentType(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    @property
+    def abbreviation(self):
+        """Abbreviation printed before the document number on certificates."""
+        if self.dni:
+            return "DNI"
+        if self.civic_card:
+            return "L.C"
+        if self.enrollment_card:
+            return "L.E"
+        if self.passport:
+            return "Pasaporte"
+        return "Documento"
+
     def __str__(self):
         types = []
         if self.dni:
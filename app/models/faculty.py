@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Upper
 from django.core.validators import EmailValidator
 
 
@@ -50,4 +51,6 @@ class Faculty(models.Model):
             models.Index(fields=["acronym"]),
             models.Index(fields=["abbreviation"]),
             models.Index(fields=["name"]),
+            # Serves the case-insensitive city lookup of find_by_city
+            models.Index(Upper("city"), name="faculties_city_upper_idx"),
         ]
@@ -33,4 +33,5 @@ class Position(models.Model):
         indexes = [
             models.Index(fields=["name"]),
             models.Index(fields=["position_category"]),
+            models.Index(fields=["points"]),
         ]
@@ -15,3 +15,4 @@ from .position import PositionRepository
 from .orientation import OrientationRepository
 from .authority import AuthorityRepository
 from .faculty import FacultyRepository
+from .certificate_job import CertificateJobRepository
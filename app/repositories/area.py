@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Area
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class AreaRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(area_data: Dict[str, Any]) -> Area:
         area = Area(**area_data)
         area.full_clean()
@@ -12,9 +20,12 @@ class AreaRepository:
         return area
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Area]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Area]:
+        table = ReferenceCache.table(Area)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return Area.objects.get(id=id)
+            return only_fields(Area.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,15 +42,61 @@ class AreaRepository:
 
     @staticmethod
     def find_all() -> List[Area]:
+        table = ReferenceCache.table(Area)
+        if table is not None:
+            return table.find_all()
         return list(Area.objects.all())
 
     @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Area]:
+        table = ReferenceCache.table(Area)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(Area.objects, fields), AreaRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(Area)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(Area.objects.all(), AreaRepository.FILTERS, filters)
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(Area.objects.all(), AreaRepository.FILTERS, filters)
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    @IdentityMap.invalidates
     def update(area: Area) -> Area:
         area.full_clean()
         area.save()
         return area
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         area = AreaRepository.find_by_id(id)
         if not area:
@@ -49,6 +106,9 @@ class AreaRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(Area)
+        if table is not None:
+            return table.exists_by_id(id)
         return Area.objects.filter(id=id).exists()
 
     @staticmethod
@@ -56,5 +116,28 @@ class AreaRepository:
         return Area.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return Area.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(Area)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(Area.objects, AreaRepository.FILTERS, filters).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Area.objects.all(), AreaRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(Area)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(Area.objects.all(), AreaRepository.FILTERS, filters)
+        )
@@ -1,12 +1,23 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Authority
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 from app.models import Subject
 from app.models import Faculty
 
 
 class AuthorityRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "position": "position_id",
+        "faculty": "faculties__id",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(authority_data: Dict[str, Any]) -> Authority:
         authority = Authority(**authority_data)
         authority.full_clean()
@@ -14,9 +25,14 @@ class AuthorityRepository:
         return authority
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Authority]:
+    @IdentityMap.memoize_find_by_id(Authority)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Authority]:
         try:
-            return Authority.objects.select_related("position").get(id=id)
+            return only_fields(
+                Authority.objects.select_related("position"), fields
+            ).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -24,6 +40,47 @@ class AuthorityRepository:
     def find_all() -> List[Authority]:
         return list(Authority.objects.select_related("position").all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Authority]:
+        queryset = apply_filters(
+            only_fields(Authority.objects.select_related("position"), fields),
+            AuthorityRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Authority.objects.all(), AuthorityRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Authority.objects.all(), AuthorityRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_position(position_id: int) -> List[Authority]:
         return list(
@@ -62,12 +119,14 @@ class AuthorityRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(authority: Authority) -> Authority:
         authority.full_clean()
         authority.save()
         return authority
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         authority = AuthorityRepository.find_by_id(id)
         if not authority:
@@ -76,6 +135,7 @@ class AuthorityRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Authority)
     def exists_by_id(id: int) -> bool:
         return Authority.objects.filter(id=id).exists()
 
@@ -84,8 +144,29 @@ class AuthorityRepository:
         return Authority.objects.filter(email=email).exists()
 
     @staticmethod
-    def count() -> int:
-        return Authority.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Authority.objects, AuthorityRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                Authority.objects.all(), AuthorityRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Authority.objects.all(), AuthorityRepository.FILTERS, filters)
+        )
 
     @staticmethod
     def find_with_relations(id: int) -> Optional[Authority]:
@@ -103,17 +184,21 @@ class AuthorityRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def associate_subject(authority: Authority, subject: Subject) -> None:
         authority.subjects.add(subject)
 
     @staticmethod
+    @IdentityMap.invalidates
     def disassociate_subject(authority: Authority, subject: Subject) -> None:
         authority.subjects.remove(subject)
 
     @staticmethod
+    @IdentityMap.invalidates
     def associate_faculty(authority: Authority, faculty: Faculty) -> None:
         authority.faculties.add(faculty)
 
     @staticmethod
+    @IdentityMap.invalidates
     def disassociate_faculty(authority: Authority, faculty: Faculty) -> None:
         authority.faculties.remove(faculty)
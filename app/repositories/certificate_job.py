@@ -0,0 +1,78 @@
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+from django.core.exceptions import ObjectDoesNotExist
+from django.utils import timezone
+from app.models import CertificateJob
+
+
+class CertificateJobRepository:
+    @staticmethod
+    def create(certificate_job_data: Dict[str, Any]) -> CertificateJob:
+        certificate_job = CertificateJob(**certificate_job_data)
+        certificate_job.full_clean()
+        certificate_job.save()
+        return certificate_job
+
+    @staticmethod
+    def find_by_id(id: int) -> Optional[CertificateJob]:
+        try:
+            return CertificateJob.objects.get(id=id)
+        except ObjectDoesNotExist:
+            return None
+
+    @staticmethod
+    def find_by_status(status: str) -> List[CertificateJob]:
+        return list(CertificateJob.objects.filter(status=status))
+
+    @staticmethod
+    def update(certificate_job: CertificateJob) -> CertificateJob:
+        certificate_job.full_clean()
+        certificate_job.save()
+        return certificate_job
+
+    @staticmethod
+    def claim(id: int) -> bool:
+        """Atomically move a pending job to running; False if already taken."""
+        return (
+            CertificateJob.objects.filter(
+                id=id, status=CertificateJob.STATUS_PENDING
+            ).update(status=CertificateJob.STATUS_RUNNING, updated_at=timezone.now())
+            == 1
+        )
+
+    @staticmethod
+    def requeue_stale(stale_before: datetime) -> List[int]:
+        """Move running jobs not updated since ``stale_before`` back to pending.
+
+        Returns the ids of the requeued jobs.
+        """
+        stale_jobs = CertificateJob.objects.filter(
+            status=CertificateJob.STATUS_RUNNING, updated_at__lt=stale_before
+        )
+        ids = list(stale_jobs.values_list("id", flat=True))
+        stale_jobs.filter(id__in=ids).update(
+            status=CertificateJob.STATUS_PENDING, updated_at=timezone.now()
+        )
+        return ids
+
+    @staticmethod
+    def find_finished_before(before: datetime) -> List[CertificateJob]:
+        return list(
+            CertificateJob.objects.filter(
+                status__in=(CertificateJob.STATUS_DONE, CertificateJob.STATUS_FAILED),
+                updated_at__lt=before,
+            )
+        )
+
+    @staticmethod
+    def delete_by_ids(ids: List[int]) -> int:
+        deleted, _ = CertificateJob.objects.filter(id__in=ids).delete()
+        return deleted
+
+    @staticmethod
+    def exists_by_id(id: int) -> bool:
+        return CertificateJob.objects.filter(id=id).exists()
+
+    @staticmethod
+    def count() -> int:
+        return CertificateJob.objects.count()
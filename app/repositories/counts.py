@@ -0,0 +1,61 @@
+import datetime
+import json
+from typing import Optional, Tuple
+
+from django.db import connections
+from django.db.models import Count, Max, QuerySet
+
+
+def estimate_count(queryset: QuerySet, exact_below: int) -> int:
+    """Row count of ``queryset`` taken from PostgreSQL planner statistics.
+
+    Unfiltered tables use ``pg_class.reltuples`` and filtered querysets the
+    EXPLAIN row estimate. Estimates under ``exact_below`` rows, tables that
+    were never analyzed and other databases fall back to an exact COUNT(*).
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+
+    if queryset.query.has_filters():
+        estimate = _explain_rows(queryset)
+    else:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE oid = %s::regclass",
+                [queryset.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 until the table is first vacuumed or analyzed
+        estimate = row[0] if row else -1
+
+    if estimate < exact_below:
+        return queryset.count()
+    return int(estimate)
+
+
+def _explain_rows(queryset: QuerySet) -> float:
+    """Planner row estimate of ``queryset``, or -1 if the plan is unreadable."""
+    try:
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        # psycopg2 decodes the json column, so Django returns the bare object
+        if isinstance(plan, list):
+            plan = plan[0]
+        return float(plan["Plan"]["Plan Rows"])
+    except (ValueError, TypeError, KeyError, IndexError):
+        return -1
+
+
+def list_version(
+    queryset: QuerySet,
+) -> Tuple[Optional[datetime.datetime], int, Optional[int]]:
+    """Latest ``updated_at``, row count and highest id of ``queryset``.
+
+    Updates move the timestamp, deletions the count and inserts the highest
+    id, so a deletion followed by an insert still changes the version. All
+    three come from one aggregate.
+    """
+    version = queryset.order_by().aggregate(
+        last_modified=Max("updated_at"), count=Count("pk"), last_id=Max("pk")
+    )
+    return version["last_modified"], version["count"], version["last_id"]
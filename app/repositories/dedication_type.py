@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import DedicationType
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class DedicationTypeRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(dedication_type_data: Dict[str, Any]) -> DedicationType:
         dedication_type = DedicationType(**dedication_type_data)
         dedication_type.full_clean()
@@ -12,9 +20,14 @@ class DedicationTypeRepository:
         return dedication_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[DedicationType]:
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[DedicationType]:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return DedicationType.objects.get(id=id)
+            return only_fields(DedicationType.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,15 +44,67 @@ class DedicationTypeRepository:
 
     @staticmethod
     def find_all() -> List[DedicationType]:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None:
+            return table.find_all()
         return list(DedicationType.objects.all())
 
     @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[DedicationType]:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(DedicationType.objects, fields),
+            DedicationTypeRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            DedicationType.objects.all(), DedicationTypeRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            DedicationType.objects.all(), DedicationTypeRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    @IdentityMap.invalidates
     def update(dedication_type: DedicationType) -> DedicationType:
         dedication_type.full_clean()
         dedication_type.save()
         return dedication_type
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         dedication_type = DedicationTypeRepository.find_by_id(id)
         if not dedication_type:
@@ -49,6 +114,9 @@ class DedicationTypeRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None:
+            return table.exists_by_id(id)
         return DedicationType.objects.filter(id=id).exists()
 
     @staticmethod
@@ -56,5 +124,34 @@ class DedicationTypeRepository:
         return DedicationType.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return DedicationType.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(
+            DedicationType.objects, DedicationTypeRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                DedicationType.objects.all(), DedicationTypeRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(DedicationType)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(
+                DedicationType.objects.all(), DedicationTypeRepository.FILTERS, filters
+            )
+        )
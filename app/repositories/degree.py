@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Degree
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class DegreeRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(degree_data: Dict[str, Any]) -> Degree:
         degree = Degree(**degree_data)
         degree.full_clean()
@@ -12,9 +20,12 @@ class DegreeRepository:
         return degree
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Degree]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Degree]:
+        table = ReferenceCache.table(Degree)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return Degree.objects.get(id=id)
+            return only_fields(Degree.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,15 +42,65 @@ class DegreeRepository:
 
     @staticmethod
     def find_all() -> List[Degree]:
+        table = ReferenceCache.table(Degree)
+        if table is not None:
+            return table.find_all()
         return list(Degree.objects.all())
 
     @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Degree]:
+        table = ReferenceCache.table(Degree)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(Degree.objects, fields), DegreeRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(Degree)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            Degree.objects.all(), DegreeRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Degree.objects.all(), DegreeRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    @IdentityMap.invalidates
     def update(degree: Degree) -> Degree:
         degree.full_clean()
         degree.save()
         return degree
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         degree = DegreeRepository.find_by_id(id)
         if not degree:
@@ -49,6 +110,9 @@ class DegreeRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(Degree)
+        if table is not None:
+            return table.exists_by_id(id)
         return Degree.objects.filter(id=id).exists()
 
     @staticmethod
@@ -56,5 +120,28 @@ class DegreeRepository:
         return Degree.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return Degree.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(Degree)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(Degree.objects, DegreeRepository.FILTERS, filters).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Degree.objects.all(), DegreeRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(Degree)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(Degree.objects.all(), DegreeRepository.FILTERS, filters)
+        )
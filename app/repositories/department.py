@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Department
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class DepartmentRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(department_data: Dict[str, Any]) -> Department:
         department = Department(**department_data)
         department.full_clean()
@@ -12,9 +20,14 @@ class DepartmentRepository:
         return department
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Department]:
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Department]:
+        table = ReferenceCache.table(Department)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return Department.objects.get(id=id)
+            return only_fields(Department.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,20 +44,72 @@ class DepartmentRepository:
 
     @staticmethod
     def find_all() -> List[Department]:
+        table = ReferenceCache.table(Department)
+        if table is not None:
+            return table.find_all()
         return list(Department.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Department]:
+        table = ReferenceCache.table(Department)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(Department.objects, fields),
+            DepartmentRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(Department)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            Department.objects.all(), DepartmentRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Department.objects.all(), DepartmentRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_faculty(faculty_id: int) -> List[Department]:
         """Find all departments for a specific faculty."""
         return list(Department.objects.filter(faculty_id=faculty_id).select_related("faculty"))
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(department: Department) -> Department:
         department.full_clean()
         department.save()
         return department
     
     @staticmethod
+    @IdentityMap.invalidates
     def delete(id: int) -> bool:
         """Delete a department by ID."""
         department = DepartmentRepository.find_by_id(id)
@@ -54,6 +119,7 @@ class DepartmentRepository:
         return True
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         department = DepartmentRepository.find_by_id(id)
         if not department:
@@ -63,6 +129,9 @@ class DepartmentRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(Department)
+        if table is not None:
+            return table.exists_by_id(id)
         return Department.objects.filter(id=id).exists()
 
     @staticmethod
@@ -74,5 +143,34 @@ class DepartmentRepository:
         return query.exists()
 
     @staticmethod
-    def count() -> int:
-        return Department.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(Department)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(
+            Department.objects, DepartmentRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                Department.objects.all(), DepartmentRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(Department)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(
+                Department.objects.all(), DepartmentRepository.FILTERS, filters
+            )
+        )
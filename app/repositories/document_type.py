@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Set, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import DocumentType
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class DocumentTypeRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(document_type_data: Dict[str, Any]) -> DocumentType:
         document_type = DocumentType(**document_type_data)
         document_type.full_clean()
@@ -12,16 +20,65 @@ class DocumentTypeRepository:
         return document_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[DocumentType]:
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[DocumentType]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return DocumentType.objects.get(id=id)
+            return only_fields(DocumentType.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
     @staticmethod
     def find_all() -> List[DocumentType]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None:
+            return table.find_all()
         return list(DocumentType.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[DocumentType]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(DocumentType.objects, fields),
+            DocumentTypeRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            DocumentType.objects.all(), DocumentTypeRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("id").values(*fields)[offset : offset + limit])
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            DocumentType.objects.all(), DocumentTypeRepository.FILTERS, filters
+        )
+        return queryset.order_by("id").values(*fields).iterator(chunk_size=chunk_size)
+
     @staticmethod
     def find_by_name(name: str) -> Optional[DocumentType]:
         """Find a document type by its name."""
@@ -45,12 +102,14 @@ class DocumentTypeRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(document_type: DocumentType) -> DocumentType:
         document_type.full_clean()
         document_type.save()
         return document_type
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         document_type = DocumentTypeRepository.find_by_id(id)
         if not document_type:
@@ -60,12 +119,51 @@ class DocumentTypeRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None:
+            return table.exists_by_id(id)
         return DocumentType.objects.filter(id=id).exists()
 
+    @staticmethod
+    def find_existing_ids(ids: Sequence[int]) -> Set[int]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None:
+            return {id for id in ids if table.exists_by_id(id)}
+        return set(DocumentType.objects.filter(id__in=ids).values_list("id", flat=True))
+
     @staticmethod
     def exists_by_dni(dni: int) -> bool:
         return DocumentType.objects.filter(dni=dni).exists()
 
     @staticmethod
-    def count() -> int:
-        return DocumentType.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(
+            DocumentType.objects, DocumentTypeRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                DocumentType.objects.all(), DocumentTypeRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(DocumentType)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(
+                DocumentType.objects.all(), DocumentTypeRepository.FILTERS, filters
+            )
+        )
@@ -1,11 +1,22 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Faculty
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 from app.models import Authority
 
 
 class FacultyRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "university": "university_id",
+        "city": "city__iexact",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(faculty_data: Dict[str, Any]) -> Faculty:
         faculty = Faculty(**faculty_data)
         faculty.full_clean()
@@ -13,9 +24,14 @@ class FacultyRepository:
         return faculty
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Faculty]:
+    @IdentityMap.memoize_find_by_id(Faculty)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Faculty]:
         try:
-            return Faculty.objects.select_related("university").get(id=id)
+            return only_fields(
+                Faculty.objects.select_related("university"), fields
+            ).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -30,6 +46,47 @@ class FacultyRepository:
     def find_all() -> List[Faculty]:
         return list(Faculty.objects.select_related("university").all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Faculty]:
+        queryset = apply_filters(
+            only_fields(Faculty.objects.select_related("university"), fields),
+            FacultyRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Faculty.objects.all(), FacultyRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Faculty.objects.all(), FacultyRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_university(university_id: int) -> List[Faculty]:
         return list(
@@ -45,12 +102,14 @@ class FacultyRepository:
         )
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(faculty: Faculty) -> Faculty:
         faculty.full_clean()
         faculty.save()
         return faculty
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         faculty = FacultyRepository.find_by_id(id)
         if not faculty:
@@ -59,6 +118,7 @@ class FacultyRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Faculty)
     def exists_by_id(id: int) -> bool:
         return Faculty.objects.filter(id=id).exists()
 
@@ -67,8 +127,27 @@ class FacultyRepository:
         return Faculty.objects.filter(acronym=acronym).exists()
 
     @staticmethod
-    def count() -> int:
-        return Faculty.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Faculty.objects, FacultyRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Faculty.objects.all(), FacultyRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Faculty.objects.all(), FacultyRepository.FILTERS, filters)
+        )
 
     @staticmethod
     def find_with_full_relations(id: int) -> Optional[Faculty]:
@@ -91,9 +170,11 @@ class FacultyRepository:
         return faculty.authorities.filter(id=authority.id).exists()
 
     @staticmethod
+    @IdentityMap.invalidates
     def associate_authority(faculty: Faculty, authority: Authority) -> None:
         authority.faculties.add(faculty)
 
     @staticmethod
+    @IdentityMap.invalidates
     def disassociate_authority(faculty: Faculty, authority: Authority) -> None:
         authority.faculties.remove(faculty)
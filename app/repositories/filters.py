@@ -0,0 +1,42 @@
+from typing import Any, Dict, Optional, Sequence
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+
+
+def apply_filters(
+    queryset: QuerySet, lookups: Dict[str, str], filters: Optional[Dict[str, Any]]
+) -> QuerySet:
+    """Filter a queryset by public filter names.
+
+    ``lookups`` maps each supported filter name to the ORM lookup its
+    repository finder uses, e.g. ``{"specialty": "specialty_id"}``. Only
+    indexed columns are exposed, so any other name is rejected.
+    """
+    if not filters:
+        return queryset
+
+    unsupported = sorted(set(filters) - set(lookups))
+    if unsupported:
+        raise ValueError(f"Unsupported filter: {', '.join(unsupported)}")
+
+    try:
+        return queryset.filter(
+            **{lookups[name]: value for name, value in filters.items()}
+        )
+    except (TypeError, ValueError, ValidationError):
+        raise ValueError(
+            "Invalid filter value: "
+            + ", ".join(f"{name}={value}" for name, value in sorted(filters.items()))
+        )
+
+
+def only_fields(queryset: QuerySet, fields: Optional[Sequence[str]]) -> QuerySet:
+    """Load only ``fields`` from the database, or every column for None.
+
+    Relations are not joined for a sparse fieldset: serializers only read
+    the ``*_id`` columns of foreign keys.
+    """
+    if fields is None:
+        return queryset
+    return queryset.select_related(None).only(*fields)
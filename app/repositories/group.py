@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Group
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class GroupRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(group_data: Dict[str, Any]) -> Group:
         group = Group(**group_data)
         group.full_clean()
@@ -12,9 +20,12 @@ class GroupRepository:
         return group
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Group]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Group]:
+        table = ReferenceCache.table(Group)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return Group.objects.get(id=id)
+            return only_fields(Group.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,8 +42,52 @@ class GroupRepository:
 
     @staticmethod
     def find_all() -> List[Group]:
+        table = ReferenceCache.table(Group)
+        if table is not None:
+            return table.find_all()
         return list(Group.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Group]:
+        table = ReferenceCache.table(Group)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(Group.objects, fields), GroupRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(Group)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(Group.objects.all(), GroupRepository.FILTERS, filters)
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(Group.objects.all(), GroupRepository.FILTERS, filters)
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_subject(subject_id: int) -> List[Group]:
         """Find all groups for a specific subject."""
@@ -47,12 +102,14 @@ class GroupRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(group: Group) -> Group:
         group.full_clean()
         group.save()
         return group
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete(id: int) -> bool:
         """Delete a group by ID."""
         group = GroupRepository.find_by_id(id)
@@ -62,6 +119,7 @@ class GroupRepository:
         return True
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         group = GroupRepository.find_by_id(id)
         if not group:
@@ -71,6 +129,9 @@ class GroupRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(Group)
+        if table is not None:
+            return table.exists_by_id(id)
         return Group.objects.filter(id=id).exists()
 
     @staticmethod
@@ -83,5 +144,28 @@ class GroupRepository:
         return Group.objects.filter(code=code).exists()
 
     @staticmethod
-    def count() -> int:
-        return Group.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(Group)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(Group.objects, GroupRepository.FILTERS, filters).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Group.objects.all(), GroupRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(Group)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(Group.objects.all(), GroupRepository.FILTERS, filters)
+        )
@@ -0,0 +1,114 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Type
+
+from django.db.models import Model
+
+# Stands for a row known to exist whose instance was never loaded
+_EXISTS = object()
+
+_current: ContextVar[Optional[Dict[Tuple[Type[Model], Any], Any]]] = ContextVar(
+    "identity_map", default=None
+)
+
+
+class IdentityMap:
+    """Rows loaded by id during one request or transaction.
+
+    Repositories record what ``find_by_id`` and ``exists_by_id`` found, so
+    a second lookup of the same row in the same scope is answered from
+    memory and returns the same instance. Any write through a repository
+    empties the map, since cascades and relation changes may touch rows of
+    other models. Outside a scope every lookup reads the database.
+    """
+
+    @staticmethod
+    @contextmanager
+    def scope() -> Iterator[None]:
+        """Open a map, or join the one already open in this context."""
+        if _current.get() is not None:
+            yield
+            return
+
+        token = _current.set({})
+        try:
+            yield
+        finally:
+            _current.reset(token)
+
+    @staticmethod
+    def clear() -> None:
+        entries = _current.get()
+        if entries is not None:
+            entries.clear()
+
+    @staticmethod
+    def _key(model: Type[Model], id: Any) -> Optional[Tuple[Type[Model], Any]]:
+        try:
+            return model, model._meta.pk.to_python(id)
+        except Exception:
+            # Let the repository query report invalid ids as before
+            return None
+
+    @staticmethod
+    def memoize_find_by_id(model: Type[Model]) -> Callable:
+        """Decorate a ``find_by_id(id, fields=None)`` finder of ``model``."""
+
+        def decorator(find_by_id: Callable) -> Callable:
+            @wraps(find_by_id)
+            def wrapper(id: Any, fields: Optional[Sequence[str]] = None):
+                entries = _current.get()
+                key = IdentityMap._key(model, id) if entries is not None else None
+                if key is None:
+                    return find_by_id(id, fields)
+
+                instance = entries.get(key, _EXISTS)
+                if instance is not _EXISTS:
+                    # A full instance also serves sparse fieldsets
+                    return instance
+
+                instance = find_by_id(id, fields)
+                if fields is None or instance is None:
+                    entries[key] = instance
+                return instance
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def memoize_exists_by_id(model: Type[Model]) -> Callable:
+        """Decorate an ``exists_by_id(id)`` check of ``model``."""
+
+        def decorator(exists_by_id: Callable) -> Callable:
+            @wraps(exists_by_id)
+            def wrapper(id: Any) -> bool:
+                entries = _current.get()
+                key = IdentityMap._key(model, id) if entries is not None else None
+                if key is None:
+                    return exists_by_id(id)
+
+                if key in entries:
+                    return entries[key] is not None
+
+                exists = exists_by_id(id)
+                entries[key] = _EXISTS if exists else None
+                return exists
+
+            return wrapper
+
+        return decorator
+
+    @staticmethod
+    def invalidates(write: Callable) -> Callable:
+        """Decorate a repository write so it empties the map, even on failure."""
+
+        @wraps(write)
+        def wrapper(*args, **kwargs):
+            try:
+                return write(*args, **kwargs)
+            finally:
+                IdentityMap.clear()
+
+        return wrapper
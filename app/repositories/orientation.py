@@ -1,10 +1,22 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Orientation
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class OrientationRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "specialty": "specialty_id",
+        "plan": "plan_id",
+        "subject": "subject_id",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(orientation_data: Dict[str, Any]) -> Orientation:
         orientation = Orientation(**orientation_data)
         orientation.full_clean()
@@ -12,10 +24,14 @@ class OrientationRepository:
         return orientation
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Orientation]:
+    @IdentityMap.memoize_find_by_id(Orientation)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Orientation]:
         try:
-            return Orientation.objects.select_related(
-                "specialty", "plan", "subject"
+            return only_fields(
+                Orientation.objects.select_related("specialty", "plan", "subject"),
+                fields,
             ).get(id=id)
         except ObjectDoesNotExist:
             return None
@@ -26,6 +42,50 @@ class OrientationRepository:
             Orientation.objects.select_related("specialty", "plan", "subject").all()
         )
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Orientation]:
+        queryset = apply_filters(
+            only_fields(
+                Orientation.objects.select_related("specialty", "plan", "subject"),
+                fields,
+            ),
+            OrientationRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Orientation.objects.all(), OrientationRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Orientation.objects.all(), OrientationRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_specialty(specialty_id: int) -> List[Orientation]:
         return list(
@@ -62,12 +122,14 @@ class OrientationRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(orientation: Orientation) -> Orientation:
         orientation.full_clean()
         orientation.save()
         return orientation
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         orientation = OrientationRepository.find_by_id(id)
         if not orientation:
@@ -76,6 +138,7 @@ class OrientationRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Orientation)
     def exists_by_id(id: int) -> bool:
         return Orientation.objects.filter(id=id).exists()
 
@@ -88,8 +151,31 @@ class OrientationRepository:
         ).exists()
 
     @staticmethod
-    def count() -> int:
-        return Orientation.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Orientation.objects, OrientationRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                Orientation.objects.all(), OrientationRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(
+                Orientation.objects.all(), OrientationRepository.FILTERS, filters
+            )
+        )
 
     @staticmethod
     def find_with_full_relations(id: int) -> Optional[Orientation]:
@@ -1,11 +1,22 @@
-from typing import Optional, List, Dict, Any
-from datetime import date
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import date, datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Plan
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class PlanRepository:
+    # List and export filters; like find_by_date_range, they select the plans
+    # overlapping [start_date, end_date]
+    FILTERS = {
+        "start_date": "end_date__gte",
+        "end_date": "start_date__lte",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(plan_data: Dict[str, Any]) -> Plan:
         plan = Plan(**plan_data)
         plan.full_clean()
@@ -13,9 +24,10 @@ class PlanRepository:
         return plan
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Plan]:
+    @IdentityMap.memoize_find_by_id(Plan)
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Plan]:
         try:
-            return Plan.objects.get(id=id)
+            return only_fields(Plan.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -30,6 +42,41 @@ class PlanRepository:
     def find_all() -> List[Plan]:
         return list(Plan.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Plan]:
+        queryset = apply_filters(
+            only_fields(Plan.objects, fields), PlanRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("-start_date", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Plan.objects.all(), PlanRepository.FILTERS, filters
+        ).order_by("-start_date", "id")
+        return list(queryset.values(*fields)[offset : offset + limit])
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(Plan.objects.all(), PlanRepository.FILTERS, filters)
+        return (
+            queryset.order_by("-start_date", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_specialty(specialty_id: int) -> List[Plan]:
         """Find all plans for a specific specialty."""
@@ -58,12 +105,14 @@ class PlanRepository:
         return list(Plan.objects.filter(end_date__lt=target_date))
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(plan: Plan) -> Plan:
         plan.full_clean()
         plan.save()
         return plan
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         plan = PlanRepository.find_by_id(id)
         if not plan:
@@ -72,6 +121,7 @@ class PlanRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Plan)
     def exists_by_id(id: int) -> bool:
         return Plan.objects.filter(id=id).exists()
 
@@ -85,5 +135,20 @@ class PlanRepository:
         return Plan.objects.filter(code=code).exists()
 
     @staticmethod
-    def count() -> int:
-        return Plan.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(Plan.objects, PlanRepository.FILTERS, filters).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Plan.objects.all(), PlanRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(apply_filters(Plan.objects.all(), PlanRepository.FILTERS, filters))
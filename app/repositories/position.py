@@ -1,10 +1,23 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Position
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class PositionRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "category": "position_category_id",
+        "dedication_type": "dedication_type_id",
+        "min_points": "points__gte",
+        "max_points": "points__lte",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(position_data: Dict[str, Any]) -> Position:
         position = Position(**position_data)
         position.full_clean()
@@ -12,10 +25,14 @@ class PositionRepository:
         return position
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Position]:
+    @IdentityMap.memoize_find_by_id(Position)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Position]:
         try:
-            return Position.objects.select_related(
-                "position_category", "dedication_type"
+            return only_fields(
+                Position.objects.select_related("position_category", "dedication_type"),
+                fields,
             ).get(id=id)
         except ObjectDoesNotExist:
             return None
@@ -28,6 +45,50 @@ class PositionRepository:
             ).all()
         )
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Position]:
+        queryset = apply_filters(
+            only_fields(
+                Position.objects.select_related("position_category", "dedication_type"),
+                fields,
+            ),
+            PositionRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Position.objects.all(), PositionRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Position.objects.all(), PositionRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_category(position_category_id: int) -> List[Position]:
         return list(
@@ -72,12 +133,14 @@ class PositionRepository:
         )
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(position: Position) -> Position:
         position.full_clean()
         position.save()
         return position
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         position = PositionRepository.find_by_id(id)
         if not position:
@@ -86,12 +149,32 @@ class PositionRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Position)
     def exists_by_id(id: int) -> bool:
         return Position.objects.filter(id=id).exists()
 
     @staticmethod
-    def count() -> int:
-        return Position.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Position.objects, PositionRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Position.objects.all(), PositionRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Position.objects.all(), PositionRepository.FILTERS, filters)
+        )
 
     @staticmethod
     def find_with_relations(id: int) -> Optional[Position]:
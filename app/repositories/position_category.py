@@ -1,10 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import PositionCategory
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class PositionCategoryRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(position_category_data: Dict[str, Any]) -> PositionCategory:
         position_category = PositionCategory(**position_category_data)
         position_category.full_clean()
@@ -12,9 +20,14 @@ class PositionCategoryRepository:
         return position_category
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[PositionCategory]:
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[PositionCategory]:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return PositionCategory.objects.get(id=id)
+            return only_fields(PositionCategory.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -31,15 +44,67 @@ class PositionCategoryRepository:
 
     @staticmethod
     def find_all() -> List[PositionCategory]:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None:
+            return table.find_all()
         return list(PositionCategory.objects.all())
 
     @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[PositionCategory]:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(PositionCategory.objects, fields),
+            PositionCategoryRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            PositionCategory.objects.all(), PositionCategoryRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            PositionCategory.objects.all(), PositionCategoryRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    @IdentityMap.invalidates
     def update(position_category: PositionCategory) -> PositionCategory:
         position_category.full_clean()
         position_category.save()
         return position_category
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         position_category = PositionCategoryRepository.find_by_id(id)
         if not position_category:
@@ -49,6 +114,9 @@ class PositionCategoryRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None:
+            return table.exists_by_id(id)
         return PositionCategory.objects.filter(id=id).exists()
 
     @staticmethod
@@ -56,5 +124,38 @@ class PositionCategoryRepository:
         return PositionCategory.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return PositionCategory.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(
+            PositionCategory.objects, PositionCategoryRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                PositionCategory.objects.all(),
+                PositionCategoryRepository.FILTERS,
+                filters,
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(PositionCategory)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(
+                PositionCategory.objects.all(),
+                PositionCategoryRepository.FILTERS,
+                filters,
+            )
+        )
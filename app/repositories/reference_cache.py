@@ -0,0 +1,231 @@
+import datetime
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, connections, transaction
+from django.db.models import Model
+from django.db.models.signals import post_delete, post_save
+
+from app.models import (
+    Area,
+    DedicationType,
+    Degree,
+    Department,
+    DocumentType,
+    Group,
+    PositionCategory,
+    SpecialtyType,
+)
+
+logger = logging.getLogger(__name__)
+
+# Small, rarely changing tables served from memory once the cache is preloaded
+REFERENCE_MODELS: Tuple[Type[Model], ...] = (
+    Area,
+    DedicationType,
+    Degree,
+    Department,
+    DocumentType,
+    Group,
+    PositionCategory,
+    SpecialtyType,
+)
+
+
+class ReferenceTable:
+    """Immutable snapshot of a reference table.
+
+    Rows are kept as value tuples in the model ordering, ties broken by id,
+    which is also the page order of the reference repositories. Every read
+    builds fresh instances, so callers may modify what they get without
+    touching the snapshot.
+    """
+
+    def __init__(
+        self,
+        model: Type[Model],
+        db: str,
+        fields: Sequence[str],
+        rows: Sequence[Tuple[Any, ...]],
+    ):
+        self.model = model
+        self.db = db
+        self.fields = tuple(fields)
+        self.rows = tuple(rows)
+
+        pk = model._meta.pk
+        pk_index = self.fields.index(pk.attname)
+        self._pk = pk
+        self._by_id = {row[pk_index]: row for row in self.rows}
+        self._columns = {field: index for index, field in enumerate(self.fields)}
+
+    def _build(self, row: Tuple[Any, ...]) -> Model:
+        return self.model.from_db(self.db, self.fields, row)
+
+    def _row(self, id: Any) -> Optional[Tuple[Any, ...]]:
+        try:
+            return self._by_id.get(self._pk.to_python(id))
+        except (TypeError, ValidationError):
+            return None
+
+    def find_by_id(self, id: Any) -> Optional[Model]:
+        row = self._row(id)
+        return self._build(row) if row is not None else None
+
+    def find_all(self) -> List[Model]:
+        return [self._build(row) for row in self.rows]
+
+    def find_page(self, offset: int, limit: int) -> List[Model]:
+        return [self._build(row) for row in self.rows[offset : offset + limit]]
+
+    def find_page_values(
+        self, offset: int, limit: int, fields: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        columns = [
+            (field, self._columns[self.model._meta.get_field(field).attname])
+            for field in fields
+        ]
+        return [
+            {field: row[index] for field, index in columns}
+            for row in self.rows[offset : offset + limit]
+        ]
+
+    def exists_by_id(self, id: Any) -> bool:
+        return self._row(id) is not None
+
+    def count(self) -> int:
+        return len(self.rows)
+
+    def find_list_version(
+        self,
+    ) -> Tuple[Optional[datetime.datetime], int, Optional[int]]:
+        updated_at = self._columns["updated_at"]
+        last_modified = max((row[updated_at] for row in self.rows), default=None)
+        return last_modified, len(self.rows), max(self._by_id, default=None)
+
+
+class ReferenceCache:
+    """Read-through cache of the reference tables.
+
+    Snapshots live in process memory for ``REFERENCE_CACHE_TIMEOUT`` seconds
+    and, when ``REFERENCE_CACHE_ALIAS`` names a Django cache, are shared
+    between processes through it. Saves and deletes drop both copies. The
+    cache only serves a table after ``preload`` activated it, so management
+    commands and tests keep reading the database.
+    """
+
+    _lock = threading.Lock()
+    _active: set = set()
+    _tables: Dict[str, Tuple[float, ReferenceTable]] = {}
+    _generations: Dict[str, int] = {}
+
+    @staticmethod
+    def get_timeout() -> int:
+        return getattr(settings, "REFERENCE_CACHE_TIMEOUT", 300)
+
+    @staticmethod
+    def get_shared_cache():
+        alias = getattr(settings, "REFERENCE_CACHE_ALIAS", "")
+        return caches[alias] if alias else None
+
+    @staticmethod
+    def get_key(model: Type[Model]) -> str:
+        return f"reference:{model._meta.label_lower}"
+
+    @staticmethod
+    def table(model: Type[Model]) -> Optional[ReferenceTable]:
+        """Snapshot of ``model``, or None when its reads go to the database."""
+        if model not in ReferenceCache._active:
+            return None
+
+        key = ReferenceCache.get_key(model)
+        entry = ReferenceCache._tables.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        generation = ReferenceCache._generations.get(key, 0)
+        shared = ReferenceCache.get_shared_cache()
+        snapshot = shared.get(key) if shared is not None else None
+        loaded = snapshot is None
+        if loaded:
+            snapshot = ReferenceCache._load(model)
+
+        table = ReferenceTable(model, *snapshot)
+        # A snapshot read inside a transaction may include uncommitted rows
+        if not connections[table.db].in_atomic_block:
+            with ReferenceCache._lock:
+                # Skip the store if a write invalidated the table meanwhile
+                if ReferenceCache._generations.get(key, 0) == generation:
+                    expires = time.monotonic() + ReferenceCache.get_timeout()
+                    ReferenceCache._tables[key] = (expires, table)
+                    if loaded and shared is not None:
+                        shared.set(key, snapshot, ReferenceCache.get_timeout())
+        return table
+
+    @staticmethod
+    def _load(model: Type[Model]) -> Tuple[str, Tuple[str, ...], List[Tuple]]:
+        manager = model._default_manager
+        fields = tuple(field.attname for field in model._meta.concrete_fields)
+        ordering = (*model._meta.ordering, model._meta.pk.attname)
+        rows = manager.order_by(*ordering).values_list(*fields)
+        return manager.db, fields, list(rows)
+
+    @staticmethod
+    def invalidate(model: Type[Model]) -> None:
+        key = ReferenceCache.get_key(model)
+        with ReferenceCache._lock:
+            ReferenceCache._generations[key] = (
+                ReferenceCache._generations.get(key, 0) + 1
+            )
+            ReferenceCache._tables.pop(key, None)
+
+        shared = ReferenceCache.get_shared_cache()
+        if shared is not None:
+            shared.delete(key)
+
+    @staticmethod
+    def preload(models: Sequence[Type[Model]] = REFERENCE_MODELS) -> None:
+        """Activate the cache for ``models`` and load their snapshots."""
+        if ReferenceCache.get_timeout() <= 0:
+            return
+
+        for model in models:
+            ReferenceCache._active.add(model)
+            try:
+                ReferenceCache.table(model)
+            except DatabaseError as e:
+                # Tables are loaded on first read instead
+                logger.warning(
+                    f"Failed to preload {model._meta.label} reference cache: {str(e)}"
+                )
+
+        # Forked server workers must not share the preload connection
+        connections.close_all()
+
+    @staticmethod
+    def deactivate() -> None:
+        with ReferenceCache._lock:
+            ReferenceCache._active.clear()
+            ReferenceCache._tables.clear()
+
+    @staticmethod
+    def connect_signals(models: Sequence[Type[Model]] = REFERENCE_MODELS) -> None:
+        for model in models:
+            post_save.connect(
+                _invalidate_on_write, sender=model, dispatch_uid=f"reference:{model}"
+            )
+            post_delete.connect(
+                _invalidate_on_write, sender=model, dispatch_uid=f"reference:{model}"
+            )
+
+
+def _invalidate_on_write(sender: Type[Model], using: str, **kwargs) -> None:
+    ReferenceCache.invalidate(sender)
+    if connections[using].in_atomic_block:
+        # Drop snapshots other processes loaded before the commit, too
+        transaction.on_commit(lambda: ReferenceCache.invalidate(sender), using=using)
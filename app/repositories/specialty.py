@@ -1,10 +1,22 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Set, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Specialty
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class SpecialtyRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "faculty": "faculty_id",
+        "letter": "letter",
+        "type": "specialty_type_id",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(specialty_data: Dict[str, Any]) -> Specialty:
         specialty = Specialty(**specialty_data)
         specialty.full_clean()
@@ -12,11 +24,14 @@ class SpecialtyRepository:
         return specialty
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Specialty]:
+    @IdentityMap.memoize_find_by_id(Specialty)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Specialty]:
         try:
-            return Specialty.objects.select_related("specialty_type", "faculty").get(
-                id=id
-            )
+            return only_fields(
+                Specialty.objects.select_related("specialty_type", "faculty"), fields
+            ).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -24,6 +39,49 @@ class SpecialtyRepository:
     def find_all() -> List[Specialty]:
         return list(Specialty.objects.select_related("specialty_type", "faculty").all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Specialty]:
+        queryset = apply_filters(
+            only_fields(
+                Specialty.objects.select_related("specialty_type", "faculty"), fields
+            ),
+            SpecialtyRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Specialty.objects.all(), SpecialtyRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Specialty.objects.all(), SpecialtyRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_faculty(faculty_id: int) -> List[Specialty]:
         return list(
@@ -58,12 +116,14 @@ class SpecialtyRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(specialty: Specialty) -> Specialty:
         specialty.full_clean()
         specialty.save()
         return specialty
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         specialty = SpecialtyRepository.find_by_id(id)
         if not specialty:
@@ -72,16 +132,42 @@ class SpecialtyRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Specialty)
     def exists_by_id(id: int) -> bool:
         return Specialty.objects.filter(id=id).exists()
 
+    @staticmethod
+    def find_existing_ids(ids: Sequence[int]) -> Set[int]:
+        return set(Specialty.objects.filter(id__in=ids).values_list("id", flat=True))
+
     @staticmethod
     def exists_by_letter_and_faculty(letter: str, faculty_id: int) -> bool:
         return Specialty.objects.filter(letter=letter, faculty_id=faculty_id).exists()
 
     @staticmethod
-    def count() -> int:
-        return Specialty.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Specialty.objects, SpecialtyRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                Specialty.objects.all(), SpecialtyRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Specialty.objects.all(), SpecialtyRepository.FILTERS, filters)
+        )
 
     @staticmethod
     def find_with_full_relations(id: int) -> Optional[Specialty]:
@@ -1,10 +1,19 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import SpecialtyType
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
+from app.repositories.reference_cache import ReferenceCache
 
 
 class SpecialtyTypeRepository:
+    # find_by_level is a substring search no index can serve, so it is not exposed
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(specialty_type_data: Dict[str, Any]) -> SpecialtyType:
         specialty_type = SpecialtyType(**specialty_type_data)
         specialty_type.full_clean()
@@ -12,9 +21,14 @@ class SpecialtyTypeRepository:
         return specialty_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[SpecialtyType]:
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[SpecialtyType]:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None:
+            return table.find_by_id(id)
         try:
-            return SpecialtyType.objects.get(id=id)
+            return only_fields(SpecialtyType.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -35,15 +49,67 @@ class SpecialtyTypeRepository:
 
     @staticmethod
     def find_all() -> List[SpecialtyType]:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None:
+            return table.find_all()
         return list(SpecialtyType.objects.all())
 
     @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[SpecialtyType]:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None and not filters:
+            return table.find_page(offset, limit)
+        queryset = apply_filters(
+            only_fields(SpecialtyType.objects, fields),
+            SpecialtyTypeRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None and not filters:
+            return table.find_page_values(offset, limit, fields)
+        queryset = apply_filters(
+            SpecialtyType.objects.all(), SpecialtyTypeRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            SpecialtyType.objects.all(), SpecialtyTypeRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    @IdentityMap.invalidates
     def update(specialty_type: SpecialtyType) -> SpecialtyType:
         specialty_type.full_clean()
         specialty_type.save()
         return specialty_type
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         specialty_type = SpecialtyTypeRepository.find_by_id(id)
         if not specialty_type:
@@ -53,6 +119,9 @@ class SpecialtyTypeRepository:
 
     @staticmethod
     def exists_by_id(id: int) -> bool:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None:
+            return table.exists_by_id(id)
         return SpecialtyType.objects.filter(id=id).exists()
 
     @staticmethod
@@ -60,5 +129,34 @@ class SpecialtyTypeRepository:
         return SpecialtyType.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return SpecialtyType.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None and not filters:
+            return table.count()
+        return apply_filters(
+            SpecialtyType.objects, SpecialtyTypeRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                SpecialtyType.objects.all(), SpecialtyTypeRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        table = ReferenceCache.table(SpecialtyType)
+        if table is not None and not filters:
+            return table.find_list_version()
+        return list_version(
+            apply_filters(
+                SpecialtyType.objects.all(), SpecialtyTypeRepository.FILTERS, filters
+            )
+        )
@@ -1,10 +1,22 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple, Iterator, Sequence
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist, MultipleObjectsReturned
+from django.db.models import Count, Q, QuerySet
 from app.models import Student
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class StudentRepository:
+    # List and export filters, mirroring the lookups of the find_by_* finders
+    FILTERS = {
+        "specialty": "specialty_id",
+        "gender": "gender",
+    }
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(student_data: Dict[str, Any]) -> Student:
         student = Student(**student_data)
         student.full_clean()
@@ -12,11 +24,28 @@ class StudentRepository:
         return student
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Student]:
+    @IdentityMap.invalidates
+    def bulk_create(
+        students_data: Sequence[Dict[str, Any]], batch_size: int
+    ) -> List[Student]:
+        """Insert validated rows with one INSERT per ``batch_size`` rows.
+
+        Skips ``full_clean`` and the model signals, callers validate first.
+        """
+        return Student.objects.bulk_create(
+            [Student(**student_data) for student_data in students_data],
+            batch_size=batch_size,
+        )
+
+    @staticmethod
+    @IdentityMap.memoize_find_by_id(Student)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Student]:
         try:
-            return Student.objects.select_related("document_type", "specialty").get(
-                id=id
-            )
+            return only_fields(
+                Student.objects.select_related("document_type", "specialty"), fields
+            ).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -41,6 +70,120 @@ class StudentRepository:
     def find_all() -> List[Student]:
         return list(Student.objects.select_related("document_type", "specialty").all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Student]:
+        queryset = apply_filters(
+            only_fields(
+                Student.objects.select_related("document_type", "specialty"), fields
+            ),
+            StudentRepository.FILTERS,
+            filters,
+        )
+        return list(
+            queryset.order_by("last_name", "first_name", "id")[offset : offset + limit]
+        )
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Student.objects.all(), StudentRepository.FILTERS, filters
+        ).order_by("last_name", "first_name", "id")
+        return list(queryset.values(*fields)[offset : offset + limit])
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Student.objects.all(), StudentRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("last_name", "first_name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
+    @staticmethod
+    def find_page_after(
+        position: Optional[Tuple[str, str, int]],
+        limit: int,
+        reverse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Student]:
+        """Keyset page ordered by (last_name, first_name, id).
+
+        Rows strictly after ``position`` (before it when ``reverse``), so the
+        (last_name, first_name) index is walked from the cursor instead of
+        skipping an OFFSET.
+        """
+        if fields is not None:
+            # Cursors are built from the keyset columns of the boundary rows
+            fields = [*fields, "last_name", "first_name"]
+
+        queryset = apply_filters(
+            only_fields(
+                Student.objects.select_related("document_type", "specialty"), fields
+            ),
+            StudentRepository.FILTERS,
+            filters,
+        )
+        return list(
+            StudentRepository._after_position(queryset, position, reverse)[:limit]
+        )
+
+    @staticmethod
+    def find_page_after_values(
+        position: Optional[Tuple[str, str, int]],
+        limit: int,
+        reverse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Keyset page of ``values()`` rows, see ``find_page_after``."""
+        if fields is not None:
+            # Cursors are built from the keyset columns of the boundary rows
+            fields = list(dict.fromkeys([*fields, "last_name", "first_name", "id"]))
+
+        queryset = apply_filters(
+            Student.objects.all(), StudentRepository.FILTERS, filters
+        )
+        queryset = StudentRepository._after_position(queryset, position, reverse)
+        return list(queryset.values(*(fields or ()))[:limit])
+
+    @staticmethod
+    def _after_position(
+        queryset: QuerySet, position: Optional[Tuple[str, str, int]], reverse: bool
+    ) -> QuerySet:
+        """Rows past ``position`` in keyset order, backwards when ``reverse``."""
+        op = "lt" if reverse else "gt"
+
+        if position is not None:
+            last_name, first_name, id = position
+            queryset = queryset.filter(
+                Q(**{f"last_name__{op}": last_name})
+                | Q(last_name=last_name, **{f"first_name__{op}": first_name})
+                | Q(last_name=last_name, first_name=first_name, **{f"id__{op}": id}),
+                # Redundant bound on the leading column keeps this an index range scan
+                **{f"last_name__{op}e": last_name},
+            )
+
+        if reverse:
+            queryset = queryset.order_by("-last_name", "-first_name", "-id")
+        else:
+            queryset = queryset.order_by("last_name", "first_name", "id")
+        return queryset
+
     @staticmethod
     def find_by_specialty(specialty_id: int) -> List[Student]:
         return list(
@@ -69,12 +212,14 @@ class StudentRepository:
         )
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(student: Student) -> Student:
         student.full_clean()
         student.save()
         return student
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         student = StudentRepository.find_by_id(id)
         if not student:
@@ -83,6 +228,7 @@ class StudentRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Student)
     def exists_by_id(id: int) -> bool:
         return Student.objects.filter(id=id).exists()
 
@@ -95,8 +241,53 @@ class StudentRepository:
         return Student.objects.filter(document_number=document_number).exists()
 
     @staticmethod
-    def count() -> int:
-        return Student.objects.count()
+    def find_existing_student_numbers(student_numbers: Sequence[int]) -> Set[int]:
+        return set(
+            Student.objects.filter(student_number__in=student_numbers).values_list(
+                "student_number", flat=True
+            )
+        )
+
+    @staticmethod
+    def find_existing_document_numbers(document_numbers: Sequence[str]) -> Set[str]:
+        return set(
+            Student.objects.filter(document_number__in=document_numbers).values_list(
+                "document_number", flat=True
+            )
+        )
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Student.objects, StudentRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Student.objects.all(), StudentRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Student.objects.all(), StudentRepository.FILTERS, filters)
+        )
+
+    @staticmethod
+    def count_by_specialty(university_id: int) -> Dict[int, int]:
+        rows = (
+            Student.objects.filter(specialty__faculty__university_id=university_id)
+            .values("specialty_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        return {row["specialty_id"]: row["count"] for row in rows}
 
     @staticmethod
     def find_with_full_relations(id: int) -> Optional[Student]:
@@ -110,3 +301,45 @@ class StudentRepository:
             ).get(id=id)
         except ObjectDoesNotExist:
             return None
+
+    @staticmethod
+    def find_by_specialty_with_full_relations(
+        specialty_id: int, limit: Optional[int] = None
+    ) -> List[Student]:
+        queryset = Student.objects.filter(specialty_id=specialty_id).select_related(
+            "document_type",
+            "specialty",
+            "specialty__faculty",
+            "specialty__faculty__university",
+            "specialty__specialty_type",
+        )
+        return list(queryset[:limit] if limit is not None else queryset)
+
+    @staticmethod
+    def find_by_faculty_with_full_relations(
+        faculty_id: int, limit: Optional[int] = None
+    ) -> List[Student]:
+        queryset = Student.objects.filter(
+            specialty__faculty_id=faculty_id
+        ).select_related(
+            "document_type",
+            "specialty",
+            "specialty__faculty",
+            "specialty__faculty__university",
+            "specialty__specialty_type",
+        )
+        return list(queryset[:limit] if limit is not None else queryset)
+
+    @staticmethod
+    def find_certificate_versions(id: int) -> Optional[Tuple]:
+        return (
+            Student.objects.filter(id=id)
+            .values_list(
+                "updated_at",
+                "document_type__updated_at",
+                "specialty__updated_at",
+                "specialty__faculty__updated_at",
+                "specialty__faculty__university__updated_at",
+            )
+            .first()
+        )
@@ -1,11 +1,18 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
 from app.models import Subject
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 from app.models import Authority
 
 
 class SubjectRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(subject_data: Dict[str, Any]) -> Subject:
         subject = Subject(**subject_data)
         subject.full_clean()
@@ -13,9 +20,12 @@ class SubjectRepository:
         return subject
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Subject]:
+    @IdentityMap.memoize_find_by_id(Subject)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[Subject]:
         try:
-            return Subject.objects.get(id=id)
+            return only_fields(Subject.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -30,6 +40,43 @@ class SubjectRepository:
     def find_all() -> List[Subject]:
         return list(Subject.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Subject]:
+        queryset = apply_filters(
+            only_fields(Subject.objects, fields), SubjectRepository.FILTERS, filters
+        )
+        return list(queryset.order_by("code", "name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            Subject.objects.all(), SubjectRepository.FILTERS, filters
+        ).order_by("code", "name", "id")
+        return list(queryset.values(*fields)[offset : offset + limit])
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            Subject.objects.all(), SubjectRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("code", "name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def find_by_name(name: str) -> List[Subject]:
         return list(Subject.objects.filter(name__icontains=name))
@@ -57,12 +104,14 @@ class SubjectRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(subject: Subject) -> Subject:
         subject.full_clean()
         subject.save()
         return subject
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         subject = SubjectRepository.find_by_id(id)
         if not subject:
@@ -71,6 +120,7 @@ class SubjectRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(Subject)
     def exists_by_id(id: int) -> bool:
         return Subject.objects.filter(id=id).exists()
 
@@ -79,8 +129,27 @@ class SubjectRepository:
         return Subject.objects.filter(code=code).exists()
 
     @staticmethod
-    def count() -> int:
-        return Subject.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            Subject.objects, SubjectRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(Subject.objects.all(), SubjectRepository.FILTERS, filters),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(Subject.objects.all(), SubjectRepository.FILTERS, filters)
+        )
 
     @staticmethod
     def find_with_relations(id: int) -> Optional[Subject]:
@@ -92,9 +161,11 @@ class SubjectRepository:
             return None
 
     @staticmethod
+    @IdentityMap.invalidates
     def associate_authority(subject: Subject, authority: Authority) -> None:
         authority.subjects.add(subject)
 
     @staticmethod
+    @IdentityMap.invalidates
     def disassociate_authority(subject: Subject, authority: Authority) -> None:
         authority.subjects.remove(subject)
@@ -1,10 +1,20 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Sequence, Tuple
+from datetime import datetime
 from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch
+from app.models.faculty import Faculty
+from app.models.specialty import Specialty
 from app.models.university import University
+from app.repositories.counts import estimate_count, list_version
+from app.repositories.filters import apply_filters, only_fields
+from app.repositories.identity_map import IdentityMap
 
 
 class UniversityRepository:
+    FILTERS: Dict[str, str] = {}
+
     @staticmethod
+    @IdentityMap.invalidates
     def create(university_data: Dict[str, Any]) -> University:
         university = University(**university_data)
         university.full_clean()
@@ -12,9 +22,12 @@ class UniversityRepository:
         return university
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[University]:
+    @IdentityMap.memoize_find_by_id(University)
+    def find_by_id(
+        id: int, fields: Optional[Sequence[str]] = None
+    ) -> Optional[University]:
         try:
-            return University.objects.get(id=id)
+            return only_fields(University.objects, fields).get(id=id)
         except ObjectDoesNotExist:
             return None
 
@@ -36,17 +49,60 @@ class UniversityRepository:
     def find_all() -> List[University]:
         return list(University.objects.all())
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[University]:
+        queryset = apply_filters(
+            only_fields(University.objects, fields),
+            UniversityRepository.FILTERS,
+            filters,
+        )
+        return list(queryset.order_by("name", "id")[offset : offset + limit])
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        queryset = apply_filters(
+            University.objects.all(), UniversityRepository.FILTERS, filters
+        )
+        return list(
+            queryset.order_by("name", "id").values(*fields)[offset : offset + limit]
+        )
+
+    @staticmethod
+    def iter_values(
+        fields: Sequence[str], filters: Dict[str, Any], chunk_size: int
+    ) -> Iterator[Dict[str, Any]]:
+        queryset = apply_filters(
+            University.objects.all(), UniversityRepository.FILTERS, filters
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*fields)
+            .iterator(chunk_size=chunk_size)
+        )
+
     @staticmethod
     def search_by_name(name: str) -> List[University]:
         return list(University.objects.filter(name__icontains=name))
 
     @staticmethod
+    @IdentityMap.invalidates
     def update(university: University) -> University:
         university.full_clean()
         university.save()
         return university
 
     @staticmethod
+    @IdentityMap.invalidates
     def delete_by_id(id: int) -> bool:
         university = UniversityRepository.find_by_id(id)
         if not university:
@@ -55,6 +111,7 @@ class UniversityRepository:
         return True
 
     @staticmethod
+    @IdentityMap.memoize_exists_by_id(University)
     def exists_by_id(id: int) -> bool:
         return University.objects.filter(id=id).exists()
 
@@ -67,8 +124,31 @@ class UniversityRepository:
         return University.objects.filter(name=name).exists()
 
     @staticmethod
-    def count() -> int:
-        return University.objects.count()
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return apply_filters(
+            University.objects, UniversityRepository.FILTERS, filters
+        ).count()
+
+    @staticmethod
+    def count_estimate(
+        exact_below: int, filters: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return estimate_count(
+            apply_filters(
+                University.objects.all(), UniversityRepository.FILTERS, filters
+            ),
+            exact_below,
+        )
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return list_version(
+            apply_filters(
+                University.objects.all(), UniversityRepository.FILTERS, filters
+            )
+        )
 
     @staticmethod
     def find_with_relations(id: int) -> Optional[University]:
@@ -78,3 +158,22 @@ class UniversityRepository:
             ).get(id=id)
         except ObjectDoesNotExist:
             return None
+
+    @staticmethod
+    def find_tree(id: int) -> Optional[University]:
+        """University with its faculties, specialties and specialty types.
+
+        Always three queries, whatever the size of the hierarchy.
+        """
+        specialties = Specialty.objects.select_related("specialty_type").order_by(
+            "name", "id"
+        )
+        faculties = Faculty.objects.prefetch_related(
+            Prefetch("specialties", queryset=specialties)
+        ).order_by("name", "id")
+        try:
+            return University.objects.prefetch_related(
+                Prefetch("faculties", queryset=faculties)
+            ).get(id=id)
+        except ObjectDoesNotExist:
+            return None
@@ -15,3 +15,5 @@ from .faculty import FacultySerializer
 from .specialty import SpecialtySerializer
 from .subject import SubjectSerializer
 from .orientation import OrientationSerializer
+from .certificate_job import CertificateJobSerializer
+from .university_tree import UniversityTreeSerializer
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Area
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class AreaSerializer(serializers.ModelSerializer):
+class AreaSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
@@ -1,9 +1,10 @@
 import re
 from rest_framework import serializers
 from app.models import Authority
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class AuthoritySerializer(serializers.ModelSerializer):
+class AuthoritySerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=100,
         min_length=3,
@@ -0,0 +1,147 @@
+import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+
+class RowEncoder:
+    """Encodes ``values()`` rows exactly as a serializer encodes instances.
+
+    The converter of every readable field is resolved once. Integer and
+    string fields reduce to ``int``/``str``, ISO dates to ``isoformat()``
+    and aware ISO datetimes to a shift into the current time zone resolved
+    once per batch; every other field keeps its own ``to_representation``.
+    Rows are then encoded without building model instances or walking the
+    serializer fields per row.
+    """
+
+    def __init__(self, serializer: serializers.Serializer):
+        self.columns: List[Tuple[str, str, Callable[[Any], Any]]] = []
+        self._datetime_fields: Dict[str, serializers.DateTimeField] = {}
+
+        for field in serializer._readable_fields:
+            to_representation = type(field).to_representation
+            if to_representation is serializers.IntegerField.to_representation:
+                convert = int
+            elif to_representation is serializers.CharField.to_representation:
+                convert = str
+            elif to_representation is serializers.DateField.to_representation and (
+                _output_format(field, api_settings.DATE_FORMAT) == ISO_8601
+            ):
+                convert = _iso_date
+            else:
+                convert = field.to_representation
+                if (
+                    to_representation is serializers.DateTimeField.to_representation
+                    and _output_format(field, api_settings.DATETIME_FORMAT) == ISO_8601
+                    and not hasattr(field, "timezone")
+                ):
+                    self._datetime_fields[field.field_name] = field
+            self.columns.append((field.field_name, field.source, convert))
+
+    @property
+    def sources(self) -> List[str]:
+        """Columns to fetch with ``values()``."""
+        return [source for _, source, _ in self.columns]
+
+    def encode(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return self.encode_many([row])[0]
+
+    def encode_many(self, rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        columns = self.columns
+        if self._datetime_fields and settings.USE_TZ:
+            current_timezone = timezone.get_current_timezone()
+            columns = [
+                (
+                    name,
+                    source,
+                    (
+                        _datetime_converter(
+                            self._datetime_fields[name], current_timezone
+                        )
+                        if name in self._datetime_fields
+                        else convert
+                    ),
+                )
+                for name, source, convert in columns
+            ]
+
+        encoded_rows = []
+        for row in rows:
+            encoded = {}
+            for name, source, convert in columns:
+                value = row[source]
+                encoded[name] = None if value is None else convert(value)
+            encoded_rows.append(encoded)
+        return encoded_rows
+
+
+def _output_format(field: serializers.Field, default: Optional[str]) -> Optional[str]:
+    output_format = getattr(field, "format", default)
+    return output_format.lower() if output_format else output_format
+
+
+def _iso_date(value: Any) -> Any:
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _datetime_converter(
+    field: serializers.DateTimeField, current_timezone: datetime.tzinfo
+) -> Callable[[datetime.datetime], Any]:
+    def convert(value):
+        if not isinstance(value, datetime.datetime) or value.utcoffset() is None:
+            return field.to_representation(value)
+        value = value.astimezone(current_timezone).isoformat()
+        if value.endswith("+00:00"):
+            value = value[:-6] + "Z"
+        return value
+
+    return convert
+
+
+@lru_cache(maxsize=None)
+def _get_row_encoder(serializer_class, fields: Optional[Tuple[str, ...]]) -> RowEncoder:
+    return RowEncoder(serializer_class(fields=fields))
+
+
+class SparseFieldsModelSerializer(serializers.ModelSerializer):
+    """Model serializer that can be limited to a subset of its fields.
+
+    Views read the subset from ``?fields=a,b`` with ``get_requested_fields``
+    and pass it both to the serializer and down to the repository, so the
+    columns that are not returned are not fetched either.
+    """
+
+    fields_query_param = "fields"
+
+    def __init__(self, *args, fields: Optional[Sequence[str]] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_requested_fields(cls, request) -> Optional[List[str]]:
+        value = request.query_params.get(cls.fields_query_param)
+        if not value:
+            return None
+
+        requested = list(
+            dict.fromkeys(name.strip() for name in value.split(",") if name.strip())
+        )
+        unknown = [name for name in requested if name not in cls.Meta.fields]
+        if unknown:
+            raise serializers.ValidationError(
+                {cls.fields_query_param: f"Unknown fields: {', '.join(unknown)}"}
+            )
+        return requested
+
+    @classmethod
+    def get_row_encoder(cls, fields: Optional[Sequence[str]] = None) -> RowEncoder:
+        """Cached encoder for the rows of a list read, see ``RowEncoder``."""
+        return _get_row_encoder(cls, None if fields is None else tuple(fields))
@@ -0,0 +1,35 @@
+from rest_framework import serializers
+from app.models import CertificateJob
+
+
+class CertificateJobSerializer(serializers.ModelSerializer):
+    student_id = serializers.IntegerField(
+        required=True,
+        min_value=1,
+        error_messages={
+            "required": "Student ID is required.",
+            "invalid": "Student ID must be a valid integer.",
+            "min_value": "Student ID must be a positive integer.",
+        },
+    )
+
+    document_type = serializers.ChoiceField(
+        choices=[("pdf", "PDF"), ("odt", "ODT"), ("docx", "DOCX")],
+        default="pdf",
+        error_messages={
+            "invalid_choice": "Document type must be pdf, odt or docx.",
+        },
+    )
+
+    class Meta:
+        model = CertificateJob
+        fields = [
+            "id",
+            "student_id",
+            "document_type",
+            "status",
+            "error",
+            "created_at",
+            "updated_at",
+        ]
+        read_only_fields = ["id", "status", "error", "created_at", "updated_at"]
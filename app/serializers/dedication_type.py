@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import DedicationType
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class DedicationTypeSerializer(serializers.ModelSerializer):
+class DedicationTypeSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=100,
         min_length=2,
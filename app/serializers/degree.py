@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Degree
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class DegreeSerializer(serializers.ModelSerializer):
+class DegreeSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
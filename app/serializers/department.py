@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Department
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import DocumentType
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class DocumentTypeSerializer(serializers.ModelSerializer):
+class DocumentTypeSerializer(SparseFieldsModelSerializer):
     dni = serializers.IntegerField(
         required=True,
         min_value=1000000,
@@ -1,9 +1,10 @@
 import re
 from rest_framework import serializers
 from app.models import Faculty
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class FacultySerializer(serializers.ModelSerializer):
+class FacultySerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=100,
         min_length=3,
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Group
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class GroupSerializer(serializers.ModelSerializer):
+class GroupSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
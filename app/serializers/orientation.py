@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Orientation
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class OrientationSerializer(serializers.ModelSerializer):
+class OrientationSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
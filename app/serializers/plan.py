@@ -1,9 +1,10 @@
 from datetime import date
 from rest_framework import serializers
 from app.models import Plan
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class PlanSerializer(serializers.ModelSerializer):
+class PlanSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
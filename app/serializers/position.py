@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Position
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class PositionSerializer(serializers.ModelSerializer):
+class PositionSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
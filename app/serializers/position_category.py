@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import PositionCategory
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class PositionCategorySerializer(serializers.ModelSerializer):
+class PositionCategorySerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=30,
         min_length=2,
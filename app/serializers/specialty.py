@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import Specialty
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class SpecialtySerializer(serializers.ModelSerializer):
+class SpecialtySerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=100,
         min_length=3,
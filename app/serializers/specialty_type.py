@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import SpecialtyType
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class SpecialtyTypeSerializer(serializers.ModelSerializer):
+class SpecialtyTypeSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=50,
         min_length=2,
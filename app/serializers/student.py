@@ -1,9 +1,10 @@
 from datetime import date, timedelta
 from rest_framework import serializers
 from app.models import Student
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class StudentSerializer(serializers.ModelSerializer):
+class StudentSerializer(SparseFieldsModelSerializer):
     first_name = serializers.CharField(
         max_length=50,
         min_length=2,
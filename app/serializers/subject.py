@@ -1,9 +1,10 @@
 import re
 from rest_framework import serializers
 from app.models import Subject
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class SubjectSerializer(serializers.ModelSerializer):
+class SubjectSerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=255,
         min_length=3,
@@ -1,8 +1,9 @@
 from rest_framework import serializers
 from app.models import University
+from app.serializers.base import SparseFieldsModelSerializer
 
 
-class UniversitySerializer(serializers.ModelSerializer):
+class UniversitySerializer(SparseFieldsModelSerializer):
     name = serializers.CharField(
         max_length=100,
         min_length=3,
@@ -0,0 +1,73 @@
+from rest_framework import serializers
+from app.serializers.faculty import FacultySerializer
+from app.serializers.specialty import SpecialtySerializer
+from app.serializers.specialty_type import SpecialtyTypeSerializer
+from app.serializers.university import UniversitySerializer
+
+
+class StudentCountMixin:
+    """Adds ``student_count`` when the view passes ``student_counts`` in the
+    context, a mapping of specialty id to its number of students."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.context.get("student_counts") is None:
+            fields.pop("student_count")
+        return fields
+
+    def count_specialty(self, specialty) -> int:
+        return self.context["student_counts"].get(specialty.id, 0)
+
+
+class SpecialtyTreeSerializer(StudentCountMixin, SpecialtySerializer):
+    specialty_type_id = None
+    faculty_id = None
+    specialty_type = SpecialtyTypeSerializer(read_only=True)
+    student_count = serializers.SerializerMethodField()
+
+    class Meta(SpecialtySerializer.Meta):
+        fields = [
+            field
+            for field in SpecialtySerializer.Meta.fields
+            if field not in ("specialty_type_id", "faculty_id")
+        ] + ["specialty_type", "student_count"]
+
+    def get_student_count(self, specialty) -> int:
+        return self.count_specialty(specialty)
+
+
+class FacultyTreeSerializer(StudentCountMixin, FacultySerializer):
+    university_id = None
+    specialties = SpecialtyTreeSerializer(many=True, read_only=True)
+    student_count = serializers.SerializerMethodField()
+
+    class Meta(FacultySerializer.Meta):
+        fields = [
+            field for field in FacultySerializer.Meta.fields if field != "university_id"
+        ] + ["specialties", "student_count"]
+
+    def get_student_count(self, faculty) -> int:
+        return sum(
+            self.count_specialty(specialty) for specialty in faculty.specialties.all()
+        )
+
+
+class UniversityTreeSerializer(StudentCountMixin, UniversitySerializer):
+    """Read-only University → Faculty → Specialty hierarchy.
+
+    Expects the prefetched instance returned by
+    ``UniversityRepository.find_tree``, so serializing it runs no queries.
+    """
+
+    faculties = FacultyTreeSerializer(many=True, read_only=True)
+    student_count = serializers.SerializerMethodField()
+
+    class Meta(UniversitySerializer.Meta):
+        fields = UniversitySerializer.Meta.fields + ["faculties", "student_count"]
+
+    def get_student_count(self, university) -> int:
+        return sum(
+            self.count_specialty(specialty)
+            for faculty in university.faculties.all()
+            for specialty in faculty.specialties.all()
+        )
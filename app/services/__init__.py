@@ -15,3 +15,4 @@ from .position import PositionService
 from .orientation import OrientationService
 from .authority import AuthorityService
 from .faculty import FacultyService
+from .certificate_job import CertificateJobService
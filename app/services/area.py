@@ -1,5 +1,7 @@
 import logging
-from typing import Any, Optional, List
+from typing import Any, Optional, List, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import AreaRepository
 
@@ -21,9 +23,9 @@ class AreaService:
         return created_area
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding area with id: {id}")
-        area = AreaRepository.find_by_id(id)
+        area = AreaRepository.find_by_id(id, fields)
         if not area:
             logger.warning(f"Area with id {id} not found")
         return area
@@ -43,6 +45,53 @@ class AreaService:
         logger.info(f"Found {len(areas)} areas")
         return areas
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding areas page (offset={offset}, limit={limit})")
+        areas = AreaRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(areas)} areas")
+        return areas
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding areas page (offset={offset}, limit={limit})")
+        areas = AreaRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(areas)} areas")
+        return areas
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return AreaRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return AreaRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return AreaRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting areas with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return AreaRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, area_data: dict) -> Any:
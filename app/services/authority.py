@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import AuthorityRepository
 from app.repositories import SubjectRepository
@@ -32,9 +34,9 @@ class AuthorityService:
         return created_authority
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding authority with id: {id}")
-        authority = AuthorityRepository.find_by_id(id)
+        authority = AuthorityRepository.find_by_id(id, fields)
         if not authority:
             logger.warning(f"Authority with id {id} not found")
         return authority
@@ -54,6 +56,55 @@ class AuthorityService:
         logger.info(f"Found {len(authorities)} authorities")
         return authorities
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding authorities page (offset={offset}, limit={limit})")
+        authorities = AuthorityRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(authorities)} authorities")
+        return authorities
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding authorities page (offset={offset}, limit={limit})")
+        authorities = AuthorityRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(authorities)} authorities")
+        return authorities
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return AuthorityRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return AuthorityRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return AuthorityRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting authorities with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return AuthorityRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_position(position_id: int) -> List[Any]:
         logger.info(f"Finding authorities by position id: {position_id}")
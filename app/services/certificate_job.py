@@ -0,0 +1,231 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Optional, Any, Set
+from django.conf import settings
+from django.core.files import File
+from django.core.signals import request_started
+from django.db import DatabaseError, close_old_connections, connection, transaction
+from django.utils import timezone
+from app.models import CertificateJob
+from app.repositories import CertificateJobRepository
+from app.repositories import StudentRepository
+from app.services.student import StudentService
+from app.utils import get_document_generator
+from app.utils import RenderRejectedError
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Ids of the jobs queued or running in this process
+_submitted: Set[int] = set()
+
+RECOVERY_DISPATCH_UID = "certificate-job-recovery"
+
+
+def _forget_executor() -> None:
+    global _executor, _executor_lock, _submitted
+
+    # Pool threads do not survive a fork; the child starts its own pool
+    _executor = None
+    _executor_lock = threading.Lock()
+    _submitted = set()
+
+
+def _recover_on_first_request(**kwargs) -> None:
+    # Only the request that disconnects the receiver runs the recovery
+    if not request_started.disconnect(dispatch_uid=RECOVERY_DISPATCH_UID):
+        return
+    CertificateJobService.recover()
+    CertificateJobService.delete_expired()
+
+
+os.register_at_fork(after_in_child=_forget_executor)
+
+
+class CertificateJobService:
+    @staticmethod
+    @transaction.atomic
+    def create(student_id: int, type: str) -> Any:
+        logger.info(
+            f"Creating certificate job for student id: {student_id}, type: {type}"
+        )
+
+        if not get_document_generator(type):
+            logger.error(f"Document type '{type}' is not supported")
+            raise ValueError(f"Document type '{type}' is not supported")
+
+        if not StudentRepository.exists_by_id(student_id):
+            logger.error(f"Student with id {student_id} not found")
+            raise ValueError(f"Student with id {student_id} does not exist")
+
+        created_job = CertificateJobRepository.create(
+            {"student_id": student_id, "document_type": type.lower()}
+        )
+
+        # Workers only see the job once the row is committed
+        transaction.on_commit(lambda: CertificateJobService._submit(created_job.id))
+        logger.info(f"Certificate job created successfully with id: {created_job.id}")
+        return created_job
+
+    @staticmethod
+    def find_by_id(id: int) -> Optional[Any]:
+        logger.info(f"Finding certificate job with id: {id}")
+        job = CertificateJobRepository.find_by_id(id)
+        if not job:
+            logger.warning(f"Certificate job with id {id} not found")
+        elif CertificateJobService._is_stale(job):
+            # Its worker died or its process restarted while rendering it
+            CertificateJobService.requeue_stale()
+            job = CertificateJobRepository.find_by_id(id)
+        return job
+
+    @staticmethod
+    def _get_stale_before() -> datetime:
+        timeout = getattr(settings, "CERTIFICATE_JOB_STALE_TIMEOUT", 900)
+        return timezone.now() - timedelta(seconds=timeout)
+
+    @staticmethod
+    def _is_stale(job: Any) -> bool:
+        return (
+            job.status == CertificateJob.STATUS_RUNNING
+            and job.updated_at < CertificateJobService._get_stale_before()
+        )
+
+    @staticmethod
+    def connect_signals() -> None:
+        """Recover jobs on the first request each process serves.
+
+        Management commands and migrations never serve requests, so they
+        never touch the jobs table.
+        """
+        request_started.connect(
+            _recover_on_first_request, dispatch_uid=RECOVERY_DISPATCH_UID
+        )
+
+    @staticmethod
+    def requeue_stale() -> None:
+        """Requeue and submit the running jobs whose worker stopped updating them."""
+        try:
+            requeued = CertificateJobRepository.requeue_stale(
+                CertificateJobService._get_stale_before()
+            )
+            if requeued:
+                logger.warning(f"Requeued {len(requeued)} stale certificate jobs")
+
+            for id in requeued:
+                CertificateJobService._submit(id)
+        except DatabaseError as e:
+            logger.warning(f"Failed to requeue stale certificate jobs: {str(e)}")
+
+    @staticmethod
+    def recover() -> None:
+        """Requeue stale running jobs and submit every pending job.
+
+        Runs on the first request of each process. Jobs already queued in
+        this process are not submitted again, and jobs another process
+        holds are skipped by ``claim``.
+        """
+        CertificateJobService.requeue_stale()
+        try:
+            for job in CertificateJobRepository.find_by_status(
+                CertificateJob.STATUS_PENDING
+            ):
+                CertificateJobService._submit(job.id)
+        except DatabaseError as e:
+            logger.warning(f"Failed to recover certificate jobs: {str(e)}")
+
+    @staticmethod
+    def delete_expired() -> int:
+        """Delete finished jobs older than CERTIFICATE_JOB_MAX_AGE and their files."""
+        max_age = getattr(settings, "CERTIFICATE_JOB_MAX_AGE", 86400)
+        if max_age <= 0:
+            return 0
+
+        try:
+            jobs = CertificateJobRepository.find_finished_before(
+                timezone.now() - timedelta(seconds=max_age)
+            )
+            for job in jobs:
+                if job.result:
+                    job.result.delete(save=False)
+            deleted = CertificateJobRepository.delete_by_ids([job.id for job in jobs])
+        except (DatabaseError, OSError) as e:
+            logger.warning(f"Failed to delete expired certificate jobs: {str(e)}")
+            return 0
+
+        logger.info(f"Deleted {deleted} expired certificate jobs")
+        return deleted
+
+    @staticmethod
+    def run(id: int) -> None:
+        close_old_connections()
+        try:
+            if not CertificateJobRepository.claim(id):
+                logger.info(f"Certificate job {id} already taken, skipping")
+                return
+
+            job = CertificateJobRepository.find_by_id(id)
+            logger.info(f"Running certificate job {id}")
+
+            try:
+                document = StudentService.get_regular_student_certificate(
+                    job.student_id, job.document_type
+                )
+                with document:
+                    job.result.save(
+                        f"certificado_estudiante_{job.student_id}_{job.id}.{job.document_type}",
+                        File(document),
+                        save=False,
+                    )
+                job.status = CertificateJob.STATUS_DONE
+                logger.info(f"Certificate job {id} finished successfully")
+            except RenderRejectedError as e:
+                # Renderers are saturated; put the job back and retry later
+                logger.warning(
+                    f"Certificate job {id} deferred for {e.retry_after}s: {str(e)}"
+                )
+                job.status = CertificateJob.STATUS_PENDING
+                retry = threading.Timer(
+                    e.retry_after, CertificateJobService._submit, args=(id,)
+                )
+                retry.daemon = True
+                retry.start()
+            except Exception as e:
+                logger.error(f"Certificate job {id} failed: {str(e)}")
+                job.status = CertificateJob.STATUS_FAILED
+                job.error = str(e)[:255]
+
+            CertificateJobRepository.update(job)
+        finally:
+            with _executor_lock:
+                _submitted.discard(id)
+            # Worker threads own their connection; do not leave it open
+            connection.close()
+
+    @staticmethod
+    def _get_executor() -> ThreadPoolExecutor:
+        global _executor
+
+        with _executor_lock:
+            if _executor is None:
+                max_workers = getattr(settings, "CERTIFICATE_JOB_WORKERS", 2)
+                _executor = ThreadPoolExecutor(
+                    max_workers=max_workers, thread_name_prefix="certificate-job"
+                )
+                logger.info(f"Started certificate job pool with {max_workers} workers")
+
+        return _executor
+
+    @staticmethod
+    def _submit(id: int) -> None:
+        with _executor_lock:
+            # Queue each job once per process; run() forgets it when it ends
+            if id in _submitted:
+                return
+            _submitted.add(id)
+        CertificateJobService._get_executor().submit(CertificateJobService.run, id)
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import DedicationTypeRepository
 
@@ -27,9 +29,9 @@ class DedicationTypeService:
         return created_dedication_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding dedication type with id: {id}")
-        dedication_type = DedicationTypeRepository.find_by_id(id)
+        dedication_type = DedicationTypeRepository.find_by_id(id, fields)
         if not dedication_type:
             logger.warning(f"Dedication type with id {id} not found")
         return dedication_type
@@ -49,6 +51,57 @@ class DedicationTypeService:
         logger.info(f"Found {len(dedication_types)} dedication types")
         return dedication_types
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding dedication types page (offset={offset}, limit={limit})")
+        dedication_types = DedicationTypeRepository.find_page(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(dedication_types)} dedication types")
+        return dedication_types
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding dedication types page (offset={offset}, limit={limit})")
+        dedication_types = DedicationTypeRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(dedication_types)} dedication types")
+        return dedication_types
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return DedicationTypeRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return DedicationTypeRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return DedicationTypeRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting dedication types with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return DedicationTypeRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, dedication_type_data: dict) -> Any:
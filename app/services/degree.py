@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import DegreeRepository
 
@@ -23,9 +25,9 @@ class DegreeService:
         return created_degree
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding degree with id: {id}")
-        degree = DegreeRepository.find_by_id(id)
+        degree = DegreeRepository.find_by_id(id, fields)
         if not degree:
             logger.warning(f"Degree with id {id} not found")
         return degree
@@ -45,6 +47,53 @@ class DegreeService:
         logger.info(f"Found {len(degrees)} degrees")
         return degrees
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding degrees page (offset={offset}, limit={limit})")
+        degrees = DegreeRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(degrees)} degrees")
+        return degrees
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding degrees page (offset={offset}, limit={limit})")
+        degrees = DegreeRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(degrees)} degrees")
+        return degrees
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return DegreeRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return DegreeRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return DegreeRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting degrees with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return DegreeRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, degree_data: dict) -> Any:
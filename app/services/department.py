@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import DepartmentRepository
 
@@ -25,9 +27,9 @@ class DepartmentService:
         return created_department
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding department with id: {id}")
-        department = DepartmentRepository.find_by_id(id)
+        department = DepartmentRepository.find_by_id(id, fields)
         if not department:
             logger.warning(f"Department with id {id} not found")
         return department
@@ -47,6 +49,55 @@ class DepartmentService:
         logger.info(f"Found {len(departments)} departments")
         return departments
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding departments page (offset={offset}, limit={limit})")
+        departments = DepartmentRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(departments)} departments")
+        return departments
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding departments page (offset={offset}, limit={limit})")
+        departments = DepartmentRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(departments)} departments")
+        return departments
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return DepartmentRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return DepartmentRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return DepartmentRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting departments with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return DepartmentRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_faculty(faculty_id: int) -> List[Any]:
         """Find all departments for a specific faculty."""
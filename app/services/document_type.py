@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import DocumentTypeRepository
 
@@ -19,9 +21,9 @@ class DocumentTypeService:
         return created_document_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding document type with id: {id}")
-        document_type = DocumentTypeRepository.find_by_id(id)
+        document_type = DocumentTypeRepository.find_by_id(id, fields)
         if not document_type:
             logger.warning(f"Document type with id {id} not found")
         return document_type
@@ -42,6 +44,57 @@ class DocumentTypeService:
         logger.info(f"Found {len(document_types)} document types")
         return document_types
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding document types page (offset={offset}, limit={limit})")
+        document_types = DocumentTypeRepository.find_page(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(document_types)} document types")
+        return document_types
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding document types page (offset={offset}, limit={limit})")
+        document_types = DocumentTypeRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(document_types)} document types")
+        return document_types
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return DocumentTypeRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return DocumentTypeRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return DocumentTypeRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting document types with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return DocumentTypeRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, document_type_data: dict) -> Any:
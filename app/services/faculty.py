@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import FacultyRepository
 from app.repositories import AuthorityRepository
@@ -24,9 +26,9 @@ class FacultyService:
         return created_faculty
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding faculty with id: {id}")
-        faculty = FacultyRepository.find_by_id(id)
+        faculty = FacultyRepository.find_by_id(id, fields)
         if not faculty:
             logger.warning(f"Faculty with id {id} not found")
         return faculty
@@ -38,6 +40,53 @@ class FacultyService:
         logger.info(f"Found {len(faculties)} faculties")
         return faculties
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding faculties page (offset={offset}, limit={limit})")
+        faculties = FacultyRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(faculties)} faculties")
+        return faculties
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding faculties page (offset={offset}, limit={limit})")
+        faculties = FacultyRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(faculties)} faculties")
+        return faculties
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return FacultyRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return FacultyRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return FacultyRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting faculties with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return FacultyRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_university(university_id: int) -> List[Any]:
         logger.info(f"Finding faculties by university id: {university_id}")
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import GroupRepository
 
@@ -21,9 +23,9 @@ class GroupService:
         return created_group
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding group with id: {id}")
-        group = GroupRepository.find_by_id(id)
+        group = GroupRepository.find_by_id(id, fields)
         if not group:
             logger.warning(f"Group with id {id} not found")
         return group
@@ -43,6 +45,53 @@ class GroupService:
         logger.info(f"Found {len(groups)} groups")
         return groups
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding groups page (offset={offset}, limit={limit})")
+        groups = GroupRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(groups)} groups")
+        return groups
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding groups page (offset={offset}, limit={limit})")
+        groups = GroupRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(groups)} groups")
+        return groups
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return GroupRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return GroupRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return GroupRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting groups with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return GroupRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_subject(subject_id: int) -> List[Any]:
         """Find all groups for a specific subject."""
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import OrientationRepository
 from app.repositories import SpecialtyRepository
@@ -45,9 +47,9 @@ class OrientationService:
         return created_orientation
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding orientation with id: {id}")
-        orientation = OrientationRepository.find_by_id(id)
+        orientation = OrientationRepository.find_by_id(id, fields)
         if not orientation:
             logger.warning(f"Orientation with id {id} not found")
         return orientation
@@ -67,6 +69,55 @@ class OrientationService:
         logger.info(f"Found {len(orientations)} orientations")
         return orientations
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding orientations page (offset={offset}, limit={limit})")
+        orientations = OrientationRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(orientations)} orientations")
+        return orientations
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding orientations page (offset={offset}, limit={limit})")
+        orientations = OrientationRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(orientations)} orientations")
+        return orientations
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return OrientationRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return OrientationRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return OrientationRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting orientations with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return OrientationRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_specialty(specialty_id: int) -> List[Any]:
         logger.info(f"Finding orientations by specialty id: {specialty_id}")
@@ -1,6 +1,7 @@
 import logging
-from typing import Optional, List, Any
-from datetime import date
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import date, datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import PlanRepository
 
@@ -22,9 +23,9 @@ class PlanService:
         return created_plan
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding plan with id: {id}")
-        plan = PlanRepository.find_by_id(id)
+        plan = PlanRepository.find_by_id(id, fields)
         if not plan:
             logger.warning(f"Plan with id {id} not found")
         return plan
@@ -44,6 +45,53 @@ class PlanService:
         logger.info(f"Found {len(plans)} plans")
         return plans
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding plans page (offset={offset}, limit={limit})")
+        plans = PlanRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(plans)} plans")
+        return plans
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding plans page (offset={offset}, limit={limit})")
+        plans = PlanRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(plans)} plans")
+        return plans
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return PlanRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return PlanRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return PlanRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting plans with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return PlanRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_active_plans() -> List[Any]:
         logger.info("Finding all active plans")
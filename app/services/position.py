@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import PositionRepository
 from app.repositories import PositionCategoryRepository
@@ -43,9 +45,9 @@ class PositionService:
         return created_position
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding position with id: {id}")
-        position = PositionRepository.find_by_id(id)
+        position = PositionRepository.find_by_id(id, fields)
         if not position:
             logger.warning(f"Position with id {id} not found")
         return position
@@ -65,6 +67,53 @@ class PositionService:
         logger.info(f"Found {len(positions)} positions")
         return positions
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding positions page (offset={offset}, limit={limit})")
+        positions = PositionRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(positions)} positions")
+        return positions
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding positions page (offset={offset}, limit={limit})")
+        positions = PositionRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(positions)} positions")
+        return positions
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return PositionRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return PositionRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return PositionRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting positions with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return PositionRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_category(position_category_id: int) -> List[Any]:
         logger.info(f"Finding positions by category id: {position_category_id}")
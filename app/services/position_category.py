@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import PositionCategoryRepository
 
@@ -31,9 +33,9 @@ class PositionCategoryService:
         return created_position_category
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding position category with id: {id}")
-        position_category = PositionCategoryRepository.find_by_id(id)
+        position_category = PositionCategoryRepository.find_by_id(id, fields)
         if not position_category:
             logger.warning(f"Position category with id {id} not found")
         return position_category
@@ -53,6 +55,61 @@ class PositionCategoryService:
         logger.info(f"Found {len(position_categories)} position categories")
         return position_categories
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(
+            f"Finding position categories page (offset={offset}, limit={limit})"
+        )
+        position_categories = PositionCategoryRepository.find_page(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(position_categories)} position categories")
+        return position_categories
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(
+            f"Finding position categories page (offset={offset}, limit={limit})"
+        )
+        position_categories = PositionCategoryRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(position_categories)} position categories")
+        return position_categories
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return PositionCategoryRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return PositionCategoryRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return PositionCategoryRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting position categories with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return PositionCategoryRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, position_category_data: dict) -> Any:
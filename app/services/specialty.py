@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import SpecialtyRepository
 from app.repositories import SpecialtyTypeRepository
@@ -34,9 +36,9 @@ class SpecialtyService:
         return created_specialty
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding specialty with id: {id}")
-        specialty = SpecialtyRepository.find_by_id(id)
+        specialty = SpecialtyRepository.find_by_id(id, fields)
         if not specialty:
             logger.warning(f"Specialty with id {id} not found")
         return specialty
@@ -48,6 +50,55 @@ class SpecialtyService:
         logger.info(f"Found {len(specialties)} specialties")
         return specialties
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding specialties page (offset={offset}, limit={limit})")
+        specialties = SpecialtyRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(specialties)} specialties")
+        return specialties
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding specialties page (offset={offset}, limit={limit})")
+        specialties = SpecialtyRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(specialties)} specialties")
+        return specialties
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return SpecialtyRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return SpecialtyRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return SpecialtyRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting specialties with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return SpecialtyRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     def find_by_faculty(faculty_id: int) -> List[Any]:
         logger.info(f"Finding specialties by faculty id: {faculty_id}")
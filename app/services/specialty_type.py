@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import SpecialtyTypeRepository
 
@@ -27,9 +29,9 @@ class SpecialtyTypeService:
         return created_specialty_type
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding specialty type with id: {id}")
-        specialty_type = SpecialtyTypeRepository.find_by_id(id)
+        specialty_type = SpecialtyTypeRepository.find_by_id(id, fields)
         if not specialty_type:
             logger.warning(f"Specialty type with id {id} not found")
         return specialty_type
@@ -49,6 +51,57 @@ class SpecialtyTypeService:
         logger.info(f"Found {len(specialty_types)} specialty types")
         return specialty_types
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding specialty types page (offset={offset}, limit={limit})")
+        specialty_types = SpecialtyTypeRepository.find_page(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(specialty_types)} specialty types")
+        return specialty_types
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding specialty types page (offset={offset}, limit={limit})")
+        specialty_types = SpecialtyTypeRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(specialty_types)} specialty types")
+        return specialty_types
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return SpecialtyTypeRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return SpecialtyTypeRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return SpecialtyTypeRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting specialty types with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return SpecialtyTypeRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, specialty_type_data: dict) -> Any:
@@ -1,14 +1,29 @@
 import datetime
 import logging
-from typing import Optional, List, Any
+import os
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Optional, List, Any, BinaryIO, Iterator, Tuple, Dict, Sequence
+from django.conf import settings
 from django.db import transaction
 from app.repositories import StudentRepository
 from app.repositories import SpecialtyRepository
+from app.repositories import FacultyRepository
 from app.repositories import DocumentTypeRepository
 from app.utils import get_document_generator
+from app.utils import stream_zip
+from app.utils import DocumentCache
+from app.utils import HierarchyCache
+from app.utils import get_render_limiter, limit_stream
+from app.utils import discard_batch_executor, get_batch_executor, get_batch_workers
 
 logger = logging.getLogger(__name__)
 
+CERTIFICATE_FOLDER = "certificado"
+CERTIFICATE_TEMPLATE = "certificado_pdf"
+
 
 class StudentService:
     @staticmethod
@@ -61,9 +76,99 @@ class StudentService:
         return created_student
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    @transaction.atomic
+    def create_batch(
+        students_data: List[dict],
+    ) -> Tuple[List[Any], Dict[int, Dict[str, List[str]]]]:
+        """Create every student or none.
+
+        Returns the created students, or the errors of each failing row by
+        its index.
+        """
+        logger.info(f"Creating batch of {len(students_data)} students")
+
+        errors = StudentService.validate_batch(dict(enumerate(students_data)))
+        if errors:
+            logger.error(f"Student batch rejected: {len(errors)} invalid rows")
+            return [], errors
+
+        chunk_size = getattr(settings, "STUDENT_BATCH_CHUNK_SIZE", 500)
+        created_students = StudentRepository.bulk_create(students_data, chunk_size)
+        # bulk_create sends no post_save signals
+        transaction.on_commit(lambda: HierarchyCache.invalidate(students=True))
+        logger.info(f"Batch of {len(created_students)} students created successfully")
+        return created_students, {}
+
+    @staticmethod
+    def validate_batch(
+        students_data: Dict[int, dict],
+    ) -> Dict[int, Dict[str, List[str]]]:
+        """Run the checks of ``create`` on batch rows keyed by their index.
+
+        Each check is one query for the whole batch, so the cost does not
+        grow with the number of rows.
+        """
+        rows = students_data.values()
+        student_numbers = [data["student_number"] for data in rows]
+        document_numbers = [data["document_number"] for data in rows]
+        taken_student_numbers = StudentRepository.find_existing_student_numbers(
+            student_numbers
+        )
+        taken_document_numbers = StudentRepository.find_existing_document_numbers(
+            document_numbers
+        )
+        specialty_ids = SpecialtyRepository.find_existing_ids(
+            {data["specialty_id"] for data in rows}
+        )
+        document_type_ids = DocumentTypeRepository.find_existing_ids(
+            {data["document_type_id"] for data in rows}
+        )
+        repeated_student_numbers = Counter(student_numbers)
+        repeated_document_numbers = Counter(document_numbers)
+
+        errors: Dict[int, Dict[str, List[str]]] = {}
+        for index, data in students_data.items():
+            row_errors: Dict[str, List[str]] = {}
+            student_number = data["student_number"]
+            document_number = data["document_number"]
+
+            if student_number in taken_student_numbers:
+                row_errors["student_number"] = [
+                    f"Student number {student_number} is already taken"
+                ]
+            elif repeated_student_numbers[student_number] > 1:
+                row_errors["student_number"] = [
+                    f"Student number {student_number} is repeated in the batch"
+                ]
+
+            if document_number in taken_document_numbers:
+                row_errors["document_number"] = [
+                    f"Document number {document_number} is already registered"
+                ]
+            elif repeated_document_numbers[document_number] > 1:
+                row_errors["document_number"] = [
+                    f"Document number {document_number} is repeated in the batch"
+                ]
+
+            if data["specialty_id"] not in specialty_ids:
+                row_errors["specialty_id"] = [
+                    f"Specialty with id {data['specialty_id']} does not exist"
+                ]
+
+            if data["document_type_id"] not in document_type_ids:
+                row_errors["document_type_id"] = [
+                    f"Document type with id {data['document_type_id']} does not exist"
+                ]
+
+            if row_errors:
+                errors[index] = row_errors
+
+        return errors
+
+    @staticmethod
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding student with id: {id}")
-        student = StudentRepository.find_by_id(id)
+        student = StudentRepository.find_by_id(id, fields)
         if not student:
             logger.warning(f"Student with id {id} not found")
         return student
@@ -83,6 +188,87 @@ class StudentService:
         logger.info(f"Found {len(students)} students")
         return students
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding students page (offset={offset}, limit={limit})")
+        students = StudentRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(students)} students")
+        return students
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding students page (offset={offset}, limit={limit})")
+        students = StudentRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(students)} students")
+        return students
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return StudentRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return StudentRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime.datetime], int, Optional[int]]:
+        return StudentRepository.find_list_version(filters)
+
+    @staticmethod
+    def count_by_specialty(university_id: int) -> Dict[int, int]:
+        return StudentRepository.count_by_specialty(university_id)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting students with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return StudentRepository.iter_values(fields, filters, chunk_size)
+
+    @staticmethod
+    def find_page_after(
+        position: Optional[Tuple[str, str, int]],
+        limit: int,
+        reverse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding students page after {position} (limit={limit})")
+        students = StudentRepository.find_page_after(
+            position, limit, reverse, fields, filters
+        )
+        logger.info(f"Found {len(students)} students")
+        return students
+
+    @staticmethod
+    def find_page_after_values(
+        position: Optional[Tuple[str, str, int]],
+        limit: int,
+        reverse: bool = False,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding students page after {position} (limit={limit})")
+        students = StudentRepository.find_page_after_values(
+            position, limit, reverse, fields, filters
+        )
+        logger.info(f"Found {len(students)} students")
+        return students
+
     @staticmethod
     def find_by_specialty(specialty_id: int) -> List[Any]:
         logger.info(f"Finding students by specialty id: {specialty_id}")
@@ -197,8 +383,258 @@ class StudentService:
 
         logger.info(f"Certificate generated successfully for student {id}")
         return document_generator.generate(
-            folder="certificado", template="certificado_pdf", context=context
+            folder=CERTIFICATE_FOLDER, template=CERTIFICATE_TEMPLATE, context=context
+        )
+
+    @staticmethod
+    def get_regular_student_certificate(id: int, type: str) -> BinaryIO:
+        logger.info(f"Getting certificate for student id: {id}, type: {type}")
+
+        student = StudentRepository.find_with_full_relations(id)
+        if not student:
+            logger.error(f"Student with id {id} not found")
+            raise ValueError(f"Student with id {id} not found")
+
+        document_generator = get_document_generator(type)
+        if not document_generator:
+            logger.error(f"Document type '{type}' is not supported")
+            raise ValueError(f"Document type '{type}' is not supported")
+
+        context = StudentService._get_student_data(student)
+        key = StudentService._get_certificate_key(
+            student.id,
+            StudentService._get_certificate_versions(student),
+            document_generator,
+            context["date"],
+        )
+
+        cached_document = DocumentCache.get(key, document_generator.extension)
+        if cached_document:
+            logger.info(f"Certificate served from cache for student {id}")
+            return cached_document
+
+        document = document_generator.generate(
+            folder=CERTIFICATE_FOLDER, template=CERTIFICATE_TEMPLATE, context=context
         )
+        logger.info(f"Certificate generated successfully for student {id}")
+        return DocumentCache.put(key, document_generator.extension, document)
+
+    @staticmethod
+    def get_certificate_validators(id: int, type: str) -> Tuple[str, int]:
+        """ETag and Last-Modified timestamp of a certificate, without rendering it."""
+        logger.info(
+            f"Getting certificate validators for student id: {id}, type: {type}"
+        )
+
+        document_generator = get_document_generator(type)
+        if not document_generator:
+            logger.error(f"Document type '{type}' is not supported")
+            raise ValueError(f"Document type '{type}' is not supported")
+
+        versions = StudentRepository.find_certificate_versions(id)
+        if not versions:
+            logger.error(f"Student with id {id} not found")
+            raise ValueError(f"Student with id {id} not found")
+
+        key = StudentService._get_certificate_key(
+            id, versions, document_generator, StudentService._get_current_date()
+        )
+
+        # The printed date changes at midnight, so the document does too
+        template_path = document_generator.get_template_path(
+            CERTIFICATE_FOLDER, CERTIFICATE_TEMPLATE
+        )
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time.min)
+        last_modified = max(
+            *(version.timestamp() for version in versions),
+            os.path.getmtime(template_path),
+            today.timestamp(),
+        )
+        return f'"{key}"', int(last_modified)
+
+    @staticmethod
+    def _get_certificate_versions(student: Any) -> Tuple:
+        return (
+            student.updated_at,
+            student.document_type.updated_at,
+            student.specialty.updated_at,
+            student.specialty.faculty.updated_at,
+            student.specialty.faculty.university.updated_at,
+        )
+
+    @staticmethod
+    def _get_certificate_key(
+        id: int, versions: Tuple, document_generator: Any, date: str
+    ) -> str:
+        template_path = document_generator.get_template_path(
+            CERTIFICATE_FOLDER, CERTIFICATE_TEMPLATE
+        )
+        return DocumentCache.build_key(
+            id,
+            *versions,
+            DocumentCache.get_template_hash(template_path),
+            document_generator.extension,
+            getattr(settings, "CERTIFICATE_PDF_COMPACT", False),
+            date,
+        )
+
+    @staticmethod
+    def generate_certificates_archive(
+        type: str,
+        specialty_id: Optional[int] = None,
+        faculty_id: Optional[int] = None,
+    ) -> Iterator[bytes]:
+        logger.info(
+            f"Generating certificates archive, type: {type}, "
+            f"specialty id: {specialty_id}, faculty id: {faculty_id}"
+        )
+
+        if not get_document_generator(type):
+            logger.error(f"Document type '{type}' is not supported")
+            raise ValueError(f"Document type '{type}' is not supported")
+
+        students = StudentService._find_certificate_students(specialty_id, faculty_id)
+        contexts = [
+            (student.id, StudentService._get_student_data(student))
+            for student in students
+        ]
+        # One limiter slot per certificate rendering at a time; a busy server
+        # rejects the archive before the response starts
+        slots = max(
+            1,
+            min(len(contexts), get_batch_workers(), get_render_limiter().concurrency),
+        )
+        return limit_stream(
+            stream_zip(StudentService._render_certificates(type, contexts, slots)),
+            slots,
+        )
+
+    @staticmethod
+    def generate_merged_certificates(
+        specialty_id: Optional[int] = None, faculty_id: Optional[int] = None
+    ) -> BinaryIO:
+        logger.info(
+            f"Generating merged certificates PDF, "
+            f"specialty id: {specialty_id}, faculty id: {faculty_id}"
+        )
+
+        # One more than allowed, to tell an oversized cohort without loading it
+        max_size = getattr(settings, "CERTIFICATE_MERGED_MAX_SIZE", 500)
+        students = StudentService._find_certificate_students(
+            specialty_id, faculty_id, limit=max_size + 1
+        )
+        if not students:
+            logger.error("No students found for merged certificates PDF")
+            raise ValueError("No students found for the requested certificates")
+        if len(students) > max_size:
+            logger.error(f"Merged certificates PDF exceeds {max_size} students")
+            raise ValueError(
+                f"A merged certificates PDF cannot exceed {max_size} students, "
+                "download the ZIP archive instead"
+            )
+
+        # One certificate per page, laid out in a single WeasyPrint pass
+        context = {
+            "certificates": [
+                StudentService._get_student_data(student) for student in students
+            ],
+            "date": StudentService._get_current_date(),
+        }
+
+        # Large cohorts take more limiter slots; generate() takes one itself
+        per_slot = getattr(settings, "CERTIFICATE_MERGED_STUDENTS_PER_SLOT", 50)
+        slots = min(-(-len(students) // per_slot), get_render_limiter().concurrency)
+        with get_render_limiter().slot(slots - 1):
+            document = get_document_generator("pdf").generate(
+                folder=CERTIFICATE_FOLDER,
+                template=CERTIFICATE_TEMPLATE,
+                context=context,
+            )
+        logger.info(f"Merged certificates PDF generated for {len(students)} students")
+        return document
+
+    @staticmethod
+    def _find_certificate_students(
+        specialty_id: Optional[int],
+        faculty_id: Optional[int],
+        limit: Optional[int] = None,
+    ) -> List[Any]:
+        if specialty_id is not None:
+            if not SpecialtyRepository.exists_by_id(specialty_id):
+                logger.error(f"Specialty with id {specialty_id} not found")
+                raise ValueError(f"Specialty with id {specialty_id} does not exist")
+            students = StudentRepository.find_by_specialty_with_full_relations(
+                specialty_id, limit=limit
+            )
+        elif faculty_id is not None:
+            if not FacultyRepository.exists_by_id(faculty_id):
+                logger.error(f"Faculty with id {faculty_id} not found")
+                raise ValueError(f"Faculty with id {faculty_id} does not exist")
+            students = StudentRepository.find_by_faculty_with_full_relations(
+                faculty_id, limit=limit
+            )
+        else:
+            logger.error("Certificates requested without specialty or faculty")
+            raise ValueError("Either specialty or faculty must be provided")
+
+        logger.info(f"Found {len(students)} students for certificates")
+        return students
+
+    @staticmethod
+    def _render_certificates(
+        type: str, contexts: List[Tuple[int, dict]], window: int
+    ) -> Iterator[Tuple[str, bytes]]:
+        pending = iter(contexts)
+        futures = {}
+        failed = []
+
+        def submit(count: int) -> None:
+            for student_id, context in islice(pending, count):
+                executor = get_batch_executor()
+                future = executor.submit(
+                    StudentService._render_certificate, type, context
+                )
+                futures[future] = (student_id, executor)
+
+        try:
+            # At most window renders of this archive are queued or running
+            submit(window)
+
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    student_id, executor = futures.pop(future)
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        logger.error(
+                            f"Error generating certificate for student {student_id}: {str(e)}"
+                        )
+                        if isinstance(e, BrokenProcessPool):
+                            discard_batch_executor(executor)
+                        failed.append(student_id)
+                        data = None
+
+                    submit(1)
+                    if data is not None:
+                        yield f"certificado_estudiante_{student_id}.{type}", data
+
+            if failed:
+                yield "errores.txt", "\n".join(
+                    f"certificado_estudiante_{student_id}.{type}"
+                    for student_id in sorted(failed)
+                ).encode()
+        finally:
+            # Drop queued renders when the client disconnects
+            for future in futures:
+                future.cancel()
+
+    @staticmethod
+    def _render_certificate(type: str, context: dict) -> bytes:
+        document_generator = get_document_generator(type)
+        return document_generator.generate(
+            folder=CERTIFICATE_FOLDER, template=CERTIFICATE_TEMPLATE, context=context
+        ).getvalue()
 
     @staticmethod
     def _get_current_date() -> str:
@@ -207,10 +643,32 @@ class StudentService:
 
     @staticmethod
     def _get_student_data(student: Any) -> dict:
-        return {
+        data = {
             "student": student,
             "specialty": student.specialty,
             "faculty": student.specialty.faculty,
             "university": student.specialty.faculty.university,
             "date": StudentService._get_current_date(),
         }
+        # The PDF template lays out a list of certificates, one per page
+        data["certificates"] = [data]
+        data.update(StudentService._get_office_template_data(data))
+        return data
+
+    @staticmethod
+    def _get_office_template_data(data: dict) -> dict:
+        # The ODT and DOCX templates use Spanish placeholder names
+        student = data["student"]
+        return {
+            "alumno": {
+                "apellido": student.last_name,
+                "nombre": student.first_name,
+                "tipo_documento": {"sigla": student.document_type.abbreviation},
+                "nrodocumento": student.document_number,
+                "nro_legajo": student.student_number,
+            },
+            "especialidad": {"nombre": data["specialty"].name},
+            "facultad": {"nombre": data["faculty"].name},
+            "universidad": {"nombre": data["university"].name},
+            "fecha": data["date"],
+        }
@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories import SubjectRepository
 from app.repositories import AuthorityRepository
@@ -23,9 +25,9 @@ class SubjectService:
         return created_subject
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding subject with id: {id}")
-        subject = SubjectRepository.find_by_id(id)
+        subject = SubjectRepository.find_by_id(id, fields)
         if not subject:
             logger.warning(f"Subject with id {id} not found")
         return subject
@@ -45,6 +47,53 @@ class SubjectService:
         logger.info(f"Found {len(subjects)} subjects")
         return subjects
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding subjects page (offset={offset}, limit={limit})")
+        subjects = SubjectRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(subjects)} subjects")
+        return subjects
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding subjects page (offset={offset}, limit={limit})")
+        subjects = SubjectRepository.find_page_values(offset, limit, fields, filters)
+        logger.info(f"Found {len(subjects)} subjects")
+        return subjects
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return SubjectRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return SubjectRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return SubjectRepository.find_list_version(filters)
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting subjects with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return SubjectRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, subject_data: dict) -> Any:
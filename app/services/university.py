@@ -1,5 +1,7 @@
 import logging
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Iterator, Sequence, Tuple
+from datetime import datetime
+from django.conf import settings
 from django.db import transaction
 from app.repositories.university import UniversityRepository
 
@@ -30,9 +32,9 @@ class UniversityService:
         return created_university
 
     @staticmethod
-    def find_by_id(id: int) -> Optional[Any]:
+    def find_by_id(id: int, fields: Optional[Sequence[str]] = None) -> Optional[Any]:
         logger.info(f"Finding university with id: {id}")
-        university = UniversityRepository.find_by_id(id)
+        university = UniversityRepository.find_by_id(id, fields)
         if not university:
             logger.warning(f"University with id {id} not found")
         return university
@@ -52,6 +54,63 @@ class UniversityService:
         logger.info(f"Found {len(universities)} universities")
         return universities
 
+    @staticmethod
+    def find_page(
+        offset: int,
+        limit: int,
+        fields: Optional[Sequence[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Any]:
+        logger.info(f"Finding universities page (offset={offset}, limit={limit})")
+        universities = UniversityRepository.find_page(offset, limit, fields, filters)
+        logger.info(f"Found {len(universities)} universities")
+        return universities
+
+    @staticmethod
+    def find_page_values(
+        offset: int,
+        limit: int,
+        fields: Sequence[str],
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        logger.info(f"Finding universities page (offset={offset}, limit={limit})")
+        universities = UniversityRepository.find_page_values(
+            offset, limit, fields, filters
+        )
+        logger.info(f"Found {len(universities)} universities")
+        return universities
+
+    @staticmethod
+    def count(filters: Optional[Dict[str, Any]] = None) -> int:
+        return UniversityRepository.count(filters)
+
+    @staticmethod
+    def count_estimate(filters: Optional[Dict[str, Any]] = None) -> int:
+        exact_below = getattr(settings, "COUNT_ESTIMATE_THRESHOLD", 10000)
+        return UniversityRepository.count_estimate(exact_below, filters)
+
+    @staticmethod
+    def find_list_version(
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[datetime], int, Optional[int]]:
+        return UniversityRepository.find_list_version(filters)
+
+    @staticmethod
+    def find_tree(id: int) -> Optional[Any]:
+        logger.info(f"Finding hierarchy tree of university with id: {id}")
+        university = UniversityRepository.find_tree(id)
+        if not university:
+            logger.warning(f"University with id {id} not found")
+        return university
+
+    @staticmethod
+    def export(
+        fields: Sequence[str], filters: Dict[str, Any]
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"Exporting universities with filters: {filters}")
+        chunk_size = getattr(settings, "EXPORT_CHUNK_SIZE", 2000)
+        return UniversityRepository.iter_values(fields, filters, chunk_size)
+
     @staticmethod
     @transaction.atomic
     def update(id: int, university_data: dict) -> Any:
@@ -18,7 +18,9 @@ from app.views import (
     DedicationTypeViewSet,
     DocumentTypeViewSet,
     SpecialtyTypeViewSet,
+    CertificateJobViewSet,
     HomeView,
+    RenderStatsView,
 )
 
 router = DefaultRouter()
@@ -41,8 +43,10 @@ router.register(r"plan", PlanViewSet, basename="plan")
 router.register(r"dedication_type", DedicationTypeViewSet, basename="dedication_type")
 router.register(r"document_type", DocumentTypeViewSet, basename="document_type")
 router.register(r"speciality_type", SpecialtyTypeViewSet, basename="speciality_type")
+router.register(r"certificate_job", CertificateJobViewSet, basename="certificate_job")
 
 urlpatterns = [
     path("", HomeView.as_view(), name="home"),
+    path("api/v1/render_stats/", RenderStatsView.as_view(), name="render_stats"),
     path("api/v1/", include(router.urls)),
 ]
@@ -1 +1,24 @@
 from .document_generator import get_document_generator
+from .archive import stream_zip
+from .document_cache import DocumentCache
+from .hierarchy_cache import HierarchyCache
+from .render_limiter import RenderRejectedError, get_render_limiter, limit_stream
+from .renderer_pool import (
+    discard_batch_executor,
+    get_batch_executor,
+    get_batch_workers,
+)
+from .pagination import (
+    KeysetPagination,
+    PagedResult,
+    StandardPagination,
+    get_counter,
+    get_list_filters,
+)
+from .export import CSVRenderer, NDJSONRenderer, get_export_filters
+from .conditional import (
+    get_not_modified_response,
+    get_validators,
+    set_validators,
+    versioned_fields,
+)
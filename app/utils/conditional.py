@@ -0,0 +1,54 @@
+import datetime
+from typing import Any, Optional, Sequence, Tuple
+
+from django.http import HttpResponseBase
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from app.utils.document_cache import DocumentCache
+
+VERSION_FIELD = "updated_at"
+
+
+def versioned_fields(fields: Optional[Sequence[str]]) -> Optional[Sequence[str]]:
+    """A sparse fieldset plus ``updated_at``, which the validators are built from."""
+    if fields is None or VERSION_FIELD in fields:
+        return fields
+    return [*fields, VERSION_FIELD]
+
+
+def get_validators(
+    request, last_modified: Optional[datetime.datetime], *versions: Any
+) -> Tuple[str, Optional[int]]:
+    """ETag and Last-Modified timestamp of a response, without building it.
+
+    The ETag covers the absolute URL, so every page, fieldset and filter of
+    an endpoint gets its own, plus ``last_modified`` and any other value the
+    response depends on, such as the row count of a list.
+    """
+    key = DocumentCache.build_key(
+        request.build_absolute_uri(), last_modified, *versions
+    )
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return f'"{key}"', timestamp
+
+
+def set_validators(
+    response: HttpResponseBase, etag: str, last_modified: Optional[int]
+) -> HttpResponseBase:
+    response["ETag"] = etag
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    # Clients may store the response but must revalidate before reuse
+    patch_cache_control(response, no_cache=True)
+    return response
+
+
+def get_not_modified_response(
+    request, etag: str, last_modified: Optional[int]
+) -> Optional[HttpResponseBase]:
+    """A 304 response when the client copy is current, otherwise None."""
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return set_validators(response, etag, last_modified)
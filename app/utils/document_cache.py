@@ -0,0 +1,157 @@
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from io import BytesIO
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# Latest (mtime, hash) of each template, so files are only re-read on change
+_template_hashes: Dict[str, Tuple[float, str]] = {}
+
+# Seconds between two sweeps of expired documents made by put()
+PRUNE_INTERVAL = 3600
+
+_last_prune: Optional[float] = None
+_prune_lock = threading.Lock()
+
+
+class DocumentCache:
+    """Content-addressed on-disk store for rendered documents.
+
+    Keys include the printed date, so documents older than
+    ``CERTIFICATE_CACHE_MAX_AGE`` are never read again; ``put`` deletes
+    them at most once per ``PRUNE_INTERVAL``, and ``prune`` on demand.
+    """
+
+    @staticmethod
+    def get_cache_dir() -> Optional[str]:
+        cache_dir = getattr(settings, "CERTIFICATE_CACHE_DIR", None)
+        return str(cache_dir) if cache_dir else None
+
+    @staticmethod
+    def get_template_hash(template_path: str) -> str:
+        mtime = os.path.getmtime(template_path)
+        cached = _template_hashes.get(template_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(template_path, "rb") as f:
+            template_hash = hashlib.sha256(f.read()).hexdigest()
+        _template_hashes[template_path] = (mtime, template_hash)
+        return template_hash
+
+    @staticmethod
+    def build_key(*parts: Any) -> str:
+        return hashlib.sha256(
+            "|".join(str(part) for part in parts).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def get_path(key: str, extension: str) -> Optional[str]:
+        cache_dir = DocumentCache.get_cache_dir()
+        if not cache_dir:
+            return None
+        return os.path.join(cache_dir, key[:2], f"{key}.{extension}")
+
+    @staticmethod
+    def get(key: str, extension: str) -> Optional[BinaryIO]:
+        path = DocumentCache.get_path(key, extension)
+        if not path:
+            return None
+
+        try:
+            document = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        logger.info(f"Document cache hit: {path}")
+        return document
+
+    @staticmethod
+    def put(key: str, extension: str, document: BytesIO) -> BinaryIO:
+        path = DocumentCache.get_path(key, extension)
+        if not path:
+            return document
+
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+
+            # Write next to the final path and rename, so concurrent readers
+            # never see a partially written document.
+            fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(document.getbuffer())
+                os.replace(temp_path, path)
+            except Exception:
+                os.unlink(temp_path)
+                raise
+
+            logger.info(f"Document stored in cache: {path}")
+            DocumentCache._prune_if_due()
+            return open(path, "rb")
+
+        except OSError as e:
+            logger.warning(f"Failed to store document in cache {path}: {str(e)}")
+            document.seek(0)
+            return document
+
+    @staticmethod
+    def get_max_age() -> int:
+        return getattr(settings, "CERTIFICATE_CACHE_MAX_AGE", 86400)
+
+    @staticmethod
+    def prune(max_age: Optional[int] = None) -> int:
+        """Delete documents stored more than ``max_age`` seconds ago."""
+        cache_dir = DocumentCache.get_cache_dir()
+        if max_age is None:
+            max_age = DocumentCache.get_max_age()
+        if not cache_dir or max_age <= 0:
+            return 0
+
+        expires = time.time() - max_age
+        deleted = 0
+        for directory, _, filenames in os.walk(cache_dir):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    if os.path.getmtime(path) < expires:
+                        os.unlink(path)
+                        deleted += 1
+                except FileNotFoundError:
+                    # Deleted by another process meanwhile
+                    continue
+
+        logger.info(f"Pruned {deleted} expired documents from {cache_dir}")
+        return deleted
+
+    @staticmethod
+    def _prune_if_due() -> None:
+        global _last_prune
+
+        with _prune_lock:
+            now = time.monotonic()
+            if _last_prune is not None and now - _last_prune < PRUNE_INTERVAL:
+                return
+            _last_prune = now
+
+        try:
+            DocumentCache.prune()
+        except OSError as e:
+            logger.warning(f"Failed to prune document cache: {str(e)}")
+
+    @staticmethod
+    def get_sendfile_location(path: str) -> str:
+        prefix = getattr(settings, "CERTIFICATE_SENDFILE_PREFIX", "")
+        if not prefix:
+            return path
+
+        relative_path = os.path.relpath(path, DocumentCache.get_cache_dir())
+        return f"{prefix.rstrip('/')}/{relative_path.replace(os.sep, '/')}"
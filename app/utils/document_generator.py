@@ -1,96 +1,421 @@
+import copy
 import logging
+import mimetypes
 import os
-import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from io import BytesIO
-from typing import Dict, Optional
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+from urllib.parse import unquote, urlparse
 
 import jinja2
+from defusedxml.minidom import parseString
 from django.conf import settings
-from django.template.loader import render_to_string
+from django.template.loader import get_template, render_to_string
 from docxtpl import DocxTemplate
+from PIL import Image
 from python_odt_template import ODTTemplate
+from python_odt_template.jinja import UndefinedSilently, finalize_value
 from python_odt_template.jinja import get_odt_renderer
-from weasyprint import HTML
+from python_odt_template.renderer import ODTRenderer
+from weasyprint import HTML, default_url_fetcher
+
+from .render_limiter import RenderRejectedError, limit_render
+from .renderer_pool import get_renderer_pool
 
 logger = logging.getLogger(__name__)
 
+# Parsed templates and Jinja environments kept per process
+TEMPLATE_CACHE_SIZE = 16
+
+# Printed width, in pixels, of the images embedded in compact PDFs
+COMPACT_IMAGE_WIDTH = 304
+
+# WeasyPrint image caches, for regular and compact PDFs
+_image_caches: Dict[bool, Dict] = {False: {}, True: {}}
+
+
+@lru_cache(maxsize=None)
+def _load_static_assets() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """Read every file under app/static once per process."""
+    static_root = os.path.join(settings.BASE_DIR, "app", "static")
+    assets = {}
+
+    for directory, _, filenames in os.walk(static_root):
+        for filename in filenames:
+            path = os.path.join(directory, filename)
+            relative_path = os.path.relpath(path, static_root).replace(os.sep, "/")
+            with open(path, "rb") as f:
+                assets[relative_path] = (f.read(), mimetypes.guess_type(filename)[0])
+
+    logger.info(f"Loaded {len(assets)} static assets for document rendering")
+    return assets
+
+
+def _compact_image(data: bytes) -> bytes:
+    """Downsample an image to its printed width and recompress it as a palette PNG.
+
+    Certificates are printed on a white page, so transparency is flattened
+    onto white; this also spares the PDF a separate alpha mask per image.
+    """
+    with Image.open(BytesIO(data)) as image:
+        image.load()
+
+        if image.width > COMPACT_IMAGE_WIDTH:
+            height = round(image.height * COMPACT_IMAGE_WIDTH / image.width)
+            image = image.resize((COMPACT_IMAGE_WIDTH, height), Image.LANCZOS)
+
+        flattened = Image.new("RGB", image.size, (255, 255, 255))
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            flattened.paste(image, mask=image.getchannel("A"))
+        else:
+            flattened.paste(image.convert("RGB"))
+
+        compact_io = BytesIO()
+        flattened.quantize(colors=256).save(compact_io, "PNG", optimize=True)
+
+    compact = compact_io.getvalue()
+    return compact if len(compact) < len(data) else data
+
+
+@lru_cache(maxsize=None)
+def _load_compact_static_assets() -> Dict[str, Tuple[bytes, Optional[str]]]:
+    """Static assets with images optimized for compact PDFs, computed once per process."""
+    assets = {}
+
+    for relative_path, (data, mime_type) in _load_static_assets().items():
+        if mime_type in ("image/png", "image/jpeg", "image/gif"):
+            compact = _compact_image(data)
+            if compact is not data:
+                data, mime_type = compact, "image/png"
+        assets[relative_path] = (data, mime_type)
+
+    return assets
+
+
+def static_url_fetcher(url: str, *args, **kwargs) -> Dict:
+    """WeasyPrint url_fetcher serving static assets from memory.
+
+    Anything that is neither a known static asset nor a data: URL is rejected
+    immediately, so a render never blocks on filesystem or network I/O.
+    """
+    return _fetch_static_asset(_load_static_assets(), url, *args, **kwargs)
+
+
+def compact_static_url_fetcher(url: str, *args, **kwargs) -> Dict:
+    """Like static_url_fetcher, serving the optimized images of compact PDFs."""
+    return _fetch_static_asset(_load_compact_static_assets(), url, *args, **kwargs)
+
+
+def _fetch_static_asset(assets: Dict, url: str, *args, **kwargs) -> Dict:
+    if url.startswith("data:"):
+        return default_url_fetcher(url, *args, **kwargs)
+
+    static_prefix = "/" + getattr(settings, "STATIC_URL", "/static/").strip("/") + "/"
+    path = unquote(urlparse(url).path)
+
+    asset = None
+    if path.startswith(static_prefix):
+        asset = assets.get(path[len(static_prefix) :])
+
+    if asset is None:
+        logger.warning(f"Refusing to fetch unknown document asset: {url}")
+        raise ValueError(f"Unknown document asset: {url}")
+
+    string, mime_type = asset
+    return {"string": string, "mime_type": mime_type, "redirected_url": url}
+
+
+def write_pdf(html_string: str, target: BinaryIO, compact: bool = False) -> None:
+    """Lay out HTML with WeasyPrint and write the PDF into target.
+
+    Decoded images are kept in a per-process cache, one per image set, so
+    repeated renders do not decode the logos again.
+    """
+    base_url = getattr(settings, "STATIC_URL", "/static/")
+
+    if compact:
+        # Pre-optimized logos; fonts are already subset by default
+        HTML(
+            string=html_string,
+            base_url=base_url,
+            url_fetcher=compact_static_url_fetcher,
+        ).write_pdf(
+            target=target,
+            optimize_images=True,
+            cache=_image_caches[True],
+        )
+    else:
+        HTML(
+            string=html_string,
+            base_url=base_url,
+            url_fetcher=static_url_fetcher,
+        ).write_pdf(target=target, cache=_image_caches[False])
+
+
+def warm_up_pdf_renderer() -> None:
+    """Initialize fonts and load every static image into the renderer caches."""
+    images = "".join(
+        f'<img src="/static/{relative_path}">'
+        for relative_path, (_, mime_type) in _load_static_assets().items()
+        if mime_type and mime_type.startswith("image/")
+    )
+    html_string = (
+        f'<html><body style="font-family: sans-serif"><p>SysAcad</p>{images}'
+        "</body></html>"
+    )
+
+    for compact in (False, True):
+        write_pdf(html_string, BytesIO(), compact)
+
+    logger.info("PDF renderer warmed up")
+
+
+class _InMemoryODTTemplate(ODTTemplate):
+    """ODTTemplate that keeps the unpacked archive in memory.
+
+    The upstream class extracts the template into a temporary directory and
+    can only pack to a path; this one never touches the filesystem after
+    reading the template and packs into any writable stream.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.files: Dict[str, bytes] = {}
+        self.unpack()
+        self.content = parseString(self.read_file("content.xml"))
+        self.styles = parseString(self.read_file("styles.xml"))
+        self.manifest = parseString(self.read_file("META-INF/manifest.xml"))
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.files.clear()
+
+    def copy(self) -> "_InMemoryODTTemplate":
+        """Return an independent copy that can be rendered without re-parsing."""
+        clone = copy.copy(self)
+        clone.files = dict(self.files)
+        clone.content = self.content.cloneNode(True)
+        clone.styles = self.styles.cloneNode(True)
+        clone.manifest = self.manifest.cloneNode(True)
+        return clone
+
+    def write_file(self, name: str, content: str) -> None:
+        self.files[name] = content.encode("utf-8")
+
+    def read_file(self, name: str) -> str:
+        return self.files[name].decode("utf-8")
+
+    def add_image(self, filepath: Path, name: str) -> str:
+        mimetype = mimetypes.guess_type(filepath)[0] or ""
+        extension = filepath.suffix or mimetypes.guess_extension(mimetype)
+
+        media_path = f"Pictures/{name}{extension}"
+        self.files[media_path] = Path(filepath).read_bytes()
+
+        manifests = self.manifest.getElementsByTagName("manifest:manifest")[0]
+        media_node = self.manifest.createElement("manifest:file-entry")
+        manifests.appendChild(media_node)
+        media_node.setAttribute("manifest:full-path", media_path)
+        media_node.setAttribute("manifest:media-type", mimetype)
+        return media_path
+
+    def unpack(self) -> None:
+        with zipfile.ZipFile(self.file_path, "r") as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    self.files[info.filename] = archive.read(info)
+
+    def pack(self, target: BinaryIO) -> None:
+        # save any changes made to content.xml, styles.xml and manifest.xml
+        self.write_file("content.xml", self.content.toxml())
+        self.write_file("styles.xml", self.styles.toxml())
+        self.write_file("META-INF/manifest.xml", self.manifest.toxml())
+
+        with zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as archive:
+            # The mimetype entry must come first and uncompressed
+            if "mimetype" in self.files:
+                archive.writestr(
+                    "mimetype", self.files["mimetype"], compress_type=zipfile.ZIP_STORED
+                )
+
+            for name, data in self.files.items():
+                if name != "mimetype":
+                    archive.writestr(name, data)
+
+
+class _CachingEnvironment(jinja2.Environment):
+    """Jinja environment that reuses compiled templates for identical sources.
+
+    docxtpl and python-odt-template call from_string with the whole document
+    XML on every render; since the XML only changes with the template file,
+    the compiled result can be shared between renders.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._compiled: "OrderedDict[str, jinja2.Template]" = OrderedDict()
+        self._compiled_lock = threading.Lock()
+
+    def from_string(self, source, globals=None, template_class=None):
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals, template_class)
+
+        with self._compiled_lock:
+            compiled = self._compiled.get(source)
+            if compiled is not None:
+                self._compiled.move_to_end(source)
+                return compiled
+
+        compiled = super().from_string(source)
+
+        with self._compiled_lock:
+            self._compiled[source] = compiled
+            if len(self._compiled) > TEMPLATE_CACHE_SIZE:
+                self._compiled.popitem(last=False)
+
+        return compiled
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_odt_template(template_path: str, mtime: float) -> _InMemoryODTTemplate:
+    logger.info(f"Parsing ODT template: {template_path}")
+    return _InMemoryODTTemplate(template_path)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_odt_renderer(template_path: str, mtime: float, media_path: str) -> ODTRenderer:
+    env = _CachingEnvironment(
+        undefined=UndefinedSilently, autoescape=True, finalize=finalize_value
+    )
+    return get_odt_renderer(media_path=media_path, env=env)
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _load_docx_template(template_path: str, mtime: float) -> Any:
+    logger.info(f"Parsing DOCX template: {template_path}")
+    return DocxTemplate(template_path).get_docx()
+
+
+@lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def _get_docx_environment(template_path: str, mtime: float) -> jinja2.Environment:
+    return _CachingEnvironment()
+
 
 class Document(ABC):
+    extension: str = ""
+    content_type: str = "application/octet-stream"
+
+    @staticmethod
+    @abstractmethod
+    def generate(
+        folder: str, template: str, context: Dict, output: Optional[BinaryIO] = None
+    ) -> BinaryIO:
+        pass
+
     @staticmethod
     @abstractmethod
-    def generate(folder: str, template: str, context: Dict) -> BytesIO:
+    def get_template_path(folder: str, template: str) -> str:
         pass
 
 
 class PDFDocument(Document):
+    extension = "pdf"
+    content_type = "application/pdf"
+
+    @staticmethod
+    def get_template_path(folder: str, template: str) -> str:
+        return get_template(f"{folder}/{template}.html").origin.name
+
     @staticmethod
-    def generate(folder: str, template: str, context: Dict) -> BytesIO:
+    @limit_render
+    def generate(
+        folder: str,
+        template: str,
+        context: Dict,
+        output: Optional[BinaryIO] = None,
+        compact: Optional[bool] = None,
+    ) -> BinaryIO:
         logger.info(f"Generating PDF document from template: {folder}/{template}.html")
 
+        if compact is None:
+            compact = getattr(settings, "CERTIFICATE_PDF_COMPACT", False)
+
         try:
             # Render HTML template
             template_path = f"{folder}/{template}.html"
             html_string = render_to_string(template_path, context=context)
 
-            # Generate PDF
-            base_url = getattr(settings, "STATIC_URL", "/static/")
-            bytes_data = HTML(string=html_string, base_url=base_url).write_pdf()
-
-            pdf_io = BytesIO(bytes_data)
-            pdf_io.seek(0)
-
-            logger.info(f"PDF document generated successfully: {len(bytes_data)} bytes")
+            renderer_pool = get_renderer_pool()
+            if renderer_pool is not None:
+                # Lay out in a warm renderer process, off the request process
+                pdf_data = renderer_pool.render(html_string, compact)
+                if output is not None:
+                    output.write(pdf_data)
+                    pdf_io = output
+                else:
+                    pdf_io = BytesIO(pdf_data)
+            else:
+                # Generate PDF straight into the output stream
+                pdf_io = output if output is not None else BytesIO()
+                write_pdf(html_string, pdf_io, compact)
+
+            logger.info("PDF document generated successfully")
+            if output is None:
+                pdf_io.seek(0)
             return pdf_io
 
+        except RenderRejectedError:
+            raise
         except Exception as e:
             logger.error(f"Failed to generate PDF from {template_path}: {str(e)}")
             raise ValueError(f"PDF generation failed: {str(e)}") from e
 
 
 class ODTDocument(Document):
+    extension = "odt"
+    content_type = "application/vnd.oasis.opendocument.text"
+
+    @staticmethod
+    def get_template_path(folder: str, template: str) -> str:
+        return os.path.join(
+            settings.BASE_DIR, "app", "templates", folder, f"{template}.odt"
+        )
+
     @staticmethod
-    def generate(folder: str, template: str, context: Dict) -> BytesIO:
+    @limit_render
+    def generate(
+        folder: str, template: str, context: Dict, output: Optional[BinaryIO] = None
+    ) -> BinaryIO:
         logger.info(f"Generating ODT document from template: {folder}/{template}.odt")
 
         try:
             # Validate template path
-            template_path = os.path.join(
-                settings.BASE_DIR, "app", folder, f"{template}.odt"
-            )
+            template_path = ODTDocument.get_template_path(folder, template)
 
             if not os.path.exists(template_path):
                 logger.error(f"ODT template not found: {template_path}")
                 raise FileNotFoundError(f"Template not found: {template_path}")
 
-            # Setup renderer
-            media_path = getattr(settings, "MEDIA_ROOT", "media")
-            odt_renderer = get_odt_renderer(media_path=media_path)
+            # Setup renderer, reusing the parsed template and compiled Jinja code
+            mtime = os.path.getmtime(template_path)
+            media_path = str(getattr(settings, "MEDIA_ROOT", "media"))
+            odt_renderer = _get_odt_renderer(template_path, mtime, media_path)
 
-            # Generate ODT in temporary file
-            odt_io = BytesIO()
-
-            with tempfile.NamedTemporaryFile(suffix=".odt", delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            try:
-                with ODTTemplate(template_path) as odt_template:
-                    odt_renderer.render(odt_template, context=context)
-                    odt_template.pack(temp_path)
-
-                    with open(temp_path, "rb") as f:
-                        odt_io.write(f.read())
-
-                logger.info(
-                    f"ODT document generated successfully: {odt_io.tell()} bytes"
-                )
+            # Render and pack ODT straight into the output stream
+            odt_io = output if output is not None else BytesIO()
 
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            with _load_odt_template(template_path, mtime).copy() as odt_template:
+                odt_renderer.render(odt_template, context=context)
+                odt_template.pack(odt_io)
 
-            odt_io.seek(0)
+            logger.info("ODT document generated successfully")
+            if output is None:
+                odt_io.seek(0)
             return odt_io
 
         except FileNotFoundError:
@@ -101,48 +426,46 @@ class ODTDocument(Document):
 
 
 class DOCXDocument(Document):
+    extension = "docx"
+    content_type = (
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    )
+
+    @staticmethod
+    def get_template_path(folder: str, template: str) -> str:
+        return os.path.join(
+            settings.BASE_DIR, "app", "templates", folder, f"{template}.docx"
+        )
+
     @staticmethod
-    def generate(folder: str, template: str, context: Dict) -> BytesIO:
+    @limit_render
+    def generate(
+        folder: str, template: str, context: Dict, output: Optional[BinaryIO] = None
+    ) -> BinaryIO:
         logger.info(f"Generating DOCX document from template: {folder}/{template}.docx")
 
         try:
             # Validate template path
-            template_path = os.path.join(
-                settings.BASE_DIR, "app", folder, f"{template}.docx"
-            )
+            template_path = DOCXDocument.get_template_path(folder, template)
 
             if not os.path.exists(template_path):
                 logger.error(f"DOCX template not found: {template_path}")
                 raise FileNotFoundError(f"Template not found: {template_path}")
 
-            # Load template
+            # Load template from a copy of the cached parsed document
+            mtime = os.path.getmtime(template_path)
             doc = DocxTemplate(template_path)
+            doc.docx = copy.deepcopy(_load_docx_template(template_path, mtime))
 
-            # Generate DOCX in temporary file
-            docx_io = BytesIO()
-
-            with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as temp_file:
-                temp_path = temp_file.name
-
-            try:
-                # Render with Jinja2
-                jinja_env = jinja2.Environment()
-                doc.render(context, jinja_env)
-                doc.save(temp_path)
-
-                with open(temp_path, "rb") as f:
-                    docx_io.write(f.read())
-
-                logger.info(
-                    f"DOCX document generated successfully: {docx_io.tell()} bytes"
-                )
-
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_path):
-                    os.unlink(temp_path)
+            # Render with Jinja2 and save straight into the output stream
+            docx_io = output if output is not None else BytesIO()
+            jinja_env = _get_docx_environment(template_path, mtime)
+            doc.render(context, jinja_env)
+            doc.save(docx_io)
 
-            docx_io.seek(0)
+            logger.info("DOCX document generated successfully")
+            if output is None:
+                docx_io.seek(0)
             return docx_io
 
         except FileNotFoundError:
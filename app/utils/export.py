@@ -0,0 +1,103 @@
+import csv
+import datetime
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Sequence
+
+from django.utils import timezone
+from rest_framework.renderers import BaseRenderer
+from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
+
+# Rows buffered before a chunk is handed to the response
+EXPORT_FLUSH_ROWS = 500
+
+_encoder = JSONEncoder()
+
+
+def _format_value(value: Any) -> Any:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        # Serializers render datetimes in the current time zone
+        value = timezone.localtime(value)
+    # Dates, times, decimals and UUIDs are formatted the way the API returns them
+    return _encoder.default(value)
+
+
+def get_export_filters(request) -> Dict[str, str]:
+    """Query parameters of an export request, minus format and fields."""
+    return {
+        name: value
+        for name, value in request.query_params.items()
+        if name not in (api_settings.URL_FORMAT_OVERRIDE, "fields")
+    }
+
+
+def _as_rows(data: Any) -> List[Dict[str, Any]]:
+    if data is None:
+        return []
+    if isinstance(data, dict):
+        return [data]
+    return list(data)
+
+
+class CSVRenderer(BaseRenderer):
+    """Renders rows as CSV, either all at once or streamed chunk by chunk."""
+
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def stream(
+        self, fields: Sequence[str], rows: Iterable[Dict[str, Any]]
+    ) -> Iterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(fields)
+
+        for count, row in enumerate(rows, start=1):
+            writer.writerow([_format_value(row[f]) for f in fields])
+            if count % EXPORT_FLUSH_ROWS == 0:
+                yield buffer.getvalue().encode(self.charset)
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue().encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = _as_rows(data)
+        fields = list(rows[0]) if rows else []
+        return b"".join(self.stream(fields, rows))
+
+
+class NDJSONRenderer(BaseRenderer):
+    """Renders rows as newline-delimited JSON, one object per line."""
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def stream(
+        self, fields: Sequence[str], rows: Iterable[Dict[str, Any]]
+    ) -> Iterator[bytes]:
+        lines = []
+        for count, row in enumerate(rows, start=1):
+            lines.append(
+                json.dumps(
+                    {f: _format_value(row[f]) for f in fields},
+                    ensure_ascii=False,
+                    separators=(",", ":"),
+                )
+            )
+            if count % EXPORT_FLUSH_ROWS == 0:
+                yield ("\n".join(lines) + "\n").encode(self.charset)
+                lines = []
+
+        if lines:
+            yield ("\n".join(lines) + "\n").encode(self.charset)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        rows = _as_rows(data)
+        fields = list(rows[0]) if rows else []
+        return b"".join(self.stream(fields, rows))
@@ -0,0 +1,107 @@
+import time
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import connections, transaction
+from django.db.models.signals import post_delete, post_save
+
+TREE_VERSION_KEY = "university-tree:version"
+STUDENTS_VERSION_KEY = "university-tree:students-version"
+
+
+class HierarchyCache:
+    """Django cache of the serialized university hierarchy trees.
+
+    Tree keys embed version counters kept in the same cache. Saving or
+    deleting a university, faculty, specialty or specialty type bumps the
+    tree version, and student writes bump the version of the trees with
+    student counts, so stale trees are simply never read again. Writes that
+    skip model signals, such as ``bulk_create``, must call ``invalidate``.
+
+    Invalidations only reach other processes through a shared cache. With
+    local memory, trees and counters are kept for at most
+    ``UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT`` seconds instead.
+    """
+
+    @staticmethod
+    def get_cache():
+        return caches[getattr(settings, "UNIVERSITY_TREE_CACHE_ALIAS", "default")]
+
+    @staticmethod
+    def is_shared() -> bool:
+        return not isinstance(HierarchyCache.get_cache(), LocMemCache)
+
+    @staticmethod
+    def get_timeout() -> int:
+        timeout = getattr(settings, "UNIVERSITY_TREE_CACHE_TIMEOUT", 3600)
+        if HierarchyCache.is_shared():
+            return timeout
+        local_timeout = getattr(settings, "UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT", 5)
+        return min(timeout, local_timeout)
+
+    @staticmethod
+    def get_version(version_key: str) -> int:
+        cache = HierarchyCache.get_cache()
+        version = cache.get(version_key)
+        if version is None:
+            # A fresh counter never matches a tree stored before an eviction.
+            # Local counters expire with the trees, so every process picks up
+            # the writes of the others within the local timeout.
+            fresh = time.time_ns()
+            timeout = (
+                None if HierarchyCache.is_shared() else HierarchyCache.get_timeout()
+            )
+            cache.add(version_key, fresh, timeout)
+            version = cache.get(version_key, fresh)
+        return version
+
+    @staticmethod
+    def get_key(university_id: int, student_counts: bool = False) -> str:
+        parts = [university_id, HierarchyCache.get_version(TREE_VERSION_KEY)]
+        if student_counts:
+            parts.append(HierarchyCache.get_version(STUDENTS_VERSION_KEY))
+        return "university-tree:" + ":".join(str(part) for part in parts)
+
+    @staticmethod
+    def get(key: str) -> Optional[Dict[str, Any]]:
+        if HierarchyCache.get_timeout() <= 0:
+            return None
+        return HierarchyCache.get_cache().get(key)
+
+    @staticmethod
+    def set(key: str, tree: Dict[str, Any]) -> None:
+        timeout = HierarchyCache.get_timeout()
+        if timeout > 0:
+            HierarchyCache.get_cache().set(key, tree, timeout)
+
+    @staticmethod
+    def invalidate(students: bool = False) -> None:
+        """Drop every tree, or only the trees with student counts."""
+        version_key = STUDENTS_VERSION_KEY if students else TREE_VERSION_KEY
+        try:
+            HierarchyCache.get_cache().incr(version_key)
+        except ValueError:
+            # No counter yet, the next read starts a fresh one
+            pass
+
+    @staticmethod
+    def connect_signals() -> None:
+        from app.models import Faculty, Specialty, SpecialtyType, Student, University
+
+        for model in (University, Faculty, Specialty, SpecialtyType, Student):
+            post_save.connect(
+                _invalidate_on_write, sender=model, dispatch_uid=f"tree:{model}"
+            )
+            post_delete.connect(
+                _invalidate_on_write, sender=model, dispatch_uid=f"tree:{model}"
+            )
+
+
+def _invalidate_on_write(sender, using: str, **kwargs) -> None:
+    students = sender._meta.model_name == "student"
+    HierarchyCache.invalidate(students)
+    if connections[using].in_atomic_block:
+        # Drop trees other requests built before the commit, too
+        transaction.on_commit(lambda: HierarchyCache.invalidate(students), using=using)
@@ -0,0 +1,194 @@
+import json
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from django.conf import settings
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.pagination import Cursor, CursorPagination, PageNumberPagination
+from rest_framework.response import Response
+
+from app.utils.export import get_export_filters
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+COUNT_QUERY_PARAM = "count"
+
+
+class PagedResult:
+    """Lazy sequence over a repository page finder.
+
+    Paginators only call ``count()`` and slice the object list, so wrapping
+    ``find_page``/``count`` lets them push LIMIT/OFFSET down to the database
+    instead of loading the whole table.
+    """
+
+    def __init__(
+        self,
+        find_page: Callable[[int, int], List[Any]],
+        count: Callable[[], int],
+    ):
+        self._find_page = find_page
+        self._count = count
+        self._total: Optional[int] = None
+
+    def count(self) -> int:
+        if self._total is None:
+            self._total = self._count()
+        return self._total
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            items = self[index : index + 1]
+            if not items:
+                raise IndexError("PagedResult index out of range")
+            return items[0]
+
+        if index.step not in (None, 1):
+            raise ValueError("PagedResult does not support slice steps")
+
+        offset = index.start or 0
+        stop = self.count() if index.stop is None else index.stop
+        if offset < 0 or stop < 0:
+            raise ValueError("PagedResult does not support negative indexing")
+
+        limit = stop - offset
+        if limit <= 0:
+            return []
+        return self._find_page(offset, limit)
+
+
+class StandardPagination(PageNumberPagination):
+    """Page number pagination with a client-selectable, capped page size.
+
+    The total count is also sent in the ``X-Total-Count`` header.
+    """
+
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self) -> int:
+        return getattr(settings, "API_MAX_PAGE_SIZE", 1000)
+
+    def get_paginated_response(self, data) -> Response:
+        response = super().get_paginated_response(data)
+        response[TOTAL_COUNT_HEADER] = str(self.page.paginator.count)
+        return response
+
+    def get_count_response(self, count: int) -> Response:
+        """Body-less response carrying only the total count, for HEAD requests."""
+        return Response(headers={TOTAL_COUNT_HEADER: str(count)})
+
+
+class KeysetPagination(CursorPagination):
+    """Cursor pagination over a keyset page finder.
+
+    ``paginate_queryset`` takes ``find_after(position, limit, reverse)``
+    instead of a queryset; it may return instances or ``values()`` rows.
+    Pages are fetched with ``WHERE key > position`` on the full ``ordering``
+    key, so deep pages cost the same as the first one. Cursors carry the key
+    of the boundary row and stay opaque to clients; an empty ``cursor``
+    parameter requests the first page.
+    """
+
+    ordering: Sequence[str] = ("id",)
+    page_size_query_param = "page_size"
+
+    @property
+    def max_page_size(self) -> int:
+        return getattr(settings, "API_MAX_PAGE_SIZE", 1000)
+
+    def paginate_queryset(
+        self,
+        find_after: Callable[[Optional[Tuple], int, bool], List[Any]],
+        request,
+        view=None,
+    ) -> Optional[List[Any]]:
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.position = None
+        self.reverse = False
+        if request.query_params.get(self.cursor_query_param):
+            cursor = self.decode_cursor(request)
+            self.position = self._decode_position(cursor.position)
+            self.reverse = cursor.reverse
+
+        # One extra row tells whether another page follows in this direction
+        rows = list(find_after(self.position, self.page_size + 1, self.reverse))
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size]
+
+        if self.reverse:
+            self.page.reverse()
+            self.has_next = True
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        return self.page
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self._encode_position(self.page[-1], reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self._encode_position(self.page[0], reverse=True)
+
+    def _encode_position(self, instance: Any, reverse: bool) -> str:
+        if isinstance(instance, dict):
+            position = [instance[field] for field in self.ordering]
+        else:
+            position = [getattr(instance, field) for field in self.ordering]
+        return self.encode_cursor(
+            Cursor(offset=0, reverse=reverse, position=json.dumps(position))
+        )
+
+    def _decode_position(self, position: Optional[str]) -> Tuple:
+        try:
+            values = json.loads(position)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        return tuple(values)
+
+
+def get_list_filters(request) -> Dict[str, str]:
+    """Query parameters of a list request, minus paging, format and fields."""
+    paging = {
+        StandardPagination.page_query_param,
+        StandardPagination.page_size_query_param,
+        KeysetPagination.cursor_query_param,
+        COUNT_QUERY_PARAM,
+    }
+    return {
+        name: value
+        for name, value in get_export_filters(request).items()
+        if name not in paging
+    }
+
+
+def get_counter(
+    request, count: Callable[..., int], count_estimate: Callable[..., int]
+) -> Callable[..., int]:
+    """The counter a list request asks for with ``?count=exact|estimate``.
+
+    HEAD requests only fetch the total, typically for dashboards, so they
+    default to the planner estimate; GET requests default to an exact count.
+    """
+    default = "estimate" if request.method == "HEAD" else "exact"
+    mode = request.query_params.get(COUNT_QUERY_PARAM) or default
+    if mode == "exact":
+        return count
+    if mode == "estimate":
+        return count_estimate
+    raise ValidationError({COUNT_QUERY_PARAM: "Must be 'exact' or 'estimate'."})
@@ -0,0 +1,194 @@
+import functools
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_limiter: Optional["RenderLimiter"] = None
+_limiter_lock = threading.Lock()
+
+
+class RenderRejectedError(Exception):
+    """Raised when a render cannot be admitted within the configured limits."""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RenderLimiter:
+    """Per-process admission control for document renders.
+
+    At most ``concurrency`` renders run at once. Up to ``queue_depth`` more
+    wait for a slot for at most ``timeout`` seconds; anything beyond that is
+    rejected straight away instead of piling up.
+    """
+
+    def __init__(self, concurrency: int, queue_depth: int, timeout: float):
+        self.concurrency = concurrency
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self.retry_after = max(1, math.ceil(timeout))
+
+        self._semaphore = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._waiting = 0
+        self._admitted = 0
+        self._queued = 0
+        self._rejected_queue_full = 0
+        self._rejected_timeout = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @contextmanager
+    def slot(self, count: int = 1) -> Iterator[None]:
+        release = self.acquire(count)
+        try:
+            yield
+        finally:
+            release()
+
+    def acquire(self, count: int = 1) -> Callable[[], None]:
+        """Take ``count`` slots, at most ``concurrency``, and return their release.
+
+        Slots already taken are given back when a later one is rejected.
+        """
+        count = min(count, self.concurrency)
+        if count <= 0:
+            return lambda: None
+
+        acquired = 0
+        try:
+            while acquired < count:
+                # Take a free slot straight away; only queue when all are busy
+                if not self._semaphore.acquire(blocking=False):
+                    self._wait_for_slot()
+                acquired += 1
+        except RenderRejectedError:
+            for _ in range(acquired):
+                self._semaphore.release()
+            raise
+
+        with self._lock:
+            self._admitted += 1
+            self._in_flight += count
+
+        def release() -> None:
+            with self._lock:
+                self._in_flight -= count
+            for _ in range(count):
+                self._semaphore.release()
+
+        return release
+
+    def _wait_for_slot(self) -> None:
+        with self._lock:
+            if self._waiting >= self.queue_depth:
+                self._rejected_queue_full += 1
+                logger.warning("Render rejected: queue is full")
+                raise RenderRejectedError(
+                    "Certificate rendering is busy, try again later",
+                    self.retry_after,
+                )
+            self._waiting += 1
+            self._queued += 1
+
+        start = time.monotonic()
+        acquired = self._semaphore.acquire(timeout=self.timeout)
+        waited = time.monotonic() - start
+
+        with self._lock:
+            self._waiting -= 1
+            self._wait_seconds_total += waited
+            self._wait_seconds_max = max(self._wait_seconds_max, waited)
+
+            if not acquired:
+                self._rejected_timeout += 1
+                logger.warning(f"Render rejected: no slot after {waited:.2f}s")
+                raise RenderRejectedError(
+                    "Certificate rendering is busy, try again later",
+                    self.retry_after,
+                )
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "concurrency": self.concurrency,
+                "queue_depth": self.queue_depth,
+                "timeout": self.timeout,
+                "in_flight": self._in_flight,
+                "waiting": self._waiting,
+                "admitted": self._admitted,
+                "queued": self._queued,
+                "rejected_queue_full": self._rejected_queue_full,
+                "rejected_timeout": self._rejected_timeout,
+                "wait_seconds_total": round(self._wait_seconds_total, 6),
+                "wait_seconds_max": round(self._wait_seconds_max, 6),
+            }
+
+
+def get_render_limiter() -> RenderLimiter:
+    global _limiter
+
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = RenderLimiter(
+                concurrency=getattr(settings, "CERTIFICATE_RENDER_CONCURRENCY", 2),
+                queue_depth=getattr(settings, "CERTIFICATE_RENDER_QUEUE_DEPTH", 8),
+                timeout=getattr(settings, "CERTIFICATE_RENDER_TIMEOUT", 10.0),
+            )
+        return _limiter
+
+
+def limit_render(func: Callable) -> Callable:
+    """Run the decorated render inside a slot of the process render limiter."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with get_render_limiter().slot():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+def limit_stream(chunks: Iterable, count: int) -> Iterator:
+    """Admit a streamed render now, holding ``count`` slots until it ends.
+
+    Rejections are raised here, before the response starts. The slots are
+    released once the stream is exhausted, fails or is closed by the server.
+    """
+    return _LimitedStream(iter(chunks), get_render_limiter().acquire(count))
+
+
+class _LimitedStream:
+    def __init__(self, chunks: Iterator, release: Callable[[], None]):
+        self._chunks = chunks
+        self._release: Optional[Callable[[], None]] = release
+
+    def __iter__(self) -> "_LimitedStream":
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._chunks)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        release, self._release = self._release, None
+        if release is None:
+            return
+        try:
+            close = getattr(self._chunks, "close", None)
+            if close is not None:
+                close()
+        finally:
+            release()
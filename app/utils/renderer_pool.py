@@ -0,0 +1,201 @@
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Optional, Tuple
+
+import django
+from django.conf import settings
+
+from .render_limiter import RenderRejectedError
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_pool: Optional["RendererPool"] = None
+_batch_executor: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Seconds clients are asked to wait while a broken pool is replaced
+UNAVAILABLE_RETRY_AFTER = 5
+
+
+class RendererUnavailableError(RenderRejectedError):
+    """Raised when the renderer pool broke again after being replaced."""
+
+
+def get_peak_rss() -> Optional[int]:
+    """Peak resident set size of the current process, in bytes."""
+    if resource is None:
+        return None
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and in bytes on macOS
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _init_worker() -> None:
+    django.setup()
+
+    from app.utils.document_generator import warm_up_pdf_renderer
+
+    warm_up_pdf_renderer()
+
+
+def _render(html_string: str, compact: bool) -> Tuple[bytes, Optional[int]]:
+    from app.utils.document_generator import write_pdf
+
+    pdf_io = BytesIO()
+    write_pdf(html_string, pdf_io, compact)
+    return pdf_io.getvalue(), get_peak_rss()
+
+
+class RendererPool:
+    """Long-lived WeasyPrint worker processes.
+
+    Workers are spawned once, warm up fonts and images, and are replaced
+    after ``max_renders`` renders. Once a worker reports more than
+    ``max_rss`` bytes, the whole pool is swapped for a fresh one; renders
+    already running on the old pool are allowed to finish. A render whose
+    pool broke is retried once on a fresh pool.
+    """
+
+    def __init__(
+        self, workers: int, max_renders: Optional[int], max_rss: Optional[int]
+    ):
+        self.workers = workers
+        self.max_renders = max_renders
+        self.max_rss = max_rss
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.RLock()
+
+    def render(self, html_string: str, compact: bool = False) -> bytes:
+        for _ in range(2):
+            executor, future = self._submit(html_string, compact)
+            try:
+                pdf_data, rss = future.result()
+            except BrokenProcessPool:
+                logger.error("PDF renderer pool broke, replacing it")
+                self._recycle(executor)
+                continue
+
+            if self.max_rss and rss and rss > self.max_rss:
+                logger.info(f"PDF renderer reached {rss} bytes RSS, recycling pool")
+                self._recycle(executor)
+
+            return pdf_data
+
+        raise RendererUnavailableError(
+            "PDF renderer is unavailable, try again later", UNAVAILABLE_RETRY_AFTER
+        )
+
+    def _submit(
+        self, html_string: str, compact: bool
+    ) -> Tuple[ProcessPoolExecutor, Future]:
+        # Under the lock, so a recycle cannot shut the executor down in between
+        with self._lock:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_render, html_string, compact)
+            except BrokenProcessPool as e:
+                future = Future()
+                future.set_exception(e)
+            return executor, future
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    max_tasks_per_child=self.max_renders,
+                )
+                logger.info(f"Started PDF renderer pool with {self.workers} workers")
+            return self._executor
+
+    def _recycle(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False)
+
+
+def get_renderer_pool() -> Optional[RendererPool]:
+    """The process renderer pool, or None when PDFs are rendered in-process.
+
+    Processes started by multiprocessing (renderer and batch workers) always
+    render in-process, so pools are never nested.
+    """
+    global _pool
+
+    workers = getattr(settings, "CERTIFICATE_RENDERER_WORKERS", 0)
+    if not workers or multiprocessing.parent_process() is not None:
+        return None
+
+    with _pool_lock:
+        if _pool is None:
+            max_rss_mb = getattr(settings, "CERTIFICATE_RENDERER_MAX_RSS_MB", 0)
+            _pool = RendererPool(
+                workers=workers,
+                max_renders=getattr(settings, "CERTIFICATE_RENDERER_MAX_RENDERS", 0)
+                or None,
+                max_rss=max_rss_mb * 1024 * 1024 or None,
+            )
+        return _pool
+
+
+def get_batch_workers() -> int:
+    return getattr(settings, "CERTIFICATE_BATCH_WORKERS", None) or os.cpu_count() or 1
+
+
+def get_batch_executor() -> ProcessPoolExecutor:
+    """The process-wide pool rendering batch certificate archives.
+
+    Every archive request shares it, so no more than ``get_batch_workers()``
+    batch renders run at once. Workers are spawned rather than forked from
+    the threaded server.
+    """
+    global _batch_executor
+
+    with _pool_lock:
+        if _batch_executor is None:
+            workers = get_batch_workers()
+            _batch_executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+            logger.info(f"Started batch certificate pool with {workers} workers")
+        return _batch_executor
+
+
+def discard_batch_executor(executor: ProcessPoolExecutor) -> None:
+    """Replace a broken batch pool; the next archive starts a fresh one."""
+    global _batch_executor
+
+    with _pool_lock:
+        if _batch_executor is executor:
+            _batch_executor = None
+    executor.shutdown(wait=False)
+
+
+def _forget_pools() -> None:
+    global _pool, _batch_executor, _pool_lock
+
+    # Pool threads do not survive a fork; the child starts its own pools
+    _pool = None
+    _batch_executor = None
+    _pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_pools)
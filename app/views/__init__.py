@@ -15,7 +15,9 @@ from .plan import PlanViewSet
 from .dedication_type import DedicationTypeViewSet
 from .document_type import DocumentTypeViewSet
 from .specialty_type import SpecialtyTypeViewSet
+from .certificate_job import CertificateJobViewSet
 from .home import HomeView
+from .render_stats import RenderStatsView
 
 __all__ = [
     "UniversityViewSet",
@@ -35,5 +37,7 @@ __all__ = [
     "DedicationTypeViewSet",
     "DocumentTypeViewSet",
     "SpecialtyTypeViewSet",
+    "CertificateJobViewSet",
     "HomeView",
+    "RenderStatsView",
 ]
@@ -0,0 +1,100 @@
+import logging
+import os
+from rest_framework import viewsets, status
+from rest_framework.response import Response
+from rest_framework.decorators import action
+from django.http import FileResponse
+from app.models import CertificateJob
+from app.serializers import CertificateJobSerializer
+from app.services import CertificateJobService
+from app.utils import get_document_generator
+
+logger = logging.getLogger(__name__)
+
+
+class CertificateJobViewSet(viewsets.ViewSet):
+    serializer_class = CertificateJobSerializer
+
+    def retrieve(self, request, pk=None):
+        try:
+            job = CertificateJobService.find_by_id(int(pk))
+            if job is None:
+                return Response(
+                    {"error": "Certificate job not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            serializer = self.serializer_class(job)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error retrieving certificate job {pk}: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def create(self, request):
+        """
+        Enqueue a certificate render.
+        Usage: POST /api/v1/certificate_job/ {"student_id": 1, "document_type": "pdf"}
+        """
+        try:
+            serializer = self.serializer_class(data=request.data)
+            if not serializer.is_valid():
+                return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+            job = CertificateJobService.create(
+                serializer.validated_data["student_id"],
+                serializer.validated_data["document_type"],
+            )
+            response_serializer = self.serializer_class(job)
+            return Response(response_serializer.data, status=status.HTTP_202_ACCEPTED)
+        except ValueError as e:
+            logger.error(f"Error creating certificate job: {str(e)}")
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error creating certificate job: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=True, methods=["get"], url_path="download")
+    def download(self, request, pk=None):
+        """
+        Download the certificate rendered by a finished job.
+        Usage: GET /api/v1/certificate_job/{id}/download/
+        """
+        try:
+            job = CertificateJobService.find_by_id(int(pk))
+            if job is None:
+                return Response(
+                    {"error": "Certificate job not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+
+            if job.status != CertificateJob.STATUS_DONE:
+                return Response(
+                    {"error": f"Certificate job is {job.status}", "status": job.status},
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            return FileResponse(
+                job.result.open("rb"),
+                as_attachment=True,
+                filename=os.path.basename(job.result.name),
+                content_type=get_document_generator(job.document_type).content_type,
+            )
+        except ValueError:
+            return Response(
+                {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error(f"Error downloading certificate job {pk}: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
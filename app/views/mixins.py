@@ -0,0 +1,126 @@
+import logging
+from functools import partial
+from typing import Any, Callable, List, Tuple
+from rest_framework import status
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.decorators import action
+from django.http import StreamingHttpResponse
+from app.utils import PagedResult, StandardPagination, get_counter, get_list_filters
+from app.utils import get_not_modified_response, get_validators, set_validators
+from app.utils import CSVRenderer, NDJSONRenderer, get_export_filters
+
+logger = logging.getLogger(__name__)
+
+
+class PaginatedListMixin:
+    """Paginated ``list`` built from the ViewSet's ``service`` class attribute.
+
+    The service provides ``count``, ``count_estimate``, ``find_list_version``
+    and ``find_page_values``; ``resource_name`` names the entities in logs.
+    ``find_list_version`` returns the latest ``updated_at`` followed by the
+    exact row count, which also serves as the total of ``?count=exact``, and
+    any further values the list depends on.
+    """
+
+    service: Any = None
+    resource_name: str = ""
+    pagination_class = StandardPagination
+
+    def list(self, request):
+        try:
+            fields = self.serializer_class.get_requested_fields(request)
+            filters = get_list_filters(request)
+            counter = get_counter(
+                request, self.service.count, self.service.count_estimate
+            )
+            if request.method == "HEAD":
+                return self.pagination_class().get_count_response(counter(filters))
+            last_modified, *version = self.service.find_list_version(filters)
+            # The version already holds the exact count; estimates run once here
+            if counter is self.service.count:
+                total = version[0]
+            else:
+                total = counter(filters)
+            etag, last_modified = get_validators(
+                request, last_modified, *version, total
+            )
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            encoder = self.serializer_class.get_row_encoder(fields)
+            paginator, rows = self.paginate_rows(
+                request, encoder.sources, filters, lambda: total
+            )
+            response = paginator.get_paginated_response(encoder.encode_many(rows))
+            return set_validators(response, etag, last_modified)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+        except NotFound as e:
+            return Response({"error": str(e.detail)}, status=status.HTTP_404_NOT_FOUND)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error listing {self.resource_name}: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    def paginate_rows(
+        self,
+        request,
+        sources: List[str],
+        filters: dict,
+        count: Callable[[], int],
+    ) -> Tuple[Any, List[dict]]:
+        """The paginator and the rows of the requested page."""
+        paginator = self.pagination_class()
+        page = PagedResult(
+            partial(self.service.find_page_values, fields=sources, filters=filters),
+            count,
+        )
+        return paginator, paginator.paginate_queryset(page, request, view=self)
+
+
+class ExportMixin:
+    """Streamed CSV/NDJSON ``export`` action built from the ViewSet's ``service``.
+
+    ``resource_name`` names the downloaded file, e.g. ``areas.csv``.
+    """
+
+    service: Any = None
+    resource_name: str = ""
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[CSVRenderer, NDJSONRenderer],
+    )
+    def export(self, request, format=None):
+        try:
+            renderer = request.accepted_renderer
+            fields = (
+                self.serializer_class.get_requested_fields(request)
+                or self.serializer_class.Meta.fields
+            )
+            rows = self.service.export(fields, get_export_filters(request))
+            response = StreamingHttpResponse(
+                renderer.stream(fields, rows),
+                content_type=f"{renderer.media_type}; charset={renderer.charset}",
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="{self.resource_name}.{renderer.format}"'
+            )
+            return response
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error exporting {self.resource_name}: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -0,0 +1,23 @@
+import logging
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from app.utils import get_render_limiter
+
+logger = logging.getLogger(__name__)
+
+
+class RenderStatsView(APIView):
+    def get(self, request):
+        """
+        Admission counters of this process' certificate renderer.
+        Usage: GET /api/v1/render_stats/
+        """
+        try:
+            return Response(get_render_limiter().get_stats(), status=status.HTTP_200_OK)
+        except Exception as e:
+            logger.error(f"Error getting render stats: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
@@ -1,37 +1,39 @@
 import logging
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from app.serializers import SpecialtyTypeSerializer
 from app.services import SpecialtyTypeService
+from app.utils import get_not_modified_response, get_validators
+from app.utils import set_validators, versioned_fields
+from app.views.mixins import ExportMixin, PaginatedListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class SpecialtyTypeViewSet(viewsets.ViewSet):
+class SpecialtyTypeViewSet(PaginatedListMixin, ExportMixin, viewsets.ViewSet):
+    service = SpecialtyTypeService
+    resource_name = "specialty_types"
     serializer_class = SpecialtyTypeSerializer
 
-    def list(self, request):
-        try:
-            tipos = SpecialtyTypeService.find_all()
-            serializer = self.serializer_class(tipos, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Error listing specialty types: {str(e)}")
-            return Response(
-                {"error": "Internal server error"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
     def retrieve(self, request, pk=None):
         try:
-            tipo = SpecialtyTypeService.find_by_id(int(pk))
+            fields = self.serializer_class.get_requested_fields(request)
+            tipo = SpecialtyTypeService.find_by_id(int(pk), versioned_fields(fields))
             if tipo is None:
                 return Response(
                     {"error": "Specialty type not found"},
                     status=status.HTTP_404_NOT_FOUND,
                 )
-            serializer = self.serializer_class(tipo)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            etag, last_modified = get_validators(request, tipo.updated_at)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            serializer = self.serializer_class(tipo, fields=fields)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(response, etag, last_modified)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
         except ValueError:
             return Response(
                 {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
@@ -1,38 +1,70 @@
 import logging
+from functools import partial
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.http import HttpResponse
+from django.conf import settings
+from django.db import IntegrityError
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
 from app.serializers import StudentSerializer
 from app.services import StudentService
+from app.utils import KeysetPagination
+from app.utils import get_not_modified_response, get_validators
+from app.utils import set_validators, versioned_fields
+from app.utils import DocumentCache
+from app.utils import get_document_generator
+from app.utils import RenderRejectedError
+from app.views.mixins import ExportMixin, PaginatedListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class StudentViewSet(viewsets.ViewSet):
+class StudentCursorPagination(KeysetPagination):
+    ordering = ("last_name", "first_name", "id")
+
+
+class StudentViewSet(PaginatedListMixin, ExportMixin, viewsets.ViewSet):
+    service = StudentService
+    resource_name = "students"
     serializer_class = StudentSerializer
+    cursor_pagination_class = StudentCursorPagination
 
-    def list(self, request):
-        try:
-            students = StudentService.find_all()
-            serializer = self.serializer_class(students, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Error listing students: {str(e)}")
-            return Response(
-                {"error": "Internal server error"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    def paginate_rows(self, request, sources, filters, count):
+        # ?cursor= switches to keyset pages, which stay cheap at any depth
+        cursor_param = self.cursor_pagination_class.cursor_query_param
+        if cursor_param not in request.query_params:
+            return super().paginate_rows(request, sources, filters, count)
+
+        paginator = self.cursor_pagination_class()
+        students = paginator.paginate_queryset(
+            partial(
+                self.service.find_page_after_values,
+                fields=sources,
+                filters=filters,
+            ),
+            request,
+            view=self,
+        )
+        return paginator, students
 
     def retrieve(self, request, pk=None):
         try:
-            student = StudentService.find_by_id(int(pk))
+            fields = self.serializer_class.get_requested_fields(request)
+            student = StudentService.find_by_id(int(pk), versioned_fields(fields))
             if student is None:
                 return Response(
                     {"error": "Student not found"}, status=status.HTTP_404_NOT_FOUND
                 )
-            serializer = self.serializer_class(student)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            etag, last_modified = get_validators(request, student.updated_at)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            serializer = self.serializer_class(student, fields=fields)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(response, etag, last_modified)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
         except ValueError:
             return Response(
                 {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
@@ -60,6 +92,68 @@ class StudentViewSet(viewsets.ViewSet):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+    @action(detail=False, methods=["post"], url_path="batch")
+    def create_batch(self, request):
+        try:
+            rows = request.data
+            max_size = getattr(settings, "STUDENT_BATCH_MAX_SIZE", 5000)
+            if not isinstance(rows, list) or not rows:
+                return Response(
+                    {"error": "Expected a non-empty list of students"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if len(rows) > max_size:
+                return Response(
+                    {"error": f"A batch cannot exceed {max_size} students"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            students_data, errors = {}, {}
+            for index, row in enumerate(rows):
+                serializer = self.serializer_class(data=row)
+                if serializer.is_valid():
+                    students_data[index] = serializer.validated_data
+                else:
+                    errors[index] = serializer.errors
+            if errors:
+                # Report the database conflicts of the well-formed rows too
+                errors.update(StudentService.validate_batch(students_data))
+            else:
+                students, errors = StudentService.create_batch(
+                    list(students_data.values())
+                )
+            if errors:
+                return Response(
+                    {
+                        "errors": [
+                            {"index": index, "errors": errors[index]}
+                            for index in sorted(errors)
+                        ]
+                    },
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            return Response(
+                {
+                    "created": len(students),
+                    "ids": [student.id for student in students],
+                },
+                status=status.HTTP_201_CREATED,
+            )
+        except IntegrityError as e:
+            # Another request took a student number after the batch checks
+            logger.error(f"Student batch conflicts with concurrent writes: {str(e)}")
+            return Response(
+                {"error": "Batch conflicts with students created meanwhile, retry it"},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except Exception as e:
+            logger.error(f"Error creating student batch: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
     def update(self, request, pk=None):
         try:
             serializer = self.serializer_class(data=request.data)
@@ -109,24 +203,56 @@ class StudentViewSet(viewsets.ViewSet):
     @action(detail=True, methods=["get"], url_path="certificate")
     def generate_certificate(self, request, pk=None):
         """
-        Generate PDF certificate for a student.
+        Generate a certificate for a student as PDF, ODT or DOCX.
         Usage: GET /api/v1/student/{id}/certificate/?type=pdf
         """
         try:
             document_type = request.query_params.get("type", "pdf").lower()
 
-            # Generate the certificate
-            pdf_io = StudentService.generate_regular_student_certificate(
+            # Answer revalidations with 304 before loading or rendering anything
+            etag, last_modified = StudentService.get_certificate_validators(
                 int(pk), document_type
             )
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
 
-            # Return the PDF as a response
-            response = HttpResponse(pdf_io.getvalue(), content_type="application/pdf")
-            response["Content-Disposition"] = (
-                f'attachment; filename="certificado_estudiante_{pk}.pdf"'
+            # Served from the certificate cache, rendering it on a miss
+            certificate = StudentService.get_regular_student_certificate(
+                int(pk), document_type
             )
-            return response
+            document_generator = get_document_generator(document_type)
+            filename = f"certificado_estudiante_{pk}.{document_generator.extension}"
+
+            sendfile_header = getattr(settings, "CERTIFICATE_SENDFILE_HEADER", "")
+            certificate_path = getattr(certificate, "name", None)
 
+            if sendfile_header and isinstance(certificate_path, str):
+                # Let the web server send the cached file
+                certificate.close()
+                response = HttpResponse(content_type=document_generator.content_type)
+                response[sendfile_header] = DocumentCache.get_sendfile_location(
+                    certificate_path
+                )
+                response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            else:
+                # Streamed from the file object, with Content-Length from its size
+                response = FileResponse(
+                    certificate,
+                    as_attachment=True,
+                    filename=filename,
+                    content_type=document_generator.content_type,
+                )
+
+            return set_validators(response, etag, last_modified)
+
+        except RenderRejectedError as e:
+            logger.warning(f"Error generating certificate for student {pk}: {str(e)}")
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.retry_after)},
+            )
         except ValueError as e:
             logger.error(f"Error generating certificate for student {pk}: {str(e)}")
             return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -136,3 +262,90 @@ class StudentViewSet(viewsets.ViewSet):
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+
+    @action(detail=False, methods=["get"], url_path="certificates")
+    def generate_certificates(self, request):
+        """
+        Generate a ZIP with one certificate per student of a specialty or faculty.
+        Usage: GET /api/v1/student/certificates/?specialty={id}&type=pdf
+               GET /api/v1/student/certificates/?faculty={id}&type=pdf
+        """
+        try:
+            document_type = request.query_params.get("type", "pdf").lower()
+            specialty_id = request.query_params.get("specialty")
+            faculty_id = request.query_params.get("faculty")
+
+            archive = StudentService.generate_certificates_archive(
+                document_type,
+                specialty_id=int(specialty_id) if specialty_id else None,
+                faculty_id=int(faculty_id) if faculty_id else None,
+            )
+
+            if specialty_id:
+                filename = f"certificados_especialidad_{specialty_id}.zip"
+            else:
+                filename = f"certificados_facultad_{faculty_id}.zip"
+
+            # Entries are sent to the client as soon as each render finishes
+            response = StreamingHttpResponse(archive, content_type="application/zip")
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+
+        except RenderRejectedError as e:
+            logger.warning(f"Error generating certificates archive: {str(e)}")
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        except ValueError as e:
+            logger.error(f"Error generating certificates archive: {str(e)}")
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error generating certificates archive: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+    @action(detail=False, methods=["get"], url_path="certificates/merged")
+    def generate_merged_certificates(self, request):
+        """
+        Generate a single PDF with one certificate page per student.
+        Usage: GET /api/v1/student/certificates/merged/?specialty={id}
+               GET /api/v1/student/certificates/merged/?faculty={id}
+        """
+        try:
+            specialty_id = request.query_params.get("specialty")
+            faculty_id = request.query_params.get("faculty")
+
+            document = StudentService.generate_merged_certificates(
+                specialty_id=int(specialty_id) if specialty_id else None,
+                faculty_id=int(faculty_id) if faculty_id else None,
+            )
+
+            if specialty_id:
+                filename = f"certificados_especialidad_{specialty_id}.pdf"
+            else:
+                filename = f"certificados_facultad_{faculty_id}.pdf"
+
+            response = FileResponse(document, content_type="application/pdf")
+            response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            return response
+
+        except RenderRejectedError as e:
+            logger.warning(f"Error generating merged certificates: {str(e)}")
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(e.retry_after)},
+            )
+        except ValueError as e:
+            logger.error(f"Error generating merged certificates: {str(e)}")
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            logger.error(f"Error generating merged certificates: {str(e)}")
+            return Response(
+                {"error": "Internal server error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
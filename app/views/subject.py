@@ -1,36 +1,38 @@
 import logging
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from app.serializers import SubjectSerializer
 from app.services import SubjectService
+from app.utils import get_not_modified_response, get_validators
+from app.utils import set_validators, versioned_fields
+from app.views.mixins import ExportMixin, PaginatedListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class SubjectViewSet(viewsets.ViewSet):
+class SubjectViewSet(PaginatedListMixin, ExportMixin, viewsets.ViewSet):
+    service = SubjectService
+    resource_name = "subjects"
     serializer_class = SubjectSerializer
 
-    def list(self, request):
-        try:
-            subjects = SubjectService.find_all()
-            serializer = self.serializer_class(subjects, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
-        except Exception as e:
-            logger.error(f"Error listing subjects: {str(e)}")
-            return Response(
-                {"error": "Internal server error"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
     def retrieve(self, request, pk=None):
         try:
-            subject = SubjectService.find_by_id(int(pk))
+            fields = self.serializer_class.get_requested_fields(request)
+            subject = SubjectService.find_by_id(int(pk), versioned_fields(fields))
             if subject is None:
                 return Response(
                     {"error": "Subject not found"}, status=status.HTTP_404_NOT_FOUND
                 )
-            serializer = self.serializer_class(subject)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            etag, last_modified = get_validators(request, subject.updated_at)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            serializer = self.serializer_class(subject, fields=fields)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(response, etag, last_modified)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
         except ValueError:
             return Response(
                 {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
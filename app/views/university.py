@@ -1,42 +1,88 @@
 import logging
 from rest_framework import viewsets, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
-from app.serializers import UniversitySerializer
-from app.services import UniversityService
+from rest_framework.decorators import action
+from app.serializers import UniversitySerializer, UniversityTreeSerializer
+from app.services import StudentService, UniversityService
+from app.utils import get_not_modified_response, get_validators
+from app.utils import set_validators, versioned_fields
+from app.utils import HierarchyCache
+from app.views.mixins import ExportMixin, PaginatedListMixin
 
 logger = logging.getLogger(__name__)
 
 
-class UniversityViewSet(viewsets.ViewSet):
+class UniversityViewSet(PaginatedListMixin, ExportMixin, viewsets.ViewSet):
+    service = UniversityService
+    resource_name = "universities"
     serializer_class = UniversitySerializer
 
-    def list(self, request):
+    def retrieve(self, request, pk=None):
         try:
-            universities = UniversityService.find_all()
-            serializer = self.serializer_class(universities, many=True)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            fields = self.serializer_class.get_requested_fields(request)
+            university = UniversityService.find_by_id(int(pk), versioned_fields(fields))
+            if university is None:
+                return Response(
+                    {"error": "University not found"}, status=status.HTTP_404_NOT_FOUND
+                )
+            etag, last_modified = get_validators(request, university.updated_at)
+            not_modified = get_not_modified_response(request, etag, last_modified)
+            if not_modified is not None:
+                return not_modified
+            serializer = self.serializer_class(university, fields=fields)
+            response = Response(serializer.data, status=status.HTTP_200_OK)
+            return set_validators(response, etag, last_modified)
+        except ValidationError as e:
+            return Response(e.detail, status=status.HTTP_400_BAD_REQUEST)
+        except ValueError:
+            return Response(
+                {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
+            )
         except Exception as e:
-            logger.error(f"Error listing universities: {str(e)}")
+            logger.error(f"Error retrieving university {pk}: {str(e)}")
             return Response(
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-    def retrieve(self, request, pk=None):
+    @action(detail=True, methods=["get"], url_path="tree")
+    def tree(self, request, pk=None):
         try:
-            university = UniversityService.find_by_id(int(pk))
-            if university is None:
-                return Response(
-                    {"error": "University not found"}, status=status.HTTP_404_NOT_FOUND
+            student_counts = request.query_params.get("student_counts") in ("1", "true")
+            key = HierarchyCache.get_key(int(pk), student_counts)
+            etag, _ = get_validators(request, None, key)
+            not_modified = get_not_modified_response(request, etag, None)
+            if not_modified is not None:
+                return not_modified
+
+            tree = HierarchyCache.get(key)
+            if tree is None:
+                university = UniversityService.find_tree(int(pk))
+                if university is None:
+                    return Response(
+                        {"error": "University not found"},
+                        status=status.HTTP_404_NOT_FOUND,
+                    )
+                counts = (
+                    StudentService.count_by_specialty(int(pk))
+                    if student_counts
+                    else None
+                )
+                serializer = UniversityTreeSerializer(
+                    university, context={"student_counts": counts}
                 )
-            serializer = self.serializer_class(university)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+                tree = serializer.data
+                HierarchyCache.set(key, tree)
+
+            response = Response(tree, status=status.HTTP_200_OK)
+            return set_validators(response, etag, None)
         except ValueError:
             return Response(
                 {"error": "Invalid ID format"}, status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error retrieving university {pk}: {str(e)}")
+            logger.error(f"Error building tree of university {pk}: {str(e)}")
             return Response(
                 {"error": "Internal server error"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "main.settings")
 
 application = get_asgi_application()
+
+# Serve reference tables from memory from the first request on
+from app.repositories.reference_cache import ReferenceCache  # noqa: E402
+
+ReferenceCache.preload()
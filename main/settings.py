@@ -48,6 +48,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "app.middleware.IdentityMapMiddleware",
 ]
 
 ROOT_URLCONF = "main.urls"
@@ -116,7 +117,7 @@ USE_I18N = True
 USE_TZ = True
 
 REST_FRAMEWORK = {
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "app.utils.pagination.StandardPagination",
     "PAGE_SIZE": 100,
     "DEFAULT_RENDERER_CLASSES": [
         "rest_framework.renderers.JSONRenderer",
@@ -132,7 +133,114 @@ REST_FRAMEWORK = {
 
 STATIC_URL = "static/"
 
+# Uploaded and generated files (certificate job results)
+
+MEDIA_ROOT = os.getenv("MEDIA_ROOT", str(BASE_DIR / "media"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
+
+# Certificate generation
+
+# Worker processes shared by every batch certificate archive of a process (defaults to CPU count)
+CERTIFICATE_BATCH_WORKERS = int(os.getenv("CERTIFICATE_BATCH_WORKERS", "0")) or None
+
+# Directory for rendered certificates, keyed by content (empty disables the cache)
+CERTIFICATE_CACHE_DIR = os.getenv(
+    "CERTIFICATE_CACHE_DIR", str(BASE_DIR / "cache" / "certificates")
+)
+
+# Seconds a cached certificate is kept on disk (0 keeps them forever)
+CERTIFICATE_CACHE_MAX_AGE = int(os.getenv("CERTIFICATE_CACHE_MAX_AGE", "86400"))
+
+# Offload cached certificates to the web server ("X-Accel-Redirect" or "X-Sendfile")
+CERTIFICATE_SENDFILE_HEADER = os.getenv("CERTIFICATE_SENDFILE_HEADER", "")
+
+# Internal location mapped to CERTIFICATE_CACHE_DIR (required for X-Accel-Redirect)
+CERTIFICATE_SENDFILE_PREFIX = os.getenv("CERTIFICATE_SENDFILE_PREFIX", "")
+
+# Background worker threads rendering asynchronous certificate jobs
+CERTIFICATE_JOB_WORKERS = int(os.getenv("CERTIFICATE_JOB_WORKERS", "2"))
+
+# Seconds after which a running certificate job is considered lost and requeued
+CERTIFICATE_JOB_STALE_TIMEOUT = int(os.getenv("CERTIFICATE_JOB_STALE_TIMEOUT", "900"))
+
+# Seconds finished certificate jobs and their files are kept (0 keeps them forever)
+CERTIFICATE_JOB_MAX_AGE = int(os.getenv("CERTIFICATE_JOB_MAX_AGE", "86400"))
+
+# Renders allowed to run at once in each process
+CERTIFICATE_RENDER_CONCURRENCY = int(os.getenv("CERTIFICATE_RENDER_CONCURRENCY", "2"))
+
+# Renders allowed to wait for a slot before new ones are rejected with 503
+CERTIFICATE_RENDER_QUEUE_DEPTH = int(os.getenv("CERTIFICATE_RENDER_QUEUE_DEPTH", "8"))
+
+# Seconds a render waits for a slot before it is rejected with 503
+CERTIFICATE_RENDER_TIMEOUT = float(os.getenv("CERTIFICATE_RENDER_TIMEOUT", "10"))
+
+# Largest cohort rendered into one merged certificates PDF (larger ones get a 400)
+CERTIFICATE_MERGED_MAX_SIZE = int(os.getenv("CERTIFICATE_MERGED_MAX_SIZE", "500"))
+
+# Students per render limiter slot taken by a merged certificates PDF
+CERTIFICATE_MERGED_STUDENTS_PER_SLOT = int(
+    os.getenv("CERTIFICATE_MERGED_STUDENTS_PER_SLOT", "50")
+)
+
+# Size-optimized certificate PDFs (downsampled, recompressed logos)
+CERTIFICATE_PDF_COMPACT = os.getenv("CERTIFICATE_PDF_COMPACT", "False") == "True"
+
+# Warm WeasyPrint worker processes per request process (0 renders PDFs in-process)
+CERTIFICATE_RENDERER_WORKERS = int(os.getenv("CERTIFICATE_RENDERER_WORKERS", "0"))
+
+# Renders after which a renderer process is replaced (0 never replaces it)
+CERTIFICATE_RENDERER_MAX_RENDERS = int(
+    os.getenv("CERTIFICATE_RENDERER_MAX_RENDERS", "500")
+)
+
+# Renderer RSS, in MB, above which the renderer pool is recycled (0 disables it)
+CERTIFICATE_RENDERER_MAX_RSS_MB = int(
+    os.getenv("CERTIFICATE_RENDERER_MAX_RSS_MB", "512")
+)
+
+# Largest page size clients may request with ?page_size= on list endpoints
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "1000"))
+
+# Rows fetched per server-side cursor round trip by the CSV/NDJSON export endpoints
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", "2000"))
+
+# Planner row estimates below this are replaced by an exact COUNT(*) (?count=estimate)
+COUNT_ESTIMATE_THRESHOLD = int(os.getenv("COUNT_ESTIMATE_THRESHOLD", "10000"))
+
+# Seconds each process keeps a reference table (document types, degrees...) in memory (0 disables it)
+REFERENCE_CACHE_TIMEOUT = int(os.getenv("REFERENCE_CACHE_TIMEOUT", "300"))
+
+# Django cache alias sharing reference tables between processes ("" keeps them per process)
+REFERENCE_CACHE_ALIAS = os.getenv("REFERENCE_CACHE_ALIAS", "")
+
+# Default Django cache. Local memory is private to each process, so deployments with
+# several workers should point it to a shared backend, e.g.
+# CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://redis:6379/1
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.getenv("CACHE_LOCATION", ""),
+    }
+}
+
+# Seconds a university hierarchy tree (/university/{id}/tree/) stays cached (0 disables it)
+UNIVERSITY_TREE_CACHE_TIMEOUT = int(os.getenv("UNIVERSITY_TREE_CACHE_TIMEOUT", "3600"))
+
+# Cap on the tree timeout when its cache is local memory, which other processes' writes never invalidate
+UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT = int(os.getenv("UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT", "5"))
+
+# Django cache alias holding the university hierarchy trees
+UNIVERSITY_TREE_CACHE_ALIAS = os.getenv("UNIVERSITY_TREE_CACHE_ALIAS", "default")
+
+# Largest number of students accepted by POST /student/batch/
+STUDENT_BATCH_MAX_SIZE = int(os.getenv("STUDENT_BATCH_MAX_SIZE", "5000"))
+
+# Rows per INSERT statement when creating a batch of students
+STUDENT_BATCH_CHUNK_SIZE = int(os.getenv("STUDENT_BATCH_CHUNK_SIZE", "500"))
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestUniversityAPIWorkflow(unittest.TestCase):
@@ -44,7 +45,7 @@ class TestUniversityAPIWorkflow(unittest.TestCase):
         self.assertIsNotNone(response)
 
         # 2. Retrieve
-        request = self.factory.get("/api/universities/1/")
+        request = Request(self.factory.get("/api/universities/1/"))
         response = viewset.retrieve(request, pk=1)
         self.assertIsNotNone(response)
 
@@ -68,7 +69,7 @@ class TestStudentAPIWorkflow(unittest.TestCase):
         self.mock_student = MagicMock()
         self.mock_student.id = 1
 
-    @patch("app.views.student.StudentService")
+    @patch("app.views.student.StudentViewSet.service")
     @patch("app.views.student.StudentSerializer")
     def test_student_search_and_filter_workflow(
         self, mock_serializer_class, mock_service
@@ -80,18 +81,20 @@ class TestStudentAPIWorkflow(unittest.TestCase):
         mock_serializer.data = [{"id": 1, "first_name": "Juan"}]
         mock_serializer_class.return_value = mock_serializer
 
+        mock_service.find_list_version.return_value = (None, 1)
         mock_service.search_by_name.return_value = [self.mock_student]
         mock_service.find_by_specialty.return_value = [self.mock_student]
+        mock_service.find_page_values.return_value = [self.mock_student]
 
         viewset = StudentViewSet()
 
         # Search by name
-        request = self.factory.get("/api/students/?search=Juan")
+        request = Request(self.factory.get("/api/students/?search=Juan"))
         response = viewset.list(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Filter by specialty
-        request = self.factory.get("/api/students/?specialty=1")
+        request = Request(self.factory.get("/api/students/?specialty=1"))
         response = viewset.list(request)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
@@ -197,21 +200,22 @@ class TestBulkOperations(unittest.TestCase):
         """Set up test fixtures."""
         self.factory = APIRequestFactory()
 
-    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversityViewSet.service")
     @patch("app.views.university.UniversitySerializer")
     def test_list_all_universities(self, mock_serializer_class, mock_service):
         """Test listing all universities."""
         from app.views import UniversityViewSet
 
         mock_universities = [MagicMock(id=i) for i in range(1, 11)]
-        mock_service.find_all.return_value = mock_universities
+        mock_service.find_list_version.return_value = (None, len(mock_universities))
+        mock_service.find_page_values.return_value = mock_universities
 
         mock_serializer = MagicMock()
         mock_serializer.data = [{"id": i} for i in range(1, 11)]
         mock_serializer_class.return_value = mock_serializer
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/")
+        request = Request(self.factory.get("/api/universities/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
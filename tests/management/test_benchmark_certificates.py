@@ -0,0 +1,98 @@
+"""Unit tests for the benchmark_certificates management command."""
+
+import json
+import os
+import tempfile
+import unittest
+from io import BytesIO, StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+
+class TestBenchmarkCertificates(unittest.TestCase):
+    """Test cases for the benchmark_certificates command."""
+
+    def test_summarize_percentiles(self):
+        """Test latencies are summarized in milliseconds."""
+        from app.management.commands.benchmark_certificates import _summarize
+
+        summary = _summarize([i / 1000 for i in range(1, 101)])
+
+        self.assertEqual(summary["min"], 1.0)
+        self.assertEqual(summary["max"], 100.0)
+        self.assertAlmostEqual(summary["p50"], 50.5, places=3)
+        self.assertAlmostEqual(summary["p99"], 99.01, places=3)
+
+    def test_summarize_empty(self):
+        """Test an empty run has no latency summary."""
+        from app.management.commands.benchmark_certificates import _summarize
+
+        self.assertIsNone(_summarize([]))
+
+    @patch("app.utils.get_document_generator")
+    def test_run_renders_skips_warmup(self, mock_get_generator):
+        """Test warmup renders are not timed and failures are counted."""
+        from app.management.commands.benchmark_certificates import _run_renders
+
+        mock_generator = mock_get_generator.return_value
+        mock_generator.generate.side_effect = [
+            BytesIO(b"warmup"),
+            BytesIO(b"first"),
+            ValueError("PDF generation failed"),
+        ]
+
+        result = _run_renders("pdf", iterations=2, warmup=1)
+
+        self.assertEqual(mock_generator.generate.call_count, 3)
+        self.assertEqual(len(result["latencies"]), 1)
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(result["error"], "PDF generation failed")
+        self.assertIsNotNone(result["started"])
+
+    def test_writes_results_file(self):
+        """Test one cold and one warm result per concurrency level are written."""
+        from app.management.commands.benchmark_certificates import Command
+
+        run_result = {
+            "latencies": [0.01, 0.02],
+            "errors": 0,
+            "error": None,
+            "started": 100.0,
+            "finished": 101.0,
+            "peak_rss_bytes": 1024,
+        }
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            with patch.object(
+                Command, "_run_workers", return_value=[run_result]
+            ) as mock_run_workers:
+                call_command(
+                    "benchmark_certificates",
+                    formats="pdf",
+                    concurrency="1,2",
+                    cold_runs=1,
+                    output=output,
+                    stdout=StringIO(),
+                )
+
+            with open(output) as f:
+                report = json.load(f)
+
+        self.assertEqual(mock_run_workers.call_count, 3)
+        self.assertEqual(
+            [(r["mode"], r["concurrency"]) for r in report["results"]],
+            [("cold", 1), ("warm", 1), ("warm", 2)],
+        )
+        self.assertEqual(report["results"][1]["throughput_per_s"], 2.0)
+        self.assertEqual(report["results"][1]["peak_rss_bytes"], 1024)
+
+    def test_rejects_unsupported_format(self):
+        """Test an unknown format is rejected before anything runs."""
+        with self.assertRaises(CommandError):
+            call_command("benchmark_certificates", formats="txt", stdout=StringIO())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""Unit tests for the prune_certificate_cache management command."""
+
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+
+
+class TestPruneCertificateCache(unittest.TestCase):
+    """Test cases for the prune_certificate_cache command."""
+
+    @patch("app.management.commands.prune_certificate_cache.DocumentCache")
+    def test_prune_default_max_age(self, mock_cache):
+        """Test the command prunes with the configured max age by default."""
+        mock_cache.prune.return_value = 3
+        output = StringIO()
+
+        call_command("prune_certificate_cache", stdout=output)
+
+        mock_cache.prune.assert_called_once_with(None)
+        self.assertIn("Deleted 3 cached certificates", output.getvalue())
+
+    @patch("app.management.commands.prune_certificate_cache.DocumentCache")
+    def test_prune_max_age_option(self, mock_cache):
+        """Test --max-age overrides the configured max age."""
+        mock_cache.prune.return_value = 0
+
+        call_command("prune_certificate_cache", "--max-age", "60", stdout=StringIO())
+
+        mock_cache.prune.assert_called_once_with(60)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,25 @@
+"""Unit tests for the prune_certificate_jobs management command."""
+
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command
+
+
+class TestPruneCertificateJobs(unittest.TestCase):
+    """Test cases for the prune_certificate_jobs command."""
+
+    @patch("app.management.commands.prune_certificate_jobs.CertificateJobService")
+    def test_prune(self, mock_service):
+        """Test the command deletes expired jobs and reports how many."""
+        mock_service.delete_expired.return_value = 4
+        output = StringIO()
+
+        call_command("prune_certificate_jobs", stdout=output)
+
+        mock_service.delete_expired.assert_called_once_with()
+        self.assertIn("Deleted 4 certificate jobs", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
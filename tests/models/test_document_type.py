@@ -32,6 +32,18 @@ class TestDocumentTypeModel(unittest.TestCase):
 
         self.assertEqual(str(mock_instance), "DNI")
 
+    def test_abbreviation(self):
+        """Test the abbreviation follows the first document type set."""
+        from app.models import DocumentType
+
+        self.assertEqual(
+            DocumentType(dni=30123456, passport="AB123").abbreviation, "DNI"
+        )
+        self.assertEqual(
+            DocumentType(dni=0, enrollment_card="4567890").abbreviation, "L.E"
+        )
+        self.assertEqual(DocumentType(dni=0).abbreviation, "Documento")
+
     @patch("app.models.document_type.DocumentType")
     def test_document_type_name_unique(self, mock_model):
         """Test name field is unique."""
@@ -0,0 +1,113 @@
+"""Unit tests for planner count estimates."""
+
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestEstimateCount(unittest.TestCase):
+    """Test cases for estimate_count."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.queryset = MagicMock()
+        self.queryset.db = "default"
+        self.queryset.model._meta.db_table = "students"
+        self.queryset.query.has_filters.return_value = False
+        self.queryset.count.return_value = 42
+
+        self.connection = MagicMock()
+        self.connection.vendor = "postgresql"
+        self.cursor = self.connection.cursor.return_value.__enter__.return_value
+
+    def _estimate(self, exact_below=1000):
+        from app.repositories.counts import estimate_count
+
+        with patch("app.repositories.counts.connections", {"default": self.connection}):
+            return estimate_count(self.queryset, exact_below)
+
+    def test_other_databases_count_exactly(self):
+        """Test databases without planner statistics get an exact count."""
+        self.connection.vendor = "sqlite"
+
+        self.assertEqual(self._estimate(), 42)
+        self.connection.cursor.assert_not_called()
+
+    def test_unfiltered_uses_reltuples(self):
+        """Test unfiltered tables are estimated from pg_class.reltuples."""
+        self.cursor.fetchone.return_value = (2500000.0,)
+
+        self.assertEqual(self._estimate(), 2500000)
+
+        sql, params = self.cursor.execute.call_args[0]
+        self.assertIn("pg_class", sql)
+        self.assertEqual(params, ["students"])
+        self.queryset.count.assert_not_called()
+
+    def test_small_tables_count_exactly(self):
+        """Test estimates under the threshold are replaced by an exact count."""
+        self.cursor.fetchone.return_value = (50.0,)
+
+        self.assertEqual(self._estimate(), 42)
+
+    def test_never_analyzed_counts_exactly(self):
+        """Test tables without statistics are counted exactly."""
+        self.cursor.fetchone.return_value = (-1.0,)
+
+        self.assertEqual(self._estimate(exact_below=0), 42)
+
+    def test_filtered_uses_explain(self):
+        """Test filtered querysets use the EXPLAIN row estimate."""
+        self.queryset.query.has_filters.return_value = True
+        ordered = self.queryset.order_by.return_value
+        # What Django returns on psycopg2, which decodes the json column
+        ordered.explain.return_value = json.dumps({"Plan": {"Plan Rows": 31000}})
+
+        self.assertEqual(self._estimate(), 31000)
+
+        self.queryset.order_by.assert_called_once_with()
+        ordered.explain.assert_called_once_with(format="json")
+        self.connection.cursor.assert_not_called()
+
+    def test_filtered_accepts_plan_arrays(self):
+        """Test drivers returning the raw EXPLAIN array are read too."""
+        self.queryset.query.has_filters.return_value = True
+        ordered = self.queryset.order_by.return_value
+        ordered.explain.return_value = json.dumps([{"Plan": {"Plan Rows": 31000}}])
+
+        self.assertEqual(self._estimate(), 31000)
+
+    def test_unreadable_plan_counts_exactly(self):
+        """Test a plan without a row estimate falls back to COUNT(*)."""
+        self.queryset.query.has_filters.return_value = True
+        ordered = self.queryset.order_by.return_value
+
+        for plan in ("{}", "[]", "not json"):
+            ordered.explain.return_value = plan
+            self.assertEqual(self._estimate(), 42)
+
+
+class TestListVersion(unittest.TestCase):
+    """Test cases for list_version."""
+
+    def test_max_updated_at_count_and_id(self):
+        """Test the version is read with one unordered aggregate."""
+        from app.repositories.counts import list_version
+
+        queryset = MagicMock()
+        aggregate = queryset.order_by.return_value.aggregate
+        aggregate.return_value = {
+            "last_modified": "2024-01-01",
+            "count": 3,
+            "last_id": 7,
+        }
+
+        self.assertEqual(list_version(queryset), ("2024-01-01", 3, 7))
+        queryset.order_by.assert_called_once_with()
+        self.assertEqual(
+            sorted(aggregate.call_args.kwargs), ["count", "last_id", "last_modified"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
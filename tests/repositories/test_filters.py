@@ -0,0 +1,128 @@
+"""Unit tests for repository filters."""
+
+import unittest
+from unittest.mock import MagicMock
+from django.db.models import F
+
+
+def _indexed_fields(model):
+    """Names of the fields covered by an index of ``model``."""
+    indexed = set()
+    for field in model._meta.get_fields():
+        if field.many_to_many or getattr(field, "db_index", False):
+            indexed.add(field.name)
+        elif getattr(field, "unique", False):
+            indexed.add(field.name)
+    for index in model._meta.indexes:
+        indexed.update(name.lstrip("-") for name in index.fields)
+        for expression in index.expressions:
+            indexed.update(
+                ref.name for ref in expression.flatten() if isinstance(ref, F)
+            )
+    return indexed
+
+
+class TestApplyFilters(unittest.TestCase):
+    """Test cases for apply_filters."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.lookups = {"specialty": "specialty_id", "city": "city__iexact"}
+
+    def test_translates_filters_to_lookups(self):
+        """Test filter names are translated to the finder lookups."""
+        from app.repositories.filters import apply_filters
+
+        queryset = MagicMock()
+
+        result = apply_filters(
+            queryset, self.lookups, {"specialty": "3", "city": "Mendoza"}
+        )
+
+        queryset.filter.assert_called_once_with(
+            specialty_id="3", city__iexact="Mendoza"
+        )
+        self.assertEqual(result, queryset.filter.return_value)
+
+    def test_unsupported_filter(self):
+        """Test unknown filter names are rejected."""
+        from app.repositories.filters import apply_filters
+
+        queryset = MagicMock()
+
+        with self.assertRaises(ValueError) as context:
+            apply_filters(queryset, self.lookups, {"email": "x", "age": "3"})
+
+        self.assertEqual(str(context.exception), "Unsupported filter: age, email")
+        queryset.filter.assert_not_called()
+
+    def test_no_filters(self):
+        """Test the queryset is left untouched without filters."""
+        from app.repositories.filters import apply_filters
+
+        queryset = MagicMock()
+
+        self.assertIs(apply_filters(queryset, self.lookups, None), queryset)
+        self.assertIs(apply_filters(queryset, self.lookups, {}), queryset)
+        queryset.filter.assert_not_called()
+
+    def test_invalid_value(self):
+        """Test values the column cannot hold are reported as ValueError."""
+        from app.repositories.filters import apply_filters
+
+        queryset = MagicMock()
+        queryset.filter.side_effect = ValueError("Field 'id' expected a number")
+
+        with self.assertRaises(ValueError) as context:
+            apply_filters(queryset, self.lookups, {"specialty": "abc"})
+
+        self.assertEqual(str(context.exception), "Invalid filter value: specialty=abc")
+
+
+class TestRepositoryFilters(unittest.TestCase):
+    """Test the filters repositories expose."""
+
+    def test_filters_use_indexed_columns(self):
+        """Test every exposed filter is served by an index."""
+        import app.models
+        import app.repositories
+
+        for name in dir(app.repositories):
+            repository = getattr(app.repositories, name)
+            if not hasattr(repository, "FILTERS"):
+                continue
+            model = getattr(app.models, name[: -len("Repository")])
+            indexed = _indexed_fields(model)
+            for filter_name, lookup in repository.FILTERS.items():
+                with self.subTest(repository=name, filter=filter_name):
+                    field = model._meta.get_field(lookup.split("__")[0])
+                    self.assertIn(field.name, indexed)
+
+
+class TestOnlyFields(unittest.TestCase):
+    """Test cases for only_fields."""
+
+    def test_all_fields(self):
+        """Test the queryset is left untouched without a fieldset."""
+        from app.repositories.filters import only_fields
+
+        queryset = MagicMock()
+
+        self.assertIs(only_fields(queryset, None), queryset)
+        queryset.only.assert_not_called()
+
+    def test_sparse_fields(self):
+        """Test a fieldset drops joins and defers the other columns."""
+        from app.repositories.filters import only_fields
+
+        queryset = MagicMock()
+
+        result = only_fields(queryset, ["id", "name"])
+
+        queryset.select_related.assert_called_once_with(None)
+        queryset.select_related.return_value.only.assert_called_once_with("id", "name")
+        self.assertEqual(result, queryset.select_related.return_value.only.return_value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""Unit tests for the repository identity map."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from app.models import Student
+from app.repositories.identity_map import IdentityMap
+
+
+class TestIdentityMap(unittest.TestCase):
+    """Test cases for IdentityMap."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.student = MagicMock()
+        self.load = MagicMock(return_value=self.student)
+        self.check = MagicMock(return_value=True)
+        self.find_by_id = IdentityMap.memoize_find_by_id(Student)(self.load)
+        self.exists_by_id = IdentityMap.memoize_exists_by_id(Student)(self.check)
+
+    def test_lookups_outside_a_scope_read_the_database(self):
+        """Test nothing is remembered without an open scope."""
+        self.find_by_id(1)
+        self.find_by_id(1)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_repeated_find_returns_the_same_instance(self):
+        """Test a row is loaded once per scope."""
+        with IdentityMap.scope():
+            first = self.find_by_id(1)
+            second = self.find_by_id("1")
+
+        self.assertIs(first, second)
+        self.load.assert_called_once_with(1, None)
+
+    def test_full_instance_serves_sparse_fieldsets(self):
+        """Test a sparse lookup reuses a full instance, but is never stored."""
+        with IdentityMap.scope():
+            self.find_by_id(1, ["first_name"])
+            self.find_by_id(1)
+            self.find_by_id(1, ["last_name"])
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_exists_uses_loaded_rows(self):
+        """Test existence checks are answered from found rows."""
+        with IdentityMap.scope():
+            self.find_by_id(1)
+            self.assertTrue(self.exists_by_id(1))
+
+        self.check.assert_not_called()
+
+    def test_missing_rows_are_remembered(self):
+        """Test a missing row is not looked up again."""
+        self.load.return_value = None
+
+        with IdentityMap.scope():
+            self.assertIsNone(self.find_by_id(7))
+            self.assertFalse(self.exists_by_id(7))
+            self.assertIsNone(self.find_by_id(7))
+
+        self.load.assert_called_once()
+        self.check.assert_not_called()
+
+    def test_exists_does_not_stand_in_for_an_instance(self):
+        """Test a row only known to exist is still loaded by find_by_id."""
+        with IdentityMap.scope():
+            self.assertTrue(self.exists_by_id(1))
+            self.assertTrue(self.exists_by_id(1))
+            self.assertIs(self.find_by_id(1), self.student)
+
+        self.check.assert_called_once_with(1)
+        self.load.assert_called_once()
+
+    def test_writes_empty_the_map_even_on_failure(self):
+        """Test a failed write still drops what was loaded."""
+        write = IdentityMap.invalidates(MagicMock(side_effect=ValueError("invalid")))
+
+        with IdentityMap.scope():
+            self.find_by_id(1)
+            with self.assertRaises(ValueError):
+                write(self.student)
+            self.find_by_id(1)
+
+        self.assertEqual(self.load.call_count, 2)
+
+    def test_nested_scopes_share_the_map(self):
+        """Test an inner scope joins the one already open."""
+        with IdentityMap.scope():
+            self.find_by_id(1)
+            with IdentityMap.scope():
+                self.find_by_id(1)
+
+        self.load.assert_called_once()
+
+    @patch("app.repositories.student.Student")
+    def test_student_delete_queries_the_row_once(self, mock_model):
+        """Test find, exists and delete of one student load it once."""
+        from app.repositories import StudentRepository
+
+        student = MagicMock()
+        mock_model.objects.select_related.return_value.get.return_value = student
+
+        with IdentityMap.scope():
+            StudentRepository.find_by_id(1)
+            self.assertTrue(StudentRepository.exists_by_id(1))
+            self.assertTrue(StudentRepository.delete_by_id(1))
+
+        mock_model.objects.select_related.return_value.get.assert_called_once_with(id=1)
+        mock_model.objects.filter.assert_not_called()
+        student.delete.assert_called_once()
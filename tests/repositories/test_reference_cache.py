@@ -0,0 +1,167 @@
+"""Unit tests for the reference table cache."""
+
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.test import override_settings
+
+from app.models import Area, DocumentType
+from app.repositories.reference_cache import ReferenceCache, ReferenceTable
+
+CREATED = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+FIELDS = ("id", "name", "created_at", "updated_at")
+ROWS = [(2, "Ciencias", CREATED, CREATED), (1, "Ingeniería", CREATED, CREATED)]
+
+
+class TestReferenceTable(unittest.TestCase):
+    """Test cases for ReferenceTable."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.table = ReferenceTable(Area, "default", FIELDS, ROWS)
+
+    def test_find_by_id(self):
+        """Test rows are found by id, also from URL strings."""
+        area = self.table.find_by_id("1")
+
+        self.assertIsInstance(area, Area)
+        self.assertEqual(area.name, "Ingeniería")
+        self.assertFalse(area._state.adding)
+        self.assertIsNone(self.table.find_by_id(99))
+        self.assertIsNone(self.table.find_by_id("abc"))
+
+    def test_reads_build_fresh_instances(self):
+        """Test modifying a returned instance leaves the snapshot intact."""
+        self.table.find_by_id(1).name = "Otra"
+
+        self.assertEqual(self.table.find_by_id(1).name, "Ingeniería")
+
+    def test_pages_keep_snapshot_order(self):
+        """Test pages follow the order the rows were loaded in."""
+        page = self.table.find_page(1, 5)
+
+        self.assertEqual([area.id for area in self.table.find_all()], [2, 1])
+        self.assertEqual([area.id for area in page], [1])
+
+    def test_find_page_values(self):
+        """Test value pages only carry the requested fields."""
+        rows = self.table.find_page_values(0, 1, ["id", "name"])
+
+        self.assertEqual(rows, [{"id": 2, "name": "Ciencias"}])
+
+    def test_exists_and_count(self):
+        """Test existence checks and counts."""
+        self.assertTrue(self.table.exists_by_id(2))
+        self.assertFalse(self.table.exists_by_id(3))
+        self.assertEqual(self.table.count(), 2)
+
+    def test_find_list_version(self):
+        """Test the list version comes from the snapshot."""
+        self.assertEqual(self.table.find_list_version(), (CREATED, 2, 2))
+        self.assertEqual(
+            ReferenceTable(Area, "default", FIELDS, []).find_list_version(),
+            (None, 0, None),
+        )
+
+
+class TestReferenceCache(unittest.TestCase):
+    """Test cases for ReferenceCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        patcher = patch.object(
+            ReferenceCache, "_load", return_value=("default", FIELDS, ROWS)
+        )
+        self.mock_load = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(ReferenceCache.deactivate)
+
+    def test_inactive_models_read_the_database(self):
+        """Test tables are not cached before preload."""
+        self.assertIsNone(ReferenceCache.table(Area))
+        self.mock_load.assert_not_called()
+
+    def test_preload_loads_once(self):
+        """Test preloaded tables are served from memory."""
+        ReferenceCache.preload([Area])
+
+        self.assertEqual(ReferenceCache.table(Area).count(), 2)
+        self.assertIsNone(ReferenceCache.table(DocumentType))
+        self.mock_load.assert_called_once_with(Area)
+
+    @override_settings(REFERENCE_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_cache(self):
+        """Test a zero timeout keeps every read on the database."""
+        ReferenceCache.preload([Area])
+
+        self.assertIsNone(ReferenceCache.table(Area))
+
+    def test_writes_invalidate(self):
+        """Test saves and deletes reload the table on the next read."""
+        ReferenceCache.preload([Area])
+
+        post_save.send(sender=Area, instance=MagicMock(), created=True, using="default")
+        ReferenceCache.table(Area)
+        post_delete.send(sender=Area, instance=MagicMock(), using="default")
+        ReferenceCache.table(Area)
+
+        self.assertEqual(self.mock_load.call_count, 3)
+
+    def test_write_during_load_is_not_cached(self):
+        """Test a snapshot loaded across an invalidation is not stored."""
+        ReferenceCache._active.add(Area)
+
+        def load(model):
+            ReferenceCache.invalidate(model)
+            return "default", FIELDS, ROWS
+
+        self.mock_load.side_effect = load
+        ReferenceCache.table(Area)
+        ReferenceCache.table(Area)
+
+        self.assertEqual(self.mock_load.call_count, 2)
+
+    def test_snapshots_inside_transactions_are_not_cached(self):
+        """Test tables read inside a transaction are loaded again afterwards."""
+        ReferenceCache._active.add(Area)
+        connection = MagicMock(in_atomic_block=True)
+
+        with patch(
+            "app.repositories.reference_cache.connections", {"default": connection}
+        ):
+            ReferenceCache.table(Area)
+        ReferenceCache.table(Area)
+
+        self.assertEqual(self.mock_load.call_count, 2)
+
+    @override_settings(REFERENCE_CACHE_ALIAS="default")
+    def test_shared_cache(self):
+        """Test processes share snapshots through the Django cache."""
+        self.addCleanup(caches["default"].clear)
+        ReferenceCache.preload([Area])
+        # Another process starts with an empty local cache
+        ReferenceCache._tables.clear()
+
+        self.assertEqual(ReferenceCache.table(Area).count(), 2)
+        self.mock_load.assert_called_once()
+
+        ReferenceCache.invalidate(Area)
+        self.assertIsNone(caches["default"].get(ReferenceCache.get_key(Area)))
+
+    def test_repository_reads_use_the_cache(self):
+        """Test reference repositories answer from the snapshot."""
+        from app.repositories import AreaRepository
+
+        ReferenceCache.preload([Area])
+
+        with patch("app.repositories.area.Area.objects") as mock_objects:
+            self.assertTrue(AreaRepository.exists_by_id(1))
+            self.assertEqual(AreaRepository.find_by_id(2).name, "Ciencias")
+            self.assertEqual(AreaRepository.count(), 2)
+
+        mock_objects.filter.assert_not_called()
+        mock_objects.get.assert_not_called()
+        mock_objects.count.assert_not_called()
@@ -86,6 +86,18 @@ class TestDocumentTypeRepository(unittest.TestCase):
 
         self.assertEqual(result, self.mock_doc_type)
 
+    @patch("app.repositories.document_type.DocumentType.objects")
+    def test_find_existing_ids(self, mock_objects):
+        """Test existing document type ids are checked with one query."""
+        from app.repositories import DocumentTypeRepository
+
+        mock_objects.filter.return_value.values_list.return_value = [1]
+
+        result = DocumentTypeRepository.find_existing_ids({1, 9})
+
+        mock_objects.filter.assert_called_once_with(id__in={1, 9})
+        self.assertEqual(result, {1})
+
 
 class TestDepartmentRepository(unittest.TestCase):
     """Test cases for DepartmentRepository."""
@@ -48,6 +48,21 @@ class TestSpecialtyRepository(unittest.TestCase):
         mock_select_related.get.assert_called_once_with(id=1)
         self.assertEqual(result, self.mock_specialty)
 
+    @patch("app.repositories.specialty.Specialty.objects")
+    def test_find_existing_ids(self, mock_objects):
+        """Test existing specialty ids are checked with one query."""
+        from app.repositories import SpecialtyRepository
+
+        mock_objects.filter.return_value.values_list.return_value = [1, 2]
+
+        result = SpecialtyRepository.find_existing_ids({1, 2, 9})
+
+        mock_objects.filter.assert_called_once_with(id__in={1, 2, 9})
+        mock_objects.filter.return_value.values_list.assert_called_once_with(
+            "id", flat=True
+        )
+        self.assertEqual(result, {1, 2})
+
     @patch("app.repositories.specialty.Specialty.objects")
     def test_find_by_faculty(self, mock_objects):
         """Test finding specialties by faculty."""
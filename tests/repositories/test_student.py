@@ -171,6 +171,123 @@ class TestStudentRepository(unittest.TestCase):
 
         self.assertTrue(result)
 
+    @patch("app.repositories.student.Student.objects")
+    def test_find_page_after_first_page(self, mock_objects):
+        """Test the first keyset page is ordered by name and id without a filter."""
+        from app.repositories import StudentRepository
+
+        mock_select_related = mock_objects.select_related.return_value
+        mock_ordered = mock_select_related.order_by.return_value
+        mock_ordered.__getitem__.return_value = [self.mock_student]
+
+        result = StudentRepository.find_page_after(None, 51)
+
+        mock_select_related.filter.assert_not_called()
+        mock_select_related.order_by.assert_called_once_with(
+            "last_name", "first_name", "id"
+        )
+        mock_ordered.__getitem__.assert_called_once_with(slice(None, 51))
+        self.assertEqual(result, [self.mock_student])
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_page_after_filters_past_position(self, mock_objects):
+        """Test keyset pages only contain rows past the cursor position."""
+        from app.repositories import StudentRepository
+
+        mock_select_related = mock_objects.select_related.return_value
+        mock_filtered = mock_select_related.filter.return_value
+
+        StudentRepository.find_page_after(("Pérez", "Juan", 7), 10, reverse=True)
+
+        args, kwargs = mock_select_related.filter.call_args
+        self.assertEqual(kwargs, {"last_name__lte": "Pérez"})
+        self.assertIn("('id__lt', 7)", str(args[0]))
+        mock_filtered.order_by.assert_called_once_with(
+            "-last_name", "-first_name", "-id"
+        )
+
+    @patch("app.repositories.student.Student.objects")
+    def test_iter_values(self, mock_objects):
+        """Test exports stream values through a chunked server-side cursor."""
+        from app.repositories import StudentRepository
+
+        mock_filtered = mock_objects.all.return_value.filter.return_value
+        mock_values = mock_filtered.order_by.return_value.values.return_value
+        mock_values.iterator.return_value = iter([{"id": 1}])
+
+        result = StudentRepository.iter_values(
+            ["id", "last_name"], {"specialty": "3", "gender": "F"}, 500
+        )
+
+        mock_objects.all.return_value.filter.assert_called_once_with(
+            specialty_id="3", gender="F"
+        )
+        mock_filtered.order_by.assert_called_once_with("last_name", "first_name", "id")
+        mock_filtered.order_by.return_value.values.assert_called_once_with(
+            "id", "last_name"
+        )
+        mock_values.iterator.assert_called_once_with(chunk_size=500)
+        self.assertEqual(list(result), [{"id": 1}])
+
+    def test_iter_values_unsupported_filter(self):
+        """Test exports reject filters without a matching finder."""
+        from app.repositories import StudentRepository
+
+        with self.assertRaises(ValueError):
+            StudentRepository.iter_values(["id"], {"email": "x"}, 500)
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_page_with_fields(self, mock_objects):
+        """Test a sparse fieldset loads only those columns, without joins."""
+        from app.repositories import StudentRepository
+
+        mock_select_related = mock_objects.select_related.return_value
+        mock_only = mock_select_related.select_related.return_value.only.return_value
+        mock_only.order_by.return_value.__getitem__.return_value = [self.mock_student]
+
+        result = StudentRepository.find_page(0, 10, ["id", "first_name"])
+
+        mock_select_related.select_related.assert_called_once_with(None)
+        mock_select_related.select_related.return_value.only.assert_called_once_with(
+            "id", "first_name"
+        )
+        self.assertEqual(result, [self.mock_student])
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_page_values(self, mock_objects):
+        """Test a page is read as values() rows of the requested columns."""
+        from app.repositories import StudentRepository
+
+        mock_ordered = mock_objects.all.return_value.order_by.return_value
+        mock_ordered.values.return_value.__getitem__.return_value = [{"id": 1}]
+
+        result = StudentRepository.find_page_values(20, 10, ["id", "last_name"])
+
+        mock_objects.all.return_value.order_by.assert_called_once_with(
+            "last_name", "first_name", "id"
+        )
+        mock_ordered.values.assert_called_once_with("id", "last_name")
+        mock_ordered.values.return_value.__getitem__.assert_called_once_with(
+            slice(20, 30)
+        )
+        self.assertEqual(result, [{"id": 1}])
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_page_after_values_adds_keyset_columns(self, mock_objects):
+        """Test keyset value pages always carry the cursor columns."""
+        from app.repositories import StudentRepository
+
+        mock_ordered = mock_objects.all.return_value.order_by.return_value
+
+        StudentRepository.find_page_after_values(None, 11, fields=["id", "gender"])
+
+        mock_ordered.values.assert_called_once_with(
+            "id", "gender", "last_name", "first_name"
+        )
+        mock_ordered.values.return_value.__getitem__.assert_called_once_with(
+            slice(None, 11)
+        )
+
     @patch("app.repositories.student.Student.objects")
     def test_count(self, mock_objects):
         """Test counting students."""
@@ -182,6 +299,127 @@ class TestStudentRepository(unittest.TestCase):
 
         self.assertEqual(result, 10)
 
+    @patch("app.repositories.student.Student")
+    def test_bulk_create(self, mock_model):
+        """Test students are inserted in chunks without full_clean."""
+        from app.repositories import StudentRepository
+
+        instances = [MagicMock(), MagicMock()]
+        mock_model.side_effect = instances
+        mock_model.objects.bulk_create.return_value = instances
+
+        result = StudentRepository.bulk_create(
+            [{"student_number": 1}, {"student_number": 2}], 500
+        )
+
+        mock_model.objects.bulk_create.assert_called_once_with(
+            instances, batch_size=500
+        )
+        instances[0].full_clean.assert_not_called()
+        self.assertEqual(result, instances)
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_existing_numbers(self, mock_objects):
+        """Test taken student and document numbers are found with IN queries."""
+        from app.repositories import StudentRepository
+
+        mock_objects.filter.return_value.values_list.side_effect = [[1], ["123"]]
+
+        student_numbers = StudentRepository.find_existing_student_numbers([1, 2])
+        document_numbers = StudentRepository.find_existing_document_numbers(
+            ["123", "456"]
+        )
+
+        mock_objects.filter.assert_any_call(student_number__in=[1, 2])
+        mock_objects.filter.assert_any_call(document_number__in=["123", "456"])
+        self.assertEqual(student_numbers, {1})
+        self.assertEqual(document_numbers, {"123"})
+
+    @patch("app.repositories.student.Student.objects")
+    def test_count_by_specialty(self, mock_objects):
+        """Test students of a university are counted per specialty at once."""
+        from app.repositories import StudentRepository
+
+        grouped = mock_objects.filter.return_value.values.return_value
+        grouped.annotate.return_value.order_by.return_value = [
+            {"specialty_id": 1, "count": 3},
+            {"specialty_id": 2, "count": 1},
+        ]
+
+        result = StudentRepository.count_by_specialty(1)
+
+        mock_objects.filter.assert_called_once_with(specialty__faculty__university_id=1)
+        mock_objects.filter.return_value.values.assert_called_once_with("specialty_id")
+        self.assertEqual(result, {1: 3, 2: 1})
+
+    @patch("app.repositories.student.Student.objects")
+    def test_count_with_filters(self, mock_objects):
+        """Test counting students matching list filters."""
+        from app.repositories import StudentRepository
+
+        mock_objects.filter.return_value.count.return_value = 3
+
+        result = StudentRepository.count({"specialty": "3", "gender": "F"})
+
+        mock_objects.filter.assert_called_once_with(specialty_id="3", gender="F")
+        self.assertEqual(result, 3)
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_by_faculty_with_full_relations(self, mock_objects):
+        """Test finding the students of a faculty with every certificate relation."""
+        from app.repositories import StudentRepository
+
+        mock_filter = MagicMock()
+        mock_filter.select_related.return_value = [self.mock_student]
+        mock_objects.filter.return_value = mock_filter
+
+        result = StudentRepository.find_by_faculty_with_full_relations(1)
+
+        mock_objects.filter.assert_called_once_with(specialty__faculty_id=1)
+        mock_filter.select_related.assert_called_once_with(
+            "document_type",
+            "specialty",
+            "specialty__faculty",
+            "specialty__faculty__university",
+            "specialty__specialty_type",
+        )
+        self.assertEqual(result, [self.mock_student])
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_by_specialty_with_full_relations_limit(self, mock_objects):
+        """Test a limit slices the certificate students in the query."""
+        from app.repositories import StudentRepository
+
+        queryset = mock_objects.filter.return_value.select_related.return_value
+        queryset.__getitem__.return_value = [self.mock_student]
+
+        result = StudentRepository.find_by_specialty_with_full_relations(1, limit=5)
+
+        queryset.__getitem__.assert_called_once_with(slice(None, 5))
+        self.assertEqual(result, [self.mock_student])
+
+    @patch("app.repositories.student.Student.objects")
+    def test_find_certificate_versions(self, mock_objects):
+        """Test certificate versions are read as a single row of timestamps."""
+        from app.repositories import StudentRepository
+
+        versions = ("student", "specialty", "faculty", "university")
+        mock_objects.filter.return_value.values_list.return_value.first.return_value = (
+            versions
+        )
+
+        result = StudentRepository.find_certificate_versions(1)
+
+        mock_objects.filter.assert_called_once_with(id=1)
+        mock_objects.filter.return_value.values_list.assert_called_once_with(
+            "updated_at",
+            "document_type__updated_at",
+            "specialty__updated_at",
+            "specialty__faculty__updated_at",
+            "specialty__faculty__university__updated_at",
+        )
+        self.assertEqual(result, versions)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -118,6 +118,21 @@ class TestUniversityRepository(unittest.TestCase):
         mock_objects.all.assert_called_once()
         self.assertEqual(len(result), 2)
 
+    @patch("app.repositories.university.University.objects")
+    def test_find_page(self, mock_objects):
+        """Test finding a page of universities is sliced in the database."""
+        from app.repositories import UniversityRepository
+
+        mock_ordered = MagicMock()
+        mock_ordered.__getitem__.return_value = [self.mock_university]
+        mock_objects.order_by.return_value = mock_ordered
+
+        result = UniversityRepository.find_page(20, 10)
+
+        mock_objects.order_by.assert_called_once_with("name", "id")
+        mock_ordered.__getitem__.assert_called_once_with(slice(20, 30))
+        self.assertEqual(result, [self.mock_university])
+
     @patch("app.repositories.university.University.objects")
     def test_search_by_name(self, mock_objects):
         """Test searching universities by name."""
@@ -239,6 +254,38 @@ class TestUniversityRepository(unittest.TestCase):
         mock_prefetch.get.assert_called_once_with(id=1)
         self.assertEqual(result, self.mock_university)
 
+    @patch("app.repositories.university.University.objects")
+    def test_find_tree(self, mock_objects):
+        """Test the tree prefetches faculties and specialties in order."""
+        from app.repositories import UniversityRepository
+
+        mock_prefetch = MagicMock()
+        mock_prefetch.get.return_value = self.mock_university
+        mock_objects.prefetch_related.return_value = mock_prefetch
+
+        result = UniversityRepository.find_tree(1)
+
+        (faculties,) = mock_objects.prefetch_related.call_args.args
+        self.assertEqual(faculties.prefetch_through, "faculties")
+        self.assertEqual(faculties.queryset.query.order_by, ("name", "id"))
+        (specialties,) = faculties.queryset._prefetch_related_lookups
+        self.assertEqual(specialties.prefetch_through, "specialties")
+        self.assertEqual(
+            specialties.queryset.query.select_related, {"specialty_type": {}}
+        )
+        mock_prefetch.get.assert_called_once_with(id=1)
+        self.assertEqual(result, self.mock_university)
+
+    @patch("app.repositories.university.University.objects")
+    def test_find_tree_not_found(self, mock_objects):
+        """Test the tree of a missing university is None."""
+        from django.core.exceptions import ObjectDoesNotExist
+        from app.repositories import UniversityRepository
+
+        mock_objects.prefetch_related.return_value.get.side_effect = ObjectDoesNotExist
+
+        self.assertIsNone(UniversityRepository.find_tree(999))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,176 @@
+"""Unit tests for SparseFieldsModelSerializer."""
+
+import unittest
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from rest_framework.renderers import JSONRenderer
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class TestSparseFieldsModelSerializer(unittest.TestCase):
+    """Test cases for sparse fieldsets."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+        self.university = SimpleNamespace(
+            id=1,
+            name="Universidad Nacional de Cuyo",
+            acronym="UNCUYO",
+            created_at=None,
+            updated_at=None,
+        )
+
+    def test_fields_limit_output(self):
+        """Test only the requested fields are serialized."""
+        from app.serializers import UniversitySerializer
+
+        serializer = UniversitySerializer(self.university, fields=["id", "acronym"])
+
+        self.assertEqual(serializer.data, {"id": 1, "acronym": "UNCUYO"})
+
+    def test_fields_limit_output_many(self):
+        """Test the requested fields also apply to list serialization."""
+        from app.serializers import UniversitySerializer
+
+        serializer = UniversitySerializer([self.university], many=True, fields=["name"])
+
+        self.assertEqual(serializer.data, [{"name": "Universidad Nacional de Cuyo"}])
+
+    def test_no_fields_keeps_all(self):
+        """Test every field is serialized without a fieldset."""
+        from app.serializers import UniversitySerializer
+
+        serializer = UniversitySerializer(self.university)
+
+        self.assertEqual(
+            list(serializer.data),
+            ["id", "name", "acronym", "created_at", "updated_at"],
+        )
+
+    def test_get_requested_fields(self):
+        """Test ?fields= is parsed, trimmed and deduplicated."""
+        from app.serializers import UniversitySerializer
+
+        request = Request(self.factory.get("/api/universities/?fields=id, name,id,"))
+
+        self.assertEqual(
+            UniversitySerializer.get_requested_fields(request), ["id", "name"]
+        )
+
+    def test_get_requested_fields_absent(self):
+        """Test no fieldset is requested without ?fields=."""
+        from app.serializers import UniversitySerializer
+
+        request = Request(self.factory.get("/api/universities/"))
+
+        self.assertIsNone(UniversitySerializer.get_requested_fields(request))
+
+    def test_get_requested_fields_unknown(self):
+        """Test unknown fields are rejected."""
+        from app.serializers import UniversitySerializer
+
+        request = Request(self.factory.get("/api/universities/?fields=id,password"))
+
+        with self.assertRaises(ValidationError) as context:
+            UniversitySerializer.get_requested_fields(request)
+
+        self.assertIn("password", str(context.exception.detail["fields"]))
+
+
+class TestRowEncoder(unittest.TestCase):
+    """Test cases for the values() row encoder."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.student = SimpleNamespace(
+            id=7,
+            first_name="José",
+            last_name="Pérez",
+            document_number="30111222",
+            document_type_id=1,
+            birth_date=date(2001, 9, 3),
+            gender="M",
+            student_number=4521,
+            enrollment_date=date(2020, 3, 2),
+            specialty_id=3,
+            created_at=datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+            updated_at=None,
+        )
+
+    def _row(self, serializer_class, instance):
+        return {name: getattr(instance, name) for name in serializer_class.Meta.fields}
+
+    def test_matches_serializer_bytes(self):
+        """Test encoded rows render to the same bytes as the serializer."""
+        from app.serializers import StudentSerializer
+
+        encoder = StudentSerializer.get_row_encoder()
+        rendered = JSONRenderer().render(
+            encoder.encode_many([self._row(StudentSerializer, self.student)])
+        )
+
+        expected = JSONRenderer().render(
+            StudentSerializer([self.student], many=True).data
+        )
+        self.assertEqual(rendered, expected)
+
+    def test_matches_serializer_in_utc(self):
+        """Test UTC datetimes keep the serializer's Z suffix."""
+        from django.utils import timezone as django_timezone
+        from app.serializers import StudentSerializer
+
+        encoder = StudentSerializer.get_row_encoder(["created_at"])
+        with django_timezone.override(timezone.utc):
+            encoded = encoder.encode(self._row(StudentSerializer, self.student))
+            expected = StudentSerializer(self.student, fields=["created_at"]).data
+
+        self.assertEqual(encoded, expected)
+        self.assertEqual(encoded["created_at"], "2024-05-01T12:30:15.123456Z")
+
+    def test_matches_serializer_with_nulls(self):
+        """Test null columns are encoded like the serializer encodes them."""
+        from app.serializers import AuthoritySerializer
+
+        authority = SimpleNamespace(
+            id=2,
+            name="Decano",
+            phone=None,
+            email=None,
+            position_id=4,
+            created_at=None,
+            updated_at=None,
+        )
+
+        encoded = AuthoritySerializer.get_row_encoder().encode(
+            self._row(AuthoritySerializer, authority)
+        )
+
+        self.assertEqual(encoded, AuthoritySerializer(authority).data)
+
+    def test_sparse_fields(self):
+        """Test a sparse encoder only reads and returns the requested fields."""
+        from app.serializers import StudentSerializer
+
+        encoder = StudentSerializer.get_row_encoder(["last_name", "id"])
+
+        self.assertEqual(encoder.sources, ["id", "last_name"])
+        self.assertEqual(
+            encoder.encode({"id": 7, "last_name": "Pérez", "first_name": "José"}),
+            {"id": 7, "last_name": "Pérez"},
+        )
+
+    def test_encoder_is_cached(self):
+        """Test encoders are built once per serializer and fieldset."""
+        from app.serializers import StudentSerializer
+
+        self.assertIs(
+            StudentSerializer.get_row_encoder(["id"]),
+            StudentSerializer.get_row_encoder(["id"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
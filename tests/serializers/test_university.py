@@ -223,5 +223,57 @@ class TestUniversitySerializer(unittest.TestCase):
         self.assertIn("updated_at", read_only)
 
 
+class TestUniversityTreeSerializer(unittest.TestCase):
+    """Test cases for UniversityTreeSerializer."""
+
+    def setUp(self):
+        """Set up a prefetched University → Faculty → Specialty tree."""
+        from app.models import Faculty, Specialty, SpecialtyType, University
+
+        specialty_type = SpecialtyType(id=1, name="Grado")
+        self.specialties = [
+            Specialty(id=1, name="Sistemas", letter="S", faculty_id=1),
+            Specialty(id=2, name="Civil", letter="C", faculty_id=1),
+        ]
+        for specialty in self.specialties:
+            specialty.specialty_type = specialty_type
+        faculty = Faculty(id=1, name="Regional Mendoza", university_id=1)
+        faculty._prefetched_objects_cache = {"specialties": self.specialties}
+        self.university = University(id=1, name="UTN", acronym="UTN")
+        self.university._prefetched_objects_cache = {"faculties": [faculty]}
+
+    def test_nested_hierarchy(self):
+        """Test faculties nest specialties with their specialty type."""
+        from app.serializers import UniversityTreeSerializer
+
+        data = UniversityTreeSerializer(self.university).data
+
+        self.assertEqual(data["acronym"], "UTN")
+        faculty = data["faculties"][0]
+        self.assertNotIn("university_id", faculty)
+        specialty = faculty["specialties"][0]
+        self.assertEqual(specialty["name"], "Sistemas")
+        self.assertEqual(specialty["specialty_type"]["name"], "Grado")
+        self.assertNotIn("faculty_id", specialty)
+        self.assertNotIn("student_count", data)
+        self.assertNotIn("student_count", specialty)
+
+    def test_student_counts(self):
+        """Test counts per specialty add up through faculty and university."""
+        from app.serializers import UniversityTreeSerializer
+
+        data = UniversityTreeSerializer(
+            self.university, context={"student_counts": {1: 3}}
+        ).data
+
+        faculty = data["faculties"][0]
+        self.assertEqual(data["student_count"], 3)
+        self.assertEqual(faculty["student_count"], 3)
+        self.assertEqual(
+            [specialty["student_count"] for specialty in faculty["specialties"]],
+            [3, 0],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
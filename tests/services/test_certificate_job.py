@@ -0,0 +1,254 @@
+"""Unit tests for CertificateJobService."""
+
+import datetime
+import unittest
+from io import BytesIO
+from unittest.mock import patch, MagicMock
+from django.utils import timezone
+
+
+class TestCertificateJobService(unittest.TestCase):
+    """Test cases for CertificateJobService."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mock_job = MagicMock()
+        self.mock_job.id = 1
+        self.mock_job.student_id = 1
+        self.mock_job.document_type = "pdf"
+
+    @patch("app.services.certificate_job.transaction.on_commit")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    @patch("app.services.certificate_job.StudentRepository")
+    @patch("app.services.certificate_job.transaction.atomic")
+    def test_create_success(
+        self, mock_atomic, mock_student_repo, mock_repo, mock_on_commit
+    ):
+        """Test enqueuing a certificate job successfully."""
+        from app.services import CertificateJobService
+
+        mock_student_repo.exists_by_id.return_value = True
+        mock_repo.create.return_value = self.mock_job
+        mock_atomic.return_value.__enter__ = MagicMock()
+        mock_atomic.return_value.__exit__ = MagicMock()
+
+        result = CertificateJobService.create(1, "PDF")
+
+        mock_repo.create.assert_called_once_with(
+            {"student_id": 1, "document_type": "pdf"}
+        )
+        mock_on_commit.assert_called_once()
+        self.assertEqual(result, self.mock_job)
+
+    @patch("app.services.certificate_job.StudentRepository")
+    def test_create_student_not_found(self, mock_student_repo):
+        """Test enqueuing a job for a non-existent student raises ValueError."""
+        from app.services import CertificateJobService
+
+        mock_student_repo.exists_by_id.return_value = False
+
+        with self.assertRaises(ValueError) as context:
+            CertificateJobService.create(999, "pdf")
+
+        self.assertIn("does not exist", str(context.exception))
+
+    def test_create_unsupported_type(self):
+        """Test enqueuing a job with an unsupported type raises ValueError."""
+        from app.services import CertificateJobService
+
+        with self.assertRaises(ValueError) as context:
+            CertificateJobService.create(1, "txt")
+
+        self.assertIn("not supported", str(context.exception))
+
+    @patch("app.services.certificate_job.connection")
+    @patch("app.services.certificate_job.StudentService")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_run_success(self, mock_repo, mock_student_service, mock_connection):
+        """Test running a job stores the certificate and marks it done."""
+        from app.services import CertificateJobService
+
+        mock_repo.claim.return_value = True
+        mock_repo.find_by_id.return_value = self.mock_job
+        mock_student_service.get_regular_student_certificate.return_value = BytesIO(
+            b"PDF content"
+        )
+
+        CertificateJobService.run(1)
+
+        self.mock_job.result.save.assert_called_once()
+        self.assertEqual(self.mock_job.status, "done")
+        mock_repo.update.assert_called_once_with(self.mock_job)
+        mock_connection.close.assert_called_once()
+
+    @patch("app.services.certificate_job.connection")
+    @patch("app.services.certificate_job.StudentService")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_run_failure(self, mock_repo, mock_student_service, mock_connection):
+        """Test a failing render marks the job as failed with its error."""
+        from app.services import CertificateJobService
+
+        mock_repo.claim.return_value = True
+        mock_repo.find_by_id.return_value = self.mock_job
+        mock_student_service.get_regular_student_certificate.side_effect = ValueError(
+            "PDF generation failed"
+        )
+
+        CertificateJobService.run(1)
+
+        self.assertEqual(self.mock_job.status, "failed")
+        self.assertEqual(self.mock_job.error, "PDF generation failed")
+        mock_repo.update.assert_called_once_with(self.mock_job)
+
+    @patch("app.services.certificate_job.threading.Timer")
+    @patch("app.services.certificate_job.connection")
+    @patch("app.services.certificate_job.StudentService")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_run_deferred_when_busy(
+        self, mock_repo, mock_student_service, mock_connection, mock_timer
+    ):
+        """Test a job rejected by the render limiter is put back and retried."""
+        from app.services import CertificateJobService
+        from app.utils import RenderRejectedError
+
+        mock_repo.claim.return_value = True
+        mock_repo.find_by_id.return_value = self.mock_job
+        mock_student_service.get_regular_student_certificate.side_effect = (
+            RenderRejectedError("Certificate rendering is busy", 10)
+        )
+
+        CertificateJobService.run(1)
+
+        self.assertEqual(self.mock_job.status, "pending")
+        mock_repo.update.assert_called_once_with(self.mock_job)
+        mock_timer.assert_called_once_with(10, CertificateJobService._submit, args=(1,))
+        mock_timer.return_value.start.assert_called_once()
+
+    @patch("app.services.certificate_job.connection")
+    @patch("app.services.certificate_job.StudentService")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_run_already_claimed(
+        self, mock_repo, mock_student_service, mock_connection
+    ):
+        """Test a job taken by another worker is not rendered twice."""
+        from app.services import CertificateJobService
+
+        mock_repo.claim.return_value = False
+
+        CertificateJobService.run(1)
+
+        mock_student_service.get_regular_student_certificate.assert_not_called()
+        mock_repo.update.assert_not_called()
+
+    @patch("app.services.certificate_job.CertificateJobService._submit")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_recover(self, mock_repo, mock_submit):
+        """Test stale running jobs are requeued and pending ones submitted."""
+        from app.services import CertificateJobService
+
+        mock_repo.requeue_stale.return_value = [2]
+        mock_repo.find_by_status.return_value = [self.mock_job]
+
+        before = timezone.now() - datetime.timedelta(seconds=900)
+        CertificateJobService.recover()
+
+        (stale_before,) = mock_repo.requeue_stale.call_args.args
+        self.assertLess(abs((stale_before - before).total_seconds()), 5)
+        mock_repo.find_by_status.assert_called_once_with("pending")
+        self.assertEqual(
+            [call.args for call in mock_submit.call_args_list], [(2,), (1,)]
+        )
+
+    @patch("app.services.certificate_job.CertificateJobService._submit")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_find_by_id_requeues_stale_running_job(self, mock_repo, mock_submit):
+        """Test polling a job stuck in running requeues only stale running jobs."""
+        from app.services import CertificateJobService
+
+        self.mock_job.status = "running"
+        self.mock_job.updated_at = timezone.now() - datetime.timedelta(hours=1)
+        mock_repo.find_by_id.return_value = self.mock_job
+        mock_repo.requeue_stale.return_value = [1]
+
+        CertificateJobService.find_by_id(1)
+
+        mock_submit.assert_called_once_with(1)
+        mock_repo.find_by_status.assert_not_called()
+        self.assertEqual(mock_repo.find_by_id.call_count, 2)
+
+    @patch("app.services.certificate_job.CertificateJobService.requeue_stale")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_find_by_id_leaves_other_jobs(self, mock_repo, mock_requeue):
+        """Test recent, pending and finished jobs are left alone."""
+        from app.services import CertificateJobService
+
+        self.mock_job.status = "running"
+        self.mock_job.updated_at = timezone.now()
+        mock_repo.find_by_id.return_value = self.mock_job
+        CertificateJobService.find_by_id(1)
+
+        # A long backlog keeps old pending jobs; polling must not resubmit it
+        self.mock_job.status = "pending"
+        self.mock_job.updated_at = timezone.now() - datetime.timedelta(hours=1)
+        CertificateJobService.find_by_id(1)
+
+        self.mock_job.status = "done"
+        CertificateJobService.find_by_id(1)
+
+        mock_requeue.assert_not_called()
+
+    @patch("app.services.certificate_job.connection")
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    @patch("app.services.certificate_job.CertificateJobService._get_executor")
+    def test_submit_queues_each_job_once(
+        self, mock_get_executor, mock_repo, mock_connection
+    ):
+        """Test a job is queued once per process until its run ends."""
+        from app.services import CertificateJobService
+
+        mock_repo.claim.return_value = False
+
+        CertificateJobService._submit(41)
+        CertificateJobService._submit(41)
+        self.assertEqual(mock_get_executor.return_value.submit.call_count, 1)
+
+        CertificateJobService.run(41)
+        CertificateJobService._submit(41)
+        self.assertEqual(mock_get_executor.return_value.submit.call_count, 2)
+        CertificateJobService.run(41)
+
+    @patch("app.services.certificate_job.CertificateJobRepository")
+    def test_delete_expired(self, mock_repo):
+        """Test finished jobs past the max age are deleted with their files."""
+        from app.services import CertificateJobService
+
+        other_job = MagicMock(id=2, result=None)
+        mock_repo.find_finished_before.return_value = [self.mock_job, other_job]
+        mock_repo.delete_by_ids.return_value = 2
+
+        before = timezone.now() - datetime.timedelta(seconds=86400)
+        deleted = CertificateJobService.delete_expired()
+
+        self.assertEqual(deleted, 2)
+        (finished_before,) = mock_repo.find_finished_before.call_args.args
+        self.assertLess(abs((finished_before - before).total_seconds()), 5)
+        self.mock_job.result.delete.assert_called_once_with(save=False)
+        mock_repo.delete_by_ids.assert_called_once_with([1, 2])
+
+    @patch("app.services.certificate_job.CertificateJobService.delete_expired")
+    @patch("app.services.certificate_job.CertificateJobService.recover")
+    def test_recovers_on_first_request_only(self, mock_recover, mock_delete):
+        """Test jobs are recovered on a process's first request, not at import."""
+        from django.core.signals import request_started
+        from app.services import CertificateJobService
+
+        CertificateJobService.connect_signals()
+        request_started.send(sender=None)
+        request_started.send(sender=None)
+
+        mock_recover.assert_called_once_with()
+        mock_delete.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -32,7 +32,7 @@ class GenericServiceTestMixin:
 
             result = self.service_class.find_by_id(1)
 
-            mock_repo.find_by_id.assert_called_once_with(1)
+            mock_repo.find_by_id.assert_called_once_with(1, None)
             self.assertIsNotNone(result)
 
     def test_find_by_id_not_found(self):
@@ -1,8 +1,12 @@
 """Unit tests for StudentService."""
 
 import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from unittest.mock import patch, MagicMock
 from datetime import date
+from django.test import override_settings
 
 
 class TestStudentService(unittest.TestCase):
@@ -26,6 +30,10 @@ class TestStudentService(unittest.TestCase):
         self.mock_student.id = 1
         self.mock_student.student_number = 12345
 
+        # Batch renders run on threads instead of spawned processes
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(self.executor.shutdown)
+
     @patch("app.services.student.StudentRepository")
     @patch("app.services.student.SpecialtyRepository")
     @patch("app.services.student.DocumentTypeRepository")
@@ -55,6 +63,80 @@ class TestStudentService(unittest.TestCase):
         mock_repo.create.assert_called_once_with(self.student_data)
         self.assertEqual(result, self.mock_student)
 
+    @patch("app.services.student.HierarchyCache")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    @patch("app.services.student.DocumentTypeRepository")
+    def test_create_batch_success(
+        self, mock_doc_type_repo, mock_specialty_repo, mock_repo, mock_cache
+    ):
+        """Test a valid batch is checked with one query per check and inserted."""
+        from app.services import StudentService
+
+        second = {**self.student_data, "student_number": 2, "document_number": "2"}
+        mock_repo.find_existing_student_numbers.return_value = set()
+        mock_repo.find_existing_document_numbers.return_value = set()
+        mock_specialty_repo.find_existing_ids.return_value = {1}
+        mock_doc_type_repo.find_existing_ids.return_value = {1}
+        mock_repo.bulk_create.return_value = [self.mock_student, self.mock_student]
+
+        with override_settings(STUDENT_BATCH_CHUNK_SIZE=100):
+            students, errors = StudentService.create_batch([self.student_data, second])
+
+        self.assertEqual(errors, {})
+        self.assertEqual(len(students), 2)
+        mock_repo.find_existing_student_numbers.assert_called_once_with([12345, 2])
+        mock_repo.find_existing_document_numbers.assert_called_once_with(
+            ["12345678", "2"]
+        )
+        mock_specialty_repo.find_existing_ids.assert_called_once_with({1})
+        mock_doc_type_repo.find_existing_ids.assert_called_once_with({1})
+        mock_repo.bulk_create.assert_called_once_with([self.student_data, second], 100)
+        mock_cache.invalidate.assert_called_once_with(students=True)
+
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    @patch("app.services.student.DocumentTypeRepository")
+    def test_create_batch_row_errors(
+        self, mock_doc_type_repo, mock_specialty_repo, mock_repo
+    ):
+        """Test conflicts with the database and within the batch are reported."""
+        from app.services import StudentService
+
+        repeated = {**self.student_data, "student_number": 2}
+        unknown = {
+            **self.student_data,
+            "student_number": 3,
+            "document_number": "3",
+            "specialty_id": 9,
+            "document_type_id": 9,
+        }
+        mock_repo.find_existing_student_numbers.return_value = {12345}
+        mock_repo.find_existing_document_numbers.return_value = set()
+        mock_specialty_repo.find_existing_ids.return_value = {1}
+        mock_doc_type_repo.find_existing_ids.return_value = {1}
+
+        students, errors = StudentService.create_batch(
+            [self.student_data, repeated, unknown]
+        )
+
+        self.assertEqual(students, [])
+        self.assertEqual(
+            errors[0],
+            {
+                "student_number": ["Student number 12345 is already taken"],
+                "document_number": [
+                    "Document number 12345678 is repeated in the batch"
+                ],
+            },
+        )
+        self.assertEqual(
+            errors[1],
+            {"document_number": ["Document number 12345678 is repeated in the batch"]},
+        )
+        self.assertEqual(set(errors[2]), {"specialty_id", "document_type_id"})
+        mock_repo.bulk_create.assert_not_called()
+
     @patch("app.services.student.StudentRepository")
     def test_create_duplicate_student_number(self, mock_repo):
         """Test creating a student with duplicate student number raises ValueError."""
@@ -77,7 +159,7 @@ class TestStudentService(unittest.TestCase):
 
         result = StudentService.find_by_id(1)
 
-        mock_repo.find_by_id.assert_called_once_with(1)
+        mock_repo.find_by_id.assert_called_once_with(1, None)
         self.assertEqual(result, self.mock_student)
 
     @patch("app.services.student.StudentRepository")
@@ -105,6 +187,72 @@ class TestStudentService(unittest.TestCase):
         mock_repo.find_all.assert_called_once()
         self.assertEqual(len(result), 2)
 
+    @patch("app.services.student.StudentRepository")
+    def test_find_page_after(self, mock_repo):
+        """Test finding a keyset page of students."""
+        from app.services import StudentService
+
+        mock_repo.find_page_after.return_value = [self.mock_student]
+
+        result = StudentService.find_page_after(("Pérez", "Juan", 7), 50, True)
+
+        mock_repo.find_page_after.assert_called_once_with(
+            ("Pérez", "Juan", 7), 50, True, None, None
+        )
+        self.assertEqual(result, [self.mock_student])
+
+    @patch("app.services.student.StudentRepository")
+    def test_find_page_values(self, mock_repo):
+        """Test finding a page of students as values() rows."""
+        from app.services import StudentService
+
+        mock_repo.find_page_values.return_value = [{"id": 1}]
+
+        result = StudentService.find_page_values(0, 10, ["id"], {"gender": "F"})
+
+        mock_repo.find_page_values.assert_called_once_with(
+            0, 10, ["id"], {"gender": "F"}
+        )
+        self.assertEqual(result, [{"id": 1}])
+
+    @patch("app.services.student.StudentRepository")
+    def test_count_estimate(self, mock_repo):
+        """Test estimated counts use the configured exact-count threshold."""
+        from app.services import StudentService
+
+        mock_repo.count_estimate.return_value = 2500000
+
+        with override_settings(COUNT_ESTIMATE_THRESHOLD=5000):
+            result = StudentService.count_estimate({"gender": "F"})
+
+        mock_repo.count_estimate.assert_called_once_with(5000, {"gender": "F"})
+        self.assertEqual(result, 2500000)
+
+    @patch("app.services.student.StudentRepository")
+    def test_count_by_specialty(self, mock_repo):
+        """Test student counts per specialty come from the repository."""
+        from app.services import StudentService
+
+        mock_repo.count_by_specialty.return_value = {1: 3}
+
+        result = StudentService.count_by_specialty(1)
+
+        mock_repo.count_by_specialty.assert_called_once_with(1)
+        self.assertEqual(result, {1: 3})
+
+    @patch("app.services.student.StudentRepository")
+    def test_export(self, mock_repo):
+        """Test exporting students streams repository values."""
+        from app.services import StudentService
+
+        mock_repo.iter_values.return_value = iter([{"id": 1}])
+
+        with override_settings(EXPORT_CHUNK_SIZE=250):
+            result = StudentService.export(["id"], {"gender": "F"})
+
+        mock_repo.iter_values.assert_called_once_with(["id"], {"gender": "F"}, 250)
+        self.assertEqual(list(result), [{"id": 1}])
+
     @patch("app.services.student.StudentRepository")
     @patch("app.services.student.transaction.atomic")
     def test_update_success(self, mock_atomic, mock_repo):
@@ -154,6 +302,386 @@ class TestStudentService(unittest.TestCase):
         mock_repo.delete_by_id.assert_called_once_with(1)
         self.assertTrue(result)
 
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_certificates_archive_specialty_not_found(
+        self, mock_specialty_repo, mock_repo
+    ):
+        """Test generating a certificates archive for a missing specialty."""
+        from app.services import StudentService
+
+        mock_specialty_repo.exists_by_id.return_value = False
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.generate_certificates_archive("pdf", specialty_id=999)
+
+        self.assertIn("does not exist", str(context.exception))
+        mock_repo.find_by_specialty_with_full_relations.assert_not_called()
+
+    def test_generate_certificates_archive_requires_scope(self):
+        """Test generating a certificates archive without specialty or faculty."""
+        from app.services import StudentService
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.generate_certificates_archive("pdf")
+
+        self.assertIn("specialty or faculty", str(context.exception))
+
+    def test_generate_certificates_archive_unsupported_type(self):
+        """Test generating a certificates archive with an unsupported type."""
+        from app.services import StudentService
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.generate_certificates_archive("txt", specialty_id=1)
+
+        self.assertIn("not supported", str(context.exception))
+
+    @patch("app.services.student.get_document_generator")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_merged_certificates(
+        self, mock_specialty_repo, mock_repo, mock_get_generator
+    ):
+        """Test the merged PDF is rendered once with every student's certificate."""
+        from app.services import StudentService
+
+        other_student = MagicMock()
+        other_student.id = 2
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [
+            self.mock_student,
+            other_student,
+        ]
+        mock_generator = mock_get_generator.return_value
+        mock_generator.generate.return_value = BytesIO(b"PDF content")
+
+        result = StudentService.generate_merged_certificates(specialty_id=1)
+
+        self.assertEqual(result.read(), b"PDF content")
+        mock_get_generator.assert_called_once_with("pdf")
+        mock_generator.generate.assert_called_once()
+        context = mock_generator.generate.call_args.kwargs["context"]
+        self.assertEqual(
+            [certificate["student"] for certificate in context["certificates"]],
+            [self.mock_student, other_student],
+        )
+
+    @override_settings(CERTIFICATE_MERGED_MAX_SIZE=2)
+    @patch("app.services.student.get_document_generator")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_merged_certificates_too_large(
+        self, mock_specialty_repo, mock_repo, mock_get_generator
+    ):
+        """Test cohorts over the merged PDF limit are rejected before rendering."""
+        from app.services import StudentService
+
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [
+            MagicMock(id=student_id) for student_id in range(3)
+        ]
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.generate_merged_certificates(specialty_id=1)
+
+        self.assertIn("cannot exceed 2 students", str(context.exception))
+        mock_repo.find_by_specialty_with_full_relations.assert_called_once_with(
+            1, limit=3
+        )
+        mock_get_generator.return_value.generate.assert_not_called()
+
+    @override_settings(
+        CERTIFICATE_MERGED_STUDENTS_PER_SLOT=50, CERTIFICATE_RENDER_CONCURRENCY=4
+    )
+    @patch("app.utils.render_limiter._limiter", None)
+    @patch("app.services.student.get_document_generator")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_merged_certificates_holds_slots_by_size(
+        self, mock_specialty_repo, mock_repo, mock_get_generator
+    ):
+        """Test a large cohort holds extra limiter slots while it renders."""
+        from app.services import StudentService
+        from app.utils import get_render_limiter
+
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [
+            MagicMock(id=student_id) for student_id in range(120)
+        ]
+        in_flight = []
+
+        def generate(**kwargs):
+            # The real generate() takes the last of the three slots itself
+            in_flight.append(get_render_limiter().get_stats()["in_flight"])
+            return BytesIO(b"PDF content")
+
+        mock_get_generator.return_value.generate.side_effect = generate
+
+        StudentService.generate_merged_certificates(specialty_id=1)
+
+        self.assertEqual(in_flight, [2])
+        self.assertEqual(get_render_limiter().get_stats()["in_flight"], 0)
+
+    def test_merged_certificate_title_single_student(self):
+        """Test a one-student merged PDF is titled after that student."""
+        from types import SimpleNamespace
+        from django.template.loader import render_to_string
+
+        student = SimpleNamespace(first_name="Juan", last_name="Pérez")
+
+        html = render_to_string(
+            "certificado/certificado_pdf.html",
+            {"certificates": [{"student": student}]},
+        )
+
+        self.assertIn("<title>Certificado para el Alumno: Pérez, Juan</title>", html)
+
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.FacultyRepository")
+    def test_generate_merged_certificates_no_students(
+        self, mock_faculty_repo, mock_repo
+    ):
+        """Test generating a merged PDF for a faculty without students."""
+        from app.services import StudentService
+
+        mock_faculty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_faculty_with_full_relations.return_value = []
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.generate_merged_certificates(faculty_id=1)
+
+        self.assertIn("No students found", str(context.exception))
+
+    @patch("app.services.student.StudentService._render_certificate")
+    @patch("app.services.student.get_batch_executor")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.FacultyRepository")
+    def test_generate_certificates_archive_by_faculty(
+        self, mock_faculty_repo, mock_repo, mock_get_executor, mock_render
+    ):
+        """Test the archive contains one certificate per student of the faculty."""
+        from app.services import StudentService
+
+        students = [MagicMock(id=1), MagicMock(id=2)]
+        mock_get_executor.return_value = self.executor
+        mock_faculty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_faculty_with_full_relations.return_value = students
+        mock_render.return_value = b"PDF content"
+
+        archive = b"".join(
+            StudentService.generate_certificates_archive("pdf", faculty_id=1)
+        )
+
+        mock_repo.find_by_faculty_with_full_relations.assert_called_once_with(
+            1, limit=None
+        )
+        with zipfile.ZipFile(BytesIO(archive)) as zip_file:
+            self.assertEqual(
+                sorted(zip_file.namelist()),
+                ["certificado_estudiante_1.pdf", "certificado_estudiante_2.pdf"],
+            )
+            self.assertEqual(
+                zip_file.read("certificado_estudiante_1.pdf"), b"PDF content"
+            )
+
+    @patch("app.services.student.StudentService._render_certificate")
+    @patch("app.services.student.get_batch_executor")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_certificates_archive_reports_failures(
+        self, mock_specialty_repo, mock_repo, mock_get_executor, mock_render
+    ):
+        """Test failed renders are listed in the archive instead of aborting it."""
+        from app.services import StudentService
+
+        mock_get_executor.return_value = self.executor
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [MagicMock(id=1)]
+        mock_render.side_effect = ValueError("PDF generation failed")
+
+        archive = b"".join(
+            StudentService.generate_certificates_archive("pdf", specialty_id=1)
+        )
+
+        with zipfile.ZipFile(BytesIO(archive)) as zip_file:
+            self.assertEqual(zip_file.namelist(), ["errores.txt"])
+            self.assertIn(b"certificado_estudiante_1.pdf", zip_file.read("errores.txt"))
+
+    @override_settings(
+        CERTIFICATE_BATCH_WORKERS=4,
+        CERTIFICATE_RENDER_CONCURRENCY=2,
+        CERTIFICATE_RENDER_QUEUE_DEPTH=0,
+    )
+    @patch("app.utils.render_limiter._limiter", None)
+    @patch("app.services.student.StudentService._render_certificate")
+    @patch("app.services.student.get_batch_executor")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_certificates_archive_holds_limiter_slots(
+        self, mock_specialty_repo, mock_repo, mock_get_executor, mock_render
+    ):
+        """Test an archive holds one slot per render in flight until it ends."""
+        from app.services import StudentService
+        from app.utils import RenderRejectedError, get_render_limiter
+
+        mock_get_executor.return_value = self.executor
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [
+            MagicMock(id=student_id) for student_id in range(1, 6)
+        ]
+        in_flight = []
+
+        def render(type, context):
+            in_flight.append(get_render_limiter().get_stats()["in_flight"])
+            return b"PDF content"
+
+        mock_render.side_effect = render
+
+        archive = StudentService.generate_certificates_archive("pdf", specialty_id=1)
+
+        # Both slots are taken up front, so another render is rejected
+        with self.assertRaises(RenderRejectedError):
+            StudentService.generate_certificates_archive("pdf", specialty_id=1)
+
+        with zipfile.ZipFile(BytesIO(b"".join(archive))) as zip_file:
+            self.assertEqual(len(zip_file.namelist()), 5)
+        self.assertEqual(in_flight, [2] * 5)
+        self.assertEqual(get_render_limiter().get_stats()["in_flight"], 0)
+
+    @patch("app.utils.render_limiter._limiter", None)
+    @patch("app.services.student.StudentService._render_certificate")
+    @patch("app.services.student.get_batch_executor")
+    @patch("app.services.student.StudentRepository")
+    @patch("app.services.student.SpecialtyRepository")
+    def test_generate_certificates_archive_releases_slots_on_close(
+        self, mock_specialty_repo, mock_repo, mock_get_executor, mock_render
+    ):
+        """Test a disconnected client gives the archive's slots back."""
+        from app.services import StudentService
+        from app.utils import get_render_limiter
+
+        mock_get_executor.return_value = self.executor
+        mock_specialty_repo.exists_by_id.return_value = True
+        mock_repo.find_by_specialty_with_full_relations.return_value = [MagicMock(id=1)]
+
+        archive = StudentService.generate_certificates_archive("pdf", specialty_id=1)
+        self.assertGreater(get_render_limiter().get_stats()["in_flight"], 0)
+        archive.close()
+
+        self.assertEqual(get_render_limiter().get_stats()["in_flight"], 0)
+        mock_render.assert_not_called()
+
+    @patch("app.services.student.DocumentCache")
+    @patch("app.services.student.get_document_generator")
+    @patch("app.services.student.StudentRepository")
+    def test_get_regular_student_certificate_cache_hit(
+        self, mock_repo, mock_get_generator, mock_cache
+    ):
+        """Test a cached certificate is returned without rendering."""
+        from app.services import StudentService
+
+        cached_document = MagicMock()
+        mock_repo.find_with_full_relations.return_value = self.mock_student
+        mock_cache.get.return_value = cached_document
+
+        result = StudentService.get_regular_student_certificate(1, "pdf")
+
+        self.assertEqual(result, cached_document)
+        mock_get_generator.return_value.generate.assert_not_called()
+        mock_cache.put.assert_not_called()
+
+    @patch("app.services.student.DocumentCache")
+    @patch("app.services.student.get_document_generator")
+    @patch("app.services.student.StudentRepository")
+    def test_get_regular_student_certificate_cache_miss(
+        self, mock_repo, mock_get_generator, mock_cache
+    ):
+        """Test a missing certificate is rendered and stored in the cache."""
+        from app.services import StudentService
+
+        document = BytesIO(b"PDF content")
+        mock_repo.find_with_full_relations.return_value = self.mock_student
+        mock_generator = mock_get_generator.return_value
+        mock_generator.extension = "pdf"
+        mock_generator.generate.return_value = document
+        mock_cache.get.return_value = None
+
+        StudentService.get_regular_student_certificate(1, "pdf")
+
+        mock_generator.generate.assert_called_once()
+        mock_cache.put.assert_called_once_with(
+            mock_cache.build_key.return_value, "pdf", document
+        )
+
+    @patch("app.services.student.StudentRepository")
+    def test_get_regular_student_certificate_not_found(self, mock_repo):
+        """Test getting the certificate of a non-existent student."""
+        from app.services import StudentService
+
+        mock_repo.find_with_full_relations.return_value = None
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.get_regular_student_certificate(999, "pdf")
+
+        self.assertIn("not found", str(context.exception))
+
+    @patch("app.services.student.StudentService._get_current_date")
+    @patch("app.services.student.DocumentCache")
+    @patch("app.services.student.StudentRepository")
+    def test_get_certificate_validators_match_cache_key(
+        self, mock_repo, mock_cache, mock_date
+    ):
+        """Test the ETag is the certificate cache key, computed without a render."""
+        from datetime import datetime
+        from app.services import StudentService
+
+        versions = (datetime(2024, 1, 1),) * 4
+        mock_repo.find_certificate_versions.return_value = versions
+        mock_cache.build_key.return_value = "abc"
+        mock_cache.get_template_hash.return_value = "template"
+        mock_date.return_value = "1 de enero de 2024"
+
+        etag, last_modified = StudentService.get_certificate_validators(1, "pdf")
+
+        self.assertEqual(etag, '"abc"')
+        self.assertIsInstance(last_modified, int)
+        mock_cache.build_key.assert_called_once_with(
+            1, *versions, "template", "pdf", False, "1 de enero de 2024"
+        )
+        mock_repo.find_with_full_relations.assert_not_called()
+
+    @patch("app.services.student.StudentRepository")
+    def test_get_certificate_validators_not_found(self, mock_repo):
+        """Test validators of a non-existent student raise ValueError."""
+        from app.services import StudentService
+
+        mock_repo.find_certificate_versions.return_value = None
+
+        with self.assertRaises(ValueError) as context:
+            StudentService.get_certificate_validators(999, "pdf")
+
+        self.assertIn("not found", str(context.exception))
+
+    def test_get_student_data_office_placeholders(self):
+        """Test the context carries the names used by the ODT/DOCX templates."""
+        from app.services import StudentService
+
+        self.mock_student.first_name = "Juan"
+        self.mock_student.last_name = "Pérez"
+        self.mock_student.document_number = "12345678"
+        self.mock_student.document_type.abbreviation = "L.E"
+        self.mock_student.specialty.name = "Sistemas"
+
+        context = StudentService._get_student_data(self.mock_student)
+
+        self.assertEqual(context["alumno"]["apellido"], "Pérez")
+        self.assertEqual(context["alumno"]["tipo_documento"], {"sigla": "L.E"})
+        self.assertEqual(context["alumno"]["nrodocumento"], "12345678")
+        self.assertEqual(context["alumno"]["nro_legajo"], 12345)
+        self.assertEqual(context["especialidad"]["nombre"], "Sistemas")
+        self.assertEqual(context["fecha"], context["date"])
+        self.assertEqual(context["certificates"], [context])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -75,7 +75,7 @@ class TestUniversityService(unittest.TestCase):
 
         result = UniversityService.find_by_id(1)
 
-        mock_repo.find_by_id.assert_called_once_with(1)
+        mock_repo.find_by_id.assert_called_once_with(1, None)
         self.assertEqual(result, self.mock_university)
 
     @patch("app.services.university.UniversityRepository")
@@ -89,6 +89,18 @@ class TestUniversityService(unittest.TestCase):
 
         self.assertIsNone(result)
 
+    @patch("app.services.university.UniversityRepository")
+    def test_find_tree(self, mock_repo):
+        """Test finding the hierarchy tree of a university."""
+        from app.services import UniversityService
+
+        mock_repo.find_tree.return_value = self.mock_university
+
+        result = UniversityService.find_tree(1)
+
+        mock_repo.find_tree.assert_called_once_with(1)
+        self.assertEqual(result, self.mock_university)
+
     @patch("app.services.university.UniversityRepository")
     def test_find_by_name_success(self, mock_repo):
         """Test finding a university by name successfully."""
@@ -116,6 +128,27 @@ class TestUniversityService(unittest.TestCase):
         mock_repo.find_all.assert_called_once()
         self.assertEqual(len(result), 2)
 
+    @patch("app.services.university.UniversityRepository")
+    def test_find_page(self, mock_repo):
+        """Test finding a page of universities."""
+        from app.services import UniversityService
+
+        mock_repo.find_page.return_value = [self.mock_university]
+
+        result = UniversityService.find_page(0, 10)
+
+        mock_repo.find_page.assert_called_once_with(0, 10, None, None)
+        self.assertEqual(result, [self.mock_university])
+
+    @patch("app.services.university.UniversityRepository")
+    def test_count(self, mock_repo):
+        """Test counting universities."""
+        from app.services import UniversityService
+
+        mock_repo.count.return_value = 5
+
+        self.assertEqual(UniversityService.count(), 5)
+
     @patch("app.services.university.UniversityRepository")
     @patch("app.services.university.transaction.atomic")
     def test_update_success(self, mock_atomic, mock_repo):
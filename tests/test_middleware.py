@@ -0,0 +1,32 @@
+"""Unit tests for the project middleware."""
+
+import unittest
+from unittest.mock import MagicMock
+
+from app.models import Student
+from app.repositories.identity_map import IdentityMap
+
+
+class TestIdentityMapMiddleware(unittest.TestCase):
+    """Test cases for IdentityMapMiddleware."""
+
+    def test_request_runs_inside_one_identity_map(self):
+        """Test lookups made while handling a request share one map."""
+        from app.middleware import IdentityMapMiddleware
+
+        load = MagicMock()
+        find_by_id = IdentityMap.memoize_find_by_id(Student)(load)
+
+        def view(request):
+            find_by_id(1)
+            find_by_id(1)
+            return "response"
+
+        middleware = IdentityMapMiddleware(view)
+
+        self.assertEqual(middleware(MagicMock()), "response")
+        load.assert_called_once()
+
+        # The map is closed once the response is returned
+        find_by_id(1)
+        self.assertEqual(load.call_count, 2)
@@ -0,0 +1,34 @@
+"""Unit tests for archive utilities."""
+
+import unittest
+import zipfile
+from io import BytesIO
+
+
+class TestStreamZip(unittest.TestCase):
+    """Test cases for stream_zip."""
+
+    def test_stream_zip_yields_chunk_per_entry(self):
+        """Test one chunk is yielded per entry plus the central directory."""
+        from app.utils.archive import stream_zip
+
+        chunks = list(stream_zip([("a.pdf", b"first"), ("b.pdf", b"second")]))
+
+        self.assertEqual(len(chunks), 3)
+        with zipfile.ZipFile(BytesIO(b"".join(chunks))) as zip_file:
+            self.assertEqual(zip_file.namelist(), ["a.pdf", "b.pdf"])
+            self.assertEqual(zip_file.read("b.pdf"), b"second")
+            self.assertIsNone(zip_file.testzip())
+
+    def test_stream_zip_empty(self):
+        """Test an empty archive is still a valid ZIP file."""
+        from app.utils.archive import stream_zip
+
+        data = b"".join(stream_zip([]))
+
+        with zipfile.ZipFile(BytesIO(data)) as zip_file:
+            self.assertEqual(zip_file.namelist(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
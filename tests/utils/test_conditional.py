@@ -0,0 +1,79 @@
+"""Unit tests for conditional request helpers."""
+
+import datetime
+import unittest
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+
+from app.utils.conditional import (
+    get_not_modified_response,
+    get_validators,
+    set_validators,
+    versioned_fields,
+)
+
+UPDATED_AT = datetime.datetime(2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc)
+
+
+class TestConditional(unittest.TestCase):
+    """Test cases for the ETag/Last-Modified helpers."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+
+    def test_versioned_fields(self):
+        """Test updated_at is loaded along with a sparse fieldset."""
+        self.assertIsNone(versioned_fields(None))
+        self.assertEqual(versioned_fields(["name"]), ["name", "updated_at"])
+        self.assertEqual(
+            versioned_fields(["updated_at", "name"]), ["updated_at", "name"]
+        )
+
+    def test_validators_depend_on_url_and_versions(self):
+        """Test each URL and each version gets its own ETag."""
+        request = Request(self.factory.get("/api/areas/"))
+        etag, last_modified = get_validators(request, UPDATED_AT, 3)
+
+        self.assertEqual(last_modified, int(UPDATED_AT.timestamp()))
+        self.assertEqual(get_validators(request, UPDATED_AT, 3)[0], etag)
+        self.assertNotEqual(get_validators(request, UPDATED_AT, 2)[0], etag)
+        self.assertNotEqual(
+            get_validators(
+                Request(self.factory.get("/api/areas/?page=2")), UPDATED_AT, 3
+            )[0],
+            etag,
+        )
+
+    def test_empty_lists_have_no_last_modified(self):
+        """Test a list without rows only gets an ETag."""
+        request = Request(self.factory.get("/api/areas/"))
+        etag, last_modified = get_validators(request, None, 0)
+
+        response = set_validators(Response({}), etag, last_modified)
+
+        self.assertIsNone(last_modified)
+        self.assertEqual(response["ETag"], etag)
+        self.assertNotIn("Last-Modified", response)
+
+    def test_not_modified_response(self):
+        """Test matching validators get a 304 and others None."""
+        etag, last_modified = get_validators(
+            Request(self.factory.get("/api/areas/1/")), UPDATED_AT
+        )
+
+        matching = Request(self.factory.get("/api/areas/1/", HTTP_IF_NONE_MATCH=etag))
+        response = get_not_modified_response(matching, etag, last_modified)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        stale = Request(self.factory.get("/api/areas/1/", HTTP_IF_NONE_MATCH='"old"'))
+        self.assertIsNone(get_not_modified_response(stale, etag, last_modified))
+        plain = Request(self.factory.get("/api/areas/1/"))
+        self.assertIsNone(get_not_modified_response(plain, etag, last_modified))
+
+
+if __name__ == "__main__":
+    unittest.main()
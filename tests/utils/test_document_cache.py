@@ -0,0 +1,143 @@
+"""Unit tests for DocumentCache."""
+
+import os
+import tempfile
+import time
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+from django.test import override_settings
+
+
+class TestDocumentCache(unittest.TestCase):
+    """Test cases for DocumentCache."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.temp_dir.name, "certificates")
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.temp_dir.cleanup()
+
+    def test_build_key_is_deterministic(self):
+        """Test the same inputs always produce the same key."""
+        from app.utils.document_cache import DocumentCache
+
+        key = DocumentCache.build_key(1, "2025-01-01", "pdf")
+
+        self.assertEqual(key, DocumentCache.build_key(1, "2025-01-01", "pdf"))
+        self.assertNotEqual(key, DocumentCache.build_key(1, "2025-01-01", "odt"))
+
+    def test_get_miss(self):
+        """Test a missing key returns None."""
+        from app.utils.document_cache import DocumentCache
+
+        with override_settings(CERTIFICATE_CACHE_DIR=self.cache_dir):
+            self.assertIsNone(DocumentCache.get("ab" * 32, "pdf"))
+
+    def test_put_then_get(self):
+        """Test a stored document is served from disk afterwards."""
+        from app.utils.document_cache import DocumentCache
+
+        key = DocumentCache.build_key("student", 1)
+
+        with override_settings(CERTIFICATE_CACHE_DIR=self.cache_dir):
+            stored = DocumentCache.put(key, "pdf", BytesIO(b"PDF content"))
+            stored.close()
+            cached = DocumentCache.get(key, "pdf")
+
+        self.assertIsNotNone(cached)
+        with cached:
+            self.assertEqual(cached.read(), b"PDF content")
+            self.assertTrue(cached.name.startswith(self.cache_dir))
+
+    def test_put_disabled_returns_document(self):
+        """Test documents are returned untouched when the cache is disabled."""
+        from app.utils.document_cache import DocumentCache
+
+        document = BytesIO(b"PDF content")
+
+        with override_settings(CERTIFICATE_CACHE_DIR=""):
+            result = DocumentCache.put("ab" * 32, "pdf", document)
+
+        self.assertIs(result, document)
+
+    def test_get_template_hash_changes_with_content(self):
+        """Test the template hash follows the template file content."""
+        from app.utils.document_cache import DocumentCache
+
+        path = os.path.join(self.temp_dir.name, "template.html")
+        with open(path, "w") as f:
+            f.write("first")
+        first_hash = DocumentCache.get_template_hash(path)
+
+        with open(path, "w") as f:
+            f.write("second")
+        os.utime(path, (0, 0))
+
+        self.assertNotEqual(first_hash, DocumentCache.get_template_hash(path))
+
+    def test_get_template_hash_keeps_latest_mtime(self):
+        """Test only the latest hash of each template is memoized."""
+        from app.utils.document_cache import DocumentCache, _template_hashes
+
+        path = os.path.join(self.temp_dir.name, "template.html")
+        for mtime in range(3):
+            with open(path, "w") as f:
+                f.write(str(mtime))
+            os.utime(path, (mtime, mtime))
+            DocumentCache.get_template_hash(path)
+
+        self.assertEqual(_template_hashes[path][0], 2)
+        self.assertNotIn((path, 0), _template_hashes)
+
+    def test_prune_deletes_expired_documents(self):
+        """Test documents older than the max age are deleted, newer ones kept."""
+        from app.utils.document_cache import DocumentCache
+
+        with override_settings(CERTIFICATE_CACHE_DIR=self.cache_dir):
+            DocumentCache.put("aa" * 32, "pdf", BytesIO(b"old")).close()
+            fresh = DocumentCache.put("bb" * 32, "pdf", BytesIO(b"new"))
+            fresh.close()
+            old_path = DocumentCache.get_path("aa" * 32, "pdf")
+            expired = time.time() - 2 * 86400
+            os.utime(old_path, (expired, expired))
+
+            deleted = DocumentCache.prune(86400)
+
+        self.assertEqual(deleted, 1)
+        self.assertFalse(os.path.exists(old_path))
+        self.assertTrue(os.path.exists(fresh.name))
+
+    @patch("app.utils.document_cache.DocumentCache.prune")
+    @patch("app.utils.document_cache._last_prune", None)
+    def test_put_prunes_at_most_once_per_interval(self, mock_prune):
+        """Test put() sweeps expired documents without walking the cache each time."""
+        from app.utils.document_cache import DocumentCache
+
+        with override_settings(CERTIFICATE_CACHE_DIR=self.cache_dir):
+            DocumentCache.put("aa" * 32, "pdf", BytesIO(b"first")).close()
+            DocumentCache.put("bb" * 32, "pdf", BytesIO(b"second")).close()
+
+        mock_prune.assert_called_once_with()
+
+    def test_get_sendfile_location_with_prefix(self):
+        """Test the sendfile location is mapped onto the internal prefix."""
+        from app.utils.document_cache import DocumentCache
+
+        path = os.path.join(self.cache_dir, "ab", "abcd.pdf")
+
+        with override_settings(
+            CERTIFICATE_CACHE_DIR=self.cache_dir,
+            CERTIFICATE_SENDFILE_PREFIX="/protected/certificates/",
+        ):
+            location = DocumentCache.get_sendfile_location(path)
+
+        self.assertEqual(location, "/protected/certificates/ab/abcd.pdf")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,8 @@
 """Unit tests for document_generator utilities."""
 
 import unittest
-from unittest.mock import patch, MagicMock, mock_open
+import zipfile
+from unittest.mock import patch, MagicMock
 from io import BytesIO
 import os
 
@@ -32,6 +33,25 @@ class TestPDFDocument(unittest.TestCase):
         mock_render.assert_called_once()
         mock_html.assert_called_once()
 
+    @patch("app.utils.document_generator.HTML")
+    @patch("app.utils.document_generator.render_to_string")
+    def test_generate_pdf_compact(self, mock_render, mock_html):
+        """Test compact PDFs use optimized images."""
+        from app.utils.document_generator import (
+            PDFDocument,
+            compact_static_url_fetcher,
+        )
+
+        mock_render.return_value = "<html><body>Test</body></html>"
+
+        PDFDocument.generate(self.folder, self.template, self.context, compact=True)
+
+        self.assertIs(
+            mock_html.call_args.kwargs["url_fetcher"], compact_static_url_fetcher
+        )
+        write_options = mock_html.return_value.write_pdf.call_args.kwargs
+        self.assertTrue(write_options["optimize_images"])
+
     @patch("app.utils.document_generator.render_to_string")
     def test_generate_pdf_template_not_found(self, mock_render):
         """Test PDF generation with non-existent template."""
@@ -82,41 +102,30 @@ class TestODTDocument(unittest.TestCase):
 
         self.assertIn("Template not found", str(context.exception))
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"ODT content")
-    @patch("app.utils.document_generator.tempfile.NamedTemporaryFile")
-    @patch("app.utils.document_generator.os.unlink")
+    @patch("app.utils.document_generator.os.path.getmtime")
     @patch("app.utils.document_generator.os.path.exists")
-    @patch("app.utils.document_generator.ODTTemplate")
-    @patch("app.utils.document_generator.get_odt_renderer")
+    @patch("app.utils.document_generator._load_odt_template")
+    @patch("app.utils.document_generator._get_odt_renderer")
     @patch("app.utils.document_generator.os.path.join")
     def test_generate_odt_success(
         self,
         mock_join,
         mock_renderer,
-        mock_template_class,
+        mock_load_template,
         mock_exists,
-        mock_unlink,
-        mock_tempfile,
-        mock_file,
+        mock_getmtime,
     ):
         """Test generating ODT successfully."""
         from app.utils.document_generator import ODTDocument
 
         mock_join.return_value = "/fake/path/template.odt"
         mock_exists.return_value = True
-
-        # Mock temp file
-        mock_temp = MagicMock()
-        mock_temp.name = "/tmp/temp.odt"
-        mock_temp.__enter__ = MagicMock(return_value=mock_temp)
-        mock_temp.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_temp
+        mock_getmtime.return_value = 1.0
 
         mock_odt_template = MagicMock()
-        mock_template_class.return_value.__enter__ = MagicMock(
-            return_value=mock_odt_template
-        )
-        mock_template_class.return_value.__exit__ = MagicMock()
+        mock_template_copy = mock_load_template.return_value.copy.return_value
+        mock_template_copy.__enter__ = MagicMock(return_value=mock_odt_template)
+        mock_template_copy.__exit__ = MagicMock()
 
         mock_renderer_instance = MagicMock()
         mock_renderer.return_value = mock_renderer_instance
@@ -124,30 +133,25 @@ class TestODTDocument(unittest.TestCase):
         result = ODTDocument.generate(self.folder, self.template, self.context)
 
         self.assertIsInstance(result, BytesIO)
+        mock_load_template.assert_called_once_with("/fake/path/template.odt", 1.0)
+        mock_odt_template.pack.assert_called_once_with(result)
 
-    @patch("app.utils.document_generator.os.unlink")
-    @patch("app.utils.document_generator.tempfile.NamedTemporaryFile")
+    @patch("app.utils.document_generator.os.path.getmtime")
     @patch("app.utils.document_generator.os.path.exists")
     @patch("app.utils.document_generator.os.path.join")
-    @patch("app.utils.document_generator.ODTTemplate")
-    @patch("app.utils.document_generator.get_odt_renderer")
+    @patch("app.utils.document_generator._load_odt_template")
+    @patch("app.utils.document_generator._get_odt_renderer")
     def test_generate_odt_render_error(
-        self, mock_renderer, mock_template_class, mock_join, mock_exists, mock_tempfile, mock_unlink
+        self, mock_renderer, mock_load_template, mock_join, mock_exists, mock_getmtime
     ):
         """Test ODT generation with render error."""
         from app.utils.document_generator import ODTDocument
 
         mock_join.return_value = "/fake/path/template.odt"
         mock_exists.return_value = True
+        mock_getmtime.return_value = 1.0
 
-        # Mock temp file
-        mock_temp = MagicMock()
-        mock_temp.name = "/tmp/temp.odt"
-        mock_temp.__enter__ = MagicMock(return_value=mock_temp)
-        mock_temp.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_temp
-
-        mock_template_class.return_value.__enter__ = MagicMock(
+        mock_load_template.return_value.copy.return_value.__enter__ = MagicMock(
             side_effect=Exception("Render error")
         )
 
@@ -156,6 +160,26 @@ class TestODTDocument(unittest.TestCase):
 
         self.assertIn("ODT generation failed", str(context.exception))
 
+    def test_generate_odt_into_output_stream(self):
+        """Test ODT is packed into a caller-supplied stream without temp files."""
+        from app.utils.document_generator import ODTDocument
+
+        output = BytesIO()
+        with patch("tempfile.NamedTemporaryFile") as mock_tempfile, patch(
+            "tempfile.TemporaryDirectory"
+        ) as mock_tempdir:
+            result = ODTDocument.generate(
+                "certificado", "certificado_pdf", self.context, output=output
+            )
+
+        self.assertIs(result, output)
+        mock_tempfile.assert_not_called()
+        mock_tempdir.assert_not_called()
+        output.seek(0)
+        with zipfile.ZipFile(output) as archive:
+            self.assertEqual(archive.namelist()[0], "mimetype")
+            self.assertIn("content.xml", archive.namelist())
+
 
 class TestDOCXDocument(unittest.TestCase):
     """Test cases for DOCXDocument generator."""
@@ -180,35 +204,27 @@ class TestDOCXDocument(unittest.TestCase):
 
         self.assertIn("Template not found", str(context.exception))
 
-    @patch("builtins.open", new_callable=mock_open, read_data=b"DOCX content")
-    @patch("app.utils.document_generator.tempfile.NamedTemporaryFile")
-    @patch("app.utils.document_generator.os.unlink")
+    @patch("app.utils.document_generator.os.path.getmtime")
     @patch("app.utils.document_generator.os.path.exists")
     @patch("app.utils.document_generator.DocxTemplate")
-    @patch("app.utils.document_generator.jinja2.Environment")
+    @patch("app.utils.document_generator._load_docx_template")
+    @patch("app.utils.document_generator._get_docx_environment")
     @patch("app.utils.document_generator.os.path.join")
     def test_generate_docx_success(
         self,
         mock_join,
         mock_jinja_env,
+        mock_load_template,
         mock_docx_class,
         mock_exists,
-        mock_unlink,
-        mock_tempfile,
-        mock_file,
+        mock_getmtime,
     ):
         """Test generating DOCX successfully."""
         from app.utils.document_generator import DOCXDocument
 
         mock_join.return_value = "/fake/path/template.docx"
         mock_exists.return_value = True
-
-        # Mock temp file
-        mock_temp = MagicMock()
-        mock_temp.name = "/tmp/temp.docx"
-        mock_temp.__enter__ = MagicMock(return_value=mock_temp)
-        mock_temp.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_temp
+        mock_getmtime.return_value = 1.0
 
         mock_doc = MagicMock()
         mock_docx_class.return_value = mock_doc
@@ -216,27 +232,56 @@ class TestDOCXDocument(unittest.TestCase):
         result = DOCXDocument.generate(self.folder, self.template, self.context)
 
         self.assertIsInstance(result, BytesIO)
-        mock_doc.render.assert_called_once()
-        mock_doc.save.assert_called_once()
+        mock_doc.render.assert_called_once_with(
+            self.context, mock_jinja_env.return_value
+        )
+        mock_doc.save.assert_called_once_with(result)
+        mock_load_template.assert_called_once_with("/fake/path/template.docx", 1.0)
+
+    @patch("app.utils.document_generator.os.path.getmtime")
+    @patch("app.utils.document_generator.os.path.exists")
+    @patch("app.utils.document_generator.DocxTemplate")
+    @patch("app.utils.document_generator._load_docx_template")
+    @patch("app.utils.document_generator._get_docx_environment")
+    @patch("app.utils.document_generator.os.path.join")
+    def test_generate_docx_into_output_stream(
+        self,
+        mock_join,
+        mock_jinja_env,
+        mock_load_template,
+        mock_docx_class,
+        mock_exists,
+        mock_getmtime,
+    ):
+        """Test DOCX is saved into a caller-supplied stream."""
+        from app.utils.document_generator import DOCXDocument
+
+        mock_join.return_value = "/fake/path/template.docx"
+        mock_exists.return_value = True
+        mock_getmtime.return_value = 1.0
+        output = BytesIO()
 
-    @patch("app.utils.document_generator.os.unlink")
-    @patch("app.utils.document_generator.tempfile.NamedTemporaryFile")
+        result = DOCXDocument.generate(
+            self.folder, self.template, self.context, output=output
+        )
+
+        self.assertIs(result, output)
+        mock_docx_class.return_value.save.assert_called_once_with(output)
+
+    @patch("app.utils.document_generator.os.path.getmtime")
     @patch("app.utils.document_generator.os.path.exists")
     @patch("app.utils.document_generator.os.path.join")
+    @patch("app.utils.document_generator._load_docx_template")
     @patch("app.utils.document_generator.DocxTemplate")
-    def test_generate_docx_render_error(self, mock_docx_class, mock_join, mock_exists, mock_tempfile, mock_unlink):
+    def test_generate_docx_render_error(
+        self, mock_docx_class, mock_load_template, mock_join, mock_exists, mock_getmtime
+    ):
         """Test DOCX generation with render error."""
         from app.utils.document_generator import DOCXDocument
 
         mock_join.return_value = "/fake/path/template.docx"
         mock_exists.return_value = True
-
-        # Mock temp file
-        mock_temp = MagicMock()
-        mock_temp.name = "/tmp/temp.docx"
-        mock_temp.__enter__ = MagicMock(return_value=mock_temp)
-        mock_temp.__exit__ = MagicMock(return_value=False)
-        mock_tempfile.return_value = mock_temp
+        mock_getmtime.return_value = 1.0
 
         mock_doc = MagicMock()
         mock_doc.render.side_effect = Exception("Render error")
@@ -248,6 +293,41 @@ class TestDOCXDocument(unittest.TestCase):
         self.assertIn("DOCX generation failed", str(context.exception))
 
 
+class TestTemplateCache(unittest.TestCase):
+    """Test cases for the per-process template cache."""
+
+    def test_caching_environment_reuses_compiled_templates(self):
+        """Test identical sources are compiled only once."""
+        from app.utils.document_generator import _CachingEnvironment
+
+        env = _CachingEnvironment()
+
+        first = env.from_string("Hola {{ name }}")
+        second = env.from_string("Hola {{ name }}")
+
+        self.assertIs(first, second)
+        self.assertEqual(second.render(name="Juan"), "Hola Juan")
+        self.assertIsNot(first, env.from_string("Chau {{ name }}"))
+
+    def test_odt_template_copy_is_independent(self):
+        """Test rendering a copy leaves the cached parsed template untouched."""
+        from app.utils.document_generator import ODTDocument, _load_odt_template
+
+        template_path = ODTDocument.get_template_path("certificado", "certificado_pdf")
+        cached = _load_odt_template(template_path, os.path.getmtime(template_path))
+        original_content = cached.content.toxml()
+
+        with cached.copy() as odt_template:
+            body = odt_template.content.getElementsByTagName("office:body")[0]
+            body.parentNode.removeChild(body)
+
+        self.assertEqual(cached.content.toxml(), original_content)
+        self.assertIn("content.xml", cached.files)
+        self.assertIs(
+            cached, _load_odt_template(template_path, os.path.getmtime(template_path))
+        )
+
+
 class TestGetDocumentGenerator(unittest.TestCase):
     """Test cases for get_document_generator function."""
 
@@ -275,6 +355,31 @@ class TestGetDocumentGenerator(unittest.TestCase):
 
         self.assertEqual(generator, DOCXDocument)
 
+    def test_generators_content_types(self):
+        """Test each generator declares the content type of its format."""
+        from app.utils.document_generator import get_document_generator
+
+        self.assertEqual(get_document_generator("pdf").content_type, "application/pdf")
+        self.assertEqual(
+            get_document_generator("odt").content_type,
+            "application/vnd.oasis.opendocument.text",
+        )
+        self.assertTrue(
+            get_document_generator("docx").content_type.endswith(
+                "wordprocessingml.document"
+            )
+        )
+
+    def test_office_templates_exist(self):
+        """Test the ODT and DOCX certificate templates resolve to real files."""
+        from app.utils.document_generator import ODTDocument, DOCXDocument
+
+        for generator in (ODTDocument, DOCXDocument):
+            template_path = generator.get_template_path(
+                "certificado", "certificado_pdf"
+            )
+            self.assertTrue(os.path.exists(template_path), template_path)
+
     def test_get_generator_case_insensitive(self):
         """Test getting generator is case-insensitive."""
         from app.utils.document_generator import get_document_generator, PDFDocument
@@ -300,5 +405,86 @@ class TestGetDocumentGenerator(unittest.TestCase):
         self.assertIsNone(generator)
 
 
+class TestStaticUrlFetcher(unittest.TestCase):
+    """Test cases for static_url_fetcher."""
+
+    def test_fetch_static_image(self):
+        """Test static images are served from memory."""
+        from app.utils.document_generator import static_url_fetcher
+
+        result = static_url_fetcher("file:///static/img/logo-utn.png")
+
+        self.assertEqual(result["mime_type"], "image/png")
+        self.assertTrue(result["string"].startswith(b"\x89PNG"))
+
+    def test_static_assets_loaded_once(self):
+        """Test repeated fetches do not touch the filesystem again."""
+        from app.utils.document_generator import static_url_fetcher
+
+        static_url_fetcher("file:///static/img/logo-ministerio.png")
+
+        with patch("app.utils.document_generator.open", create=True) as mock_file:
+            static_url_fetcher("http://localhost/static/img/logo-ministerio.png")
+
+        mock_file.assert_not_called()
+
+    def test_fetch_unknown_static_asset(self):
+        """Test unknown static assets fail immediately."""
+        from app.utils.document_generator import static_url_fetcher
+
+        with self.assertRaises(ValueError):
+            static_url_fetcher("file:///static/img/missing.png")
+
+    def test_fetch_external_url(self):
+        """Test URLs outside the static files are never fetched."""
+        from app.utils.document_generator import static_url_fetcher
+
+        with self.assertRaises(ValueError):
+            static_url_fetcher("http://example.com/logo.png")
+
+
+class TestCompactImages(unittest.TestCase):
+    """Test cases for the images embedded in compact PDFs."""
+
+    def test_compact_logo_is_smaller_and_opaque(self):
+        """Test logos are recompressed without an alpha channel."""
+        from PIL import Image
+        from app.utils.document_generator import compact_static_url_fetcher
+        from app.utils.document_generator import static_url_fetcher
+
+        url = "file:///static/img/logo-utn.png"
+        original = static_url_fetcher(url)["string"]
+        compact = compact_static_url_fetcher(url)["string"]
+
+        self.assertLess(len(compact), len(original))
+        with Image.open(BytesIO(compact)) as image:
+            self.assertEqual(image.mode, "P")
+            self.assertNotIn("transparency", image.info)
+
+    def test_compact_image_downsampled_to_printed_width(self):
+        """Test images wider than the printed width are downsampled."""
+        from PIL import Image
+        from app.utils.document_generator import COMPACT_IMAGE_WIDTH, _compact_image
+
+        large_io = BytesIO()
+        Image.effect_noise((COMPACT_IMAGE_WIDTH * 4, 400), 64).save(large_io, "PNG")
+
+        compact = _compact_image(large_io.getvalue())
+
+        with Image.open(BytesIO(compact)) as image:
+            self.assertEqual(image.size, (COMPACT_IMAGE_WIDTH, 100))
+
+    def test_compact_assets_computed_once(self):
+        """Test optimized images are precomputed once per process."""
+        from app.utils.document_generator import compact_static_url_fetcher
+
+        compact_static_url_fetcher("file:///static/img/logo-ministerio.png")
+
+        with patch("app.utils.document_generator._compact_image") as mock_compact:
+            compact_static_url_fetcher("file:///static/img/logo-ministerio.png")
+
+        mock_compact.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
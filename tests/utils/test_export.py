@@ -0,0 +1,105 @@
+"""Unit tests for export renderers."""
+
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class TestCSVRenderer(unittest.TestCase):
+    """Test cases for CSVRenderer."""
+
+    def test_stream(self):
+        """Test rows are written under a header in field order."""
+        from app.utils import CSVRenderer
+
+        rows = [
+            {"id": 1, "name": "Ana", "birth_date": date(2000, 1, 2), "email": None},
+            {"id": 2, "name": "Díaz, Luis", "birth_date": None, "email": "l@x.com"},
+        ]
+
+        data = b"".join(
+            CSVRenderer().stream(["id", "name", "birth_date", "email"], iter(rows))
+        )
+
+        self.assertEqual(
+            data.decode("utf-8"),
+            "id,name,birth_date,email\r\n"
+            "1,Ana,2000-01-02,\r\n"
+            '2,"Díaz, Luis",,l@x.com\r\n',
+        )
+
+    @patch("app.utils.export.EXPORT_FLUSH_ROWS", 2)
+    def test_stream_yields_chunks(self):
+        """Test the output is flushed every EXPORT_FLUSH_ROWS rows."""
+        from app.utils import CSVRenderer
+
+        rows = ({"id": i} for i in range(5))
+
+        chunks = list(CSVRenderer().stream(["id"], rows))
+
+        self.assertEqual(chunks, [b"id\r\n0\r\n1\r\n", b"2\r\n3\r\n", b"4\r\n"])
+
+    def test_render_error(self):
+        """Test error payloads render as a one-row CSV."""
+        from app.utils import CSVRenderer
+
+        data = CSVRenderer().render({"error": "Unsupported filter: foo"})
+
+        self.assertEqual(data, b"error\r\nUnsupported filter: foo\r\n")
+
+
+class TestNDJSONRenderer(unittest.TestCase):
+    """Test cases for NDJSONRenderer."""
+
+    def test_stream(self):
+        """Test each row is rendered as one compact JSON line."""
+        from app.utils import NDJSONRenderer
+
+        rows = [
+            {"id": 1, "name": "Pérez", "created_at": datetime(2024, 1, 1, 15, 0)},
+            {"id": 2, "name": "Gómez", "created_at": None},
+        ]
+
+        data = b"".join(NDJSONRenderer().stream(["id", "name", "created_at"], rows))
+
+        self.assertEqual(
+            data.decode("utf-8"),
+            '{"id":1,"name":"Pérez","created_at":"2024-01-01T15:00:00"}\n'
+            '{"id":2,"name":"Gómez","created_at":null}\n',
+        )
+
+    def test_stream_aware_datetime_in_current_time_zone(self):
+        """Test aware datetimes are shifted to the current time zone."""
+        from app.utils import NDJSONRenderer
+
+        rows = [{"created_at": datetime(2024, 1, 1, 15, 0, tzinfo=timezone.utc)}]
+
+        data = b"".join(NDJSONRenderer().stream(["created_at"], rows))
+
+        self.assertEqual(data, b'{"created_at":"2024-01-01T12:00:00-03:00"}\n')
+
+    def test_stream_empty(self):
+        """Test an empty export produces no output."""
+        from app.utils import NDJSONRenderer
+
+        self.assertEqual(list(NDJSONRenderer().stream(["id"], [])), [])
+
+
+class TestGetExportFilters(unittest.TestCase):
+    """Test cases for get_export_filters."""
+
+    def test_format_is_not_a_filter(self):
+        """Test the format override is dropped from the filters."""
+        from app.utils import get_export_filters
+
+        request = Request(
+            APIRequestFactory().get("/api/students/export/?format=csv&gender=F")
+        )
+
+        self.assertEqual(get_export_filters(request), {"gender": "F"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Unit tests for the university hierarchy tree cache."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import post_delete, post_save
+from django.test import override_settings
+
+from app.models import Faculty, SpecialtyType, Student
+from app.utils import HierarchyCache
+
+
+class TestHierarchyCache(unittest.TestCase):
+    """Test cases for HierarchyCache."""
+
+    def setUp(self):
+        """Start every test from an empty cache."""
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+
+    def test_cached_tree(self):
+        """Test trees are stored under their key."""
+        key = HierarchyCache.get_key(1)
+        self.assertIsNone(HierarchyCache.get(key))
+
+        HierarchyCache.set(key, {"id": 1})
+
+        self.assertEqual(HierarchyCache.get(HierarchyCache.get_key(1)), {"id": 1})
+        self.assertNotEqual(HierarchyCache.get_key(2), key)
+        self.assertNotEqual(HierarchyCache.get_key(1, student_counts=True), key)
+
+    def test_hierarchy_writes_change_every_key(self):
+        """Test saving or deleting a hierarchy model drops all trees."""
+        key = HierarchyCache.get_key(1)
+        counts_key = HierarchyCache.get_key(1, student_counts=True)
+
+        post_save.send(
+            sender=Faculty, instance=MagicMock(), created=False, using="default"
+        )
+        self.assertNotEqual(HierarchyCache.get_key(1), key)
+        self.assertNotEqual(HierarchyCache.get_key(1, student_counts=True), counts_key)
+
+        key = HierarchyCache.get_key(1)
+        post_delete.send(sender=SpecialtyType, instance=MagicMock(), using="default")
+        self.assertNotEqual(HierarchyCache.get_key(1), key)
+
+    def test_student_writes_only_change_count_keys(self):
+        """Test student writes keep the trees without counts."""
+        key = HierarchyCache.get_key(1)
+        counts_key = HierarchyCache.get_key(1, student_counts=True)
+
+        post_save.send(
+            sender=Student, instance=MagicMock(), created=True, using="default"
+        )
+
+        self.assertEqual(HierarchyCache.get_key(1), key)
+        self.assertNotEqual(HierarchyCache.get_key(1, student_counts=True), counts_key)
+
+    def test_evicted_version_starts_fresh(self):
+        """Test a lost counter never brings back an older tree."""
+        key = HierarchyCache.get_key(1)
+        HierarchyCache.set(key, {"id": 1})
+
+        caches["default"].delete("university-tree:version")
+
+        self.assertNotEqual(HierarchyCache.get_key(1), key)
+
+    @override_settings(UNIVERSITY_TREE_CACHE_TIMEOUT=0)
+    def test_zero_timeout_disables_cache(self):
+        """Test a zero timeout builds every tree again."""
+        key = HierarchyCache.get_key(1)
+        HierarchyCache.set(key, {"id": 1})
+
+        self.assertIsNone(HierarchyCache.get(key))
+
+    @override_settings(UNIVERSITY_TREE_CACHE_TIMEOUT=0)
+    def test_zero_timeout_never_reuses_keys(self):
+        """Test a disabled cache never answers a revalidation with an old key."""
+        self.assertNotEqual(HierarchyCache.get_key(1), HierarchyCache.get_key(1))
+
+    @override_settings(
+        UNIVERSITY_TREE_CACHE_TIMEOUT=3600, UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT=5
+    )
+    def test_local_memory_caps_timeout(self):
+        """Test trees and counters in process memory expire after the local cap."""
+        cache = MagicMock(spec=LocMemCache)
+        cache.get.return_value = None
+
+        with patch.object(HierarchyCache, "get_cache", return_value=cache):
+            self.assertFalse(HierarchyCache.is_shared())
+            self.assertEqual(HierarchyCache.get_timeout(), 5)
+            HierarchyCache.get_key(1)
+
+        self.assertEqual(cache.add.call_args.args[2], 5)
+
+    @override_settings(
+        UNIVERSITY_TREE_CACHE_TIMEOUT=3600, UNIVERSITY_TREE_LOCAL_CACHE_TIMEOUT=5
+    )
+    def test_shared_cache_keeps_timeout(self):
+        """Test a shared cache keeps trees for the full timeout."""
+        cache = MagicMock()
+        cache.get.return_value = None
+
+        with patch.object(HierarchyCache, "get_cache", return_value=cache):
+            self.assertTrue(HierarchyCache.is_shared())
+            self.assertEqual(HierarchyCache.get_timeout(), 3600)
+            HierarchyCache.get_key(1)
+
+        self.assertIsNone(cache.add.call_args.args[2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""Unit tests for pagination helpers."""
+
+import unittest
+from operator import attrgetter
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from django.core.paginator import Paginator
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+
+class TestPagedResult(unittest.TestCase):
+    """Test cases for PagedResult."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.find_page = MagicMock(return_value=["a", "b"])
+        self.count = MagicMock(return_value=12)
+
+    def test_count_is_cached(self):
+        """Test the total count is only queried once."""
+        from app.utils import PagedResult
+
+        result = PagedResult(self.find_page, self.count)
+
+        self.assertEqual(result.count(), 12)
+        self.assertEqual(len(result), 12)
+        self.count.assert_called_once()
+
+    def test_slice_pushes_offset_and_limit(self):
+        """Test slicing fetches only the requested page."""
+        from app.utils import PagedResult
+
+        result = PagedResult(self.find_page, self.count)
+
+        self.assertEqual(result[10:20], ["a", "b"])
+        self.find_page.assert_called_once_with(10, 10)
+
+    def test_empty_slice_skips_query(self):
+        """Test an empty slice does not query the page finder."""
+        from app.utils import PagedResult
+
+        result = PagedResult(self.find_page, self.count)
+
+        self.assertEqual(result[5:5], [])
+        self.find_page.assert_not_called()
+
+    def test_index(self):
+        """Test indexing fetches a single row."""
+        from app.utils import PagedResult
+
+        result = PagedResult(self.find_page, self.count)
+
+        self.assertEqual(result[3], "a")
+        self.find_page.assert_called_once_with(3, 1)
+
+    def test_django_paginator(self):
+        """Test Django's Paginator slices the last page at the total count."""
+        from app.utils import PagedResult
+
+        paginator = Paginator(PagedResult(self.find_page, self.count), 5)
+        page = paginator.page(3)
+
+        self.assertEqual(paginator.num_pages, 3)
+        self.assertEqual(list(page.object_list), ["a", "b"])
+        self.find_page.assert_called_once_with(10, 2)
+
+
+class TestKeysetPagination(unittest.TestCase):
+    """Test cases for KeysetPagination."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        from app.utils import KeysetPagination
+
+        class NamePagination(KeysetPagination):
+            ordering = ("last_name", "id")
+
+        self.pagination_class = NamePagination
+        self.factory = APIRequestFactory()
+        # Duplicate last names exercise the id tiebreaker
+        self.rows = [
+            SimpleNamespace(last_name=name, id=i)
+            for i, name in enumerate("aabbbcdddde", start=1)
+        ]
+        self.calls = []
+
+    def find_after(self, position, limit, reverse):
+        self.calls.append((position, limit, reverse))
+        keys = attrgetter("last_name", "id")
+        rows = sorted(self.rows, key=keys, reverse=reverse)
+        if position is not None:
+            position = tuple(position)
+            if reverse:
+                rows = [row for row in rows if keys(row) < position]
+            else:
+                rows = [row for row in rows if keys(row) > position]
+        return rows[:limit]
+
+    def paginate(self, url):
+        paginator = self.pagination_class()
+        page = paginator.paginate_queryset(
+            self.find_after, Request(self.factory.get(url))
+        )
+        return page, paginator
+
+    def test_first_page(self):
+        """Test an empty cursor returns the first page without a previous link."""
+        page, paginator = self.paginate("/api/students/?cursor=&page_size=4")
+
+        self.assertEqual([row.id for row in page], [1, 2, 3, 4])
+        self.assertEqual(self.calls, [(None, 5, False)])
+        self.assertIsNotNone(paginator.get_next_link())
+        self.assertIsNone(paginator.get_previous_link())
+
+    def test_walk_forward_and_back(self):
+        """Test following cursors visits every row once in both directions."""
+        seen = []
+        url = "/api/students/?cursor=&page_size=3"
+        while url:
+            page, paginator = self.paginate(url)
+            seen.append([row.id for row in page])
+            previous_url = paginator.get_previous_link()
+            url = paginator.get_next_link()
+
+        self.assertEqual(seen, [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11]])
+
+        seen = []
+        url = previous_url
+        while url:
+            page, paginator = self.paginate(url)
+            seen.append([row.id for row in page])
+            url = paginator.get_previous_link()
+
+        self.assertEqual(seen, [[7, 8, 9], [4, 5, 6], [1, 2, 3]])
+        self.assertTrue(all(limit == 4 for _, limit, _ in self.calls))
+
+    def test_invalid_cursor(self):
+        """Test a malformed cursor raises NotFound."""
+        from rest_framework.exceptions import NotFound
+
+        with self.assertRaises(NotFound):
+            self.paginate("/api/students/?cursor=bm90LWEtY3Vyc29y")
+
+
+class TestGetListFilters(unittest.TestCase):
+    """Test cases for get_list_filters."""
+
+    def test_paging_params_are_not_filters(self):
+        """Test paging, format and fields parameters are dropped."""
+        from app.utils import get_list_filters
+
+        request = Request(
+            APIRequestFactory().get(
+                "/api/students/?page=2&page_size=5&cursor=&fields=id"
+                "&format=json&specialty=3"
+            )
+        )
+
+        self.assertEqual(get_list_filters(request), {"specialty": "3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Unit tests for the certificate render limiter."""
+
+import threading
+import unittest
+
+
+class TestRenderLimiter(unittest.TestCase):
+    """Test cases for RenderLimiter."""
+
+    def test_slot_admits_within_concurrency(self):
+        """Test renders within the concurrency limit run immediately."""
+        from app.utils.render_limiter import RenderLimiter
+
+        limiter = RenderLimiter(concurrency=2, queue_depth=0, timeout=0.1)
+
+        with limiter.slot(), limiter.slot():
+            self.assertEqual(limiter.get_stats()["in_flight"], 2)
+
+        stats = limiter.get_stats()
+        self.assertEqual(stats["admitted"], 2)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_slot_rejects_when_queue_full(self):
+        """Test renders beyond the queue depth are rejected straight away."""
+        from app.utils.render_limiter import RenderLimiter, RenderRejectedError
+
+        limiter = RenderLimiter(concurrency=1, queue_depth=0, timeout=5)
+
+        with limiter.slot():
+            with self.assertRaises(RenderRejectedError) as context:
+                with limiter.slot():
+                    pass
+
+        self.assertEqual(context.exception.retry_after, 5)
+        self.assertEqual(limiter.get_stats()["rejected_queue_full"], 1)
+
+    def test_slot_rejects_after_timeout(self):
+        """Test a queued render is rejected when no slot frees up in time."""
+        from app.utils.render_limiter import RenderLimiter, RenderRejectedError
+
+        limiter = RenderLimiter(concurrency=1, queue_depth=1, timeout=0.05)
+
+        with limiter.slot():
+            with self.assertRaises(RenderRejectedError) as context:
+                with limiter.slot():
+                    pass
+
+        stats = limiter.get_stats()
+        self.assertEqual(context.exception.retry_after, 1)
+        self.assertEqual(stats["rejected_timeout"], 1)
+        self.assertEqual(stats["waiting"], 0)
+        self.assertGreater(stats["wait_seconds_total"], 0)
+
+    def test_slot_waits_for_release(self):
+        """Test a queued render runs once the running one finishes."""
+        from app.utils.render_limiter import RenderLimiter
+
+        limiter = RenderLimiter(concurrency=1, queue_depth=1, timeout=5)
+        started = threading.Event()
+        release = threading.Event()
+
+        def hold_slot():
+            with limiter.slot():
+                started.set()
+                release.wait()
+
+        holder = threading.Thread(target=hold_slot)
+        holder.start()
+        started.wait()
+        threading.Timer(0.05, release.set).start()
+
+        with limiter.slot():
+            pass
+        holder.join()
+
+        self.assertEqual(limiter.get_stats()["admitted"], 2)
+
+    def test_slot_takes_several_slots(self):
+        """Test a batch slot takes several slots, capped at the concurrency."""
+        from app.utils.render_limiter import RenderLimiter, RenderRejectedError
+
+        limiter = RenderLimiter(concurrency=2, queue_depth=0, timeout=0.1)
+
+        with limiter.slot(5):
+            self.assertEqual(limiter.get_stats()["in_flight"], 2)
+            with self.assertRaises(RenderRejectedError):
+                with limiter.slot():
+                    pass
+
+        with limiter.slot(), limiter.slot():
+            pass
+
+    def test_slots_given_back_when_rejected(self):
+        """Test slots taken before a rejection are released."""
+        from app.utils.render_limiter import RenderLimiter, RenderRejectedError
+
+        limiter = RenderLimiter(concurrency=2, queue_depth=0, timeout=0.1)
+
+        with limiter.slot():
+            with self.assertRaises(RenderRejectedError):
+                limiter.acquire(2)
+
+        with limiter.slot(2):
+            self.assertEqual(limiter.get_stats()["in_flight"], 2)
+
+    def test_slot_released_on_error(self):
+        """Test a failing render gives its slot back."""
+        from app.utils.render_limiter import RenderLimiter
+
+        limiter = RenderLimiter(concurrency=1, queue_depth=0, timeout=0.1)
+
+        with self.assertRaises(ValueError):
+            with limiter.slot():
+                raise ValueError("PDF generation failed")
+
+        with limiter.slot():
+            pass
+
+        self.assertEqual(limiter.get_stats()["admitted"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
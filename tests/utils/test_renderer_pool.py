@@ -0,0 +1,203 @@
+"""Unit tests for the PDF renderer process pool."""
+
+import unittest
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import patch, MagicMock
+from django.test import override_settings
+
+
+def _future(result=None, exception=None):
+    future = Future()
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+    return future
+
+
+class TestRendererPool(unittest.TestCase):
+    """Test cases for RendererPool."""
+
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_render_dispatches_to_worker(self, mock_executor_class):
+        """Test renders are submitted to a spawned, warm worker pool."""
+        from app.utils.renderer_pool import RendererPool, _init_worker, _render
+
+        executor = mock_executor_class.return_value
+        executor.submit.return_value = _future((b"PDF", 1024))
+
+        pool = RendererPool(workers=2, max_renders=100, max_rss=None)
+        result = pool.render("<html></html>", compact=True)
+
+        self.assertEqual(result, b"PDF")
+        executor.submit.assert_called_once_with(_render, "<html></html>", True)
+        kwargs = mock_executor_class.call_args.kwargs
+        self.assertEqual(kwargs["max_workers"], 2)
+        self.assertEqual(kwargs["max_tasks_per_child"], 100)
+        self.assertIs(kwargs["initializer"], _init_worker)
+        self.assertEqual(kwargs["mp_context"].get_start_method(), "spawn")
+
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_render_recycles_pool_over_rss_limit(self, mock_executor_class):
+        """Test the pool is replaced once a worker exceeds the RSS limit."""
+        from app.utils.renderer_pool import RendererPool
+
+        old_executor, new_executor = MagicMock(), MagicMock()
+        mock_executor_class.side_effect = [old_executor, new_executor]
+        old_executor.submit.return_value = _future((b"PDF", 2048))
+        new_executor.submit.return_value = _future((b"PDF", 512))
+
+        pool = RendererPool(workers=1, max_renders=None, max_rss=1024)
+        pool.render("<html></html>")
+        pool.render("<html></html>")
+
+        old_executor.shutdown.assert_called_once_with(wait=False)
+        new_executor.shutdown.assert_not_called()
+        self.assertEqual(mock_executor_class.call_count, 2)
+
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_render_retries_on_replaced_broken_pool(self, mock_executor_class):
+        """Test a render whose worker died is retried once on a fresh pool."""
+        from app.utils.renderer_pool import RendererPool
+
+        broken_executor, new_executor = MagicMock(), MagicMock()
+        broken_executor.submit.return_value = _future(
+            exception=BrokenProcessPool("worker died")
+        )
+        new_executor.submit.return_value = _future((b"PDF", 512))
+        mock_executor_class.side_effect = [broken_executor, new_executor]
+
+        pool = RendererPool(workers=1, max_renders=None, max_rss=None)
+
+        self.assertEqual(pool.render("<html></html>"), b"PDF")
+        broken_executor.shutdown.assert_called_once_with(wait=False)
+        self.assertIs(pool._get_executor(), new_executor)
+
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_render_unavailable_when_pool_breaks_twice(self, mock_executor_class):
+        """Test a pool that breaks again raises the 503 render rejection."""
+        from app.utils.renderer_pool import RendererPool, RendererUnavailableError
+        from app.utils.render_limiter import RenderRejectedError
+
+        broken_executor = MagicMock()
+        broken_executor.submit.side_effect = BrokenProcessPool("worker died")
+        mock_executor_class.return_value = broken_executor
+
+        pool = RendererPool(workers=1, max_renders=None, max_rss=None)
+        with self.assertRaises(RendererUnavailableError) as context:
+            pool.render("<html></html>")
+
+        self.assertIsInstance(context.exception, RenderRejectedError)
+        self.assertEqual(broken_executor.shutdown.call_count, 2)
+
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_submit_never_reaches_recycled_executor(self, mock_executor_class):
+        """Test a render after a recycle is submitted to the new executor."""
+        from app.utils.renderer_pool import RendererPool
+
+        old_executor, new_executor = MagicMock(), MagicMock()
+        mock_executor_class.side_effect = [old_executor, new_executor]
+        new_executor.submit.return_value = _future((b"PDF", 512))
+
+        pool = RendererPool(workers=1, max_renders=None, max_rss=None)
+        pool._recycle(pool._get_executor())
+        pool.render("<html></html>")
+
+        old_executor.submit.assert_not_called()
+        new_executor.submit.assert_called_once()
+
+
+class TestGetRendererPool(unittest.TestCase):
+    """Test cases for get_renderer_pool."""
+
+    @override_settings(CERTIFICATE_RENDERER_WORKERS=0)
+    def test_disabled_by_default(self):
+        """Test PDFs are rendered in-process when no workers are configured."""
+        from app.utils.renderer_pool import get_renderer_pool
+
+        self.assertIsNone(get_renderer_pool())
+
+    @override_settings(CERTIFICATE_RENDERER_WORKERS=2)
+    @patch("app.utils.renderer_pool.multiprocessing.parent_process")
+    def test_not_nested_in_worker_processes(self, mock_parent_process):
+        """Test processes started by multiprocessing never start their own pool."""
+        from app.utils.renderer_pool import get_renderer_pool
+
+        mock_parent_process.return_value = MagicMock()
+
+        self.assertIsNone(get_renderer_pool())
+
+
+class TestBatchExecutor(unittest.TestCase):
+    """Test cases for the shared batch certificate pool."""
+
+    @override_settings(CERTIFICATE_BATCH_WORKERS=3)
+    @patch("app.utils.renderer_pool._batch_executor", None)
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_shared_spawned_pool(self, mock_executor_class):
+        """Test every archive shares one spawned pool of the configured size."""
+        from app.utils.renderer_pool import get_batch_executor
+
+        self.assertIs(get_batch_executor(), get_batch_executor())
+        mock_executor_class.assert_called_once()
+        kwargs = mock_executor_class.call_args.kwargs
+        self.assertEqual(kwargs["max_workers"], 3)
+        self.assertEqual(kwargs["mp_context"].get_start_method(), "spawn")
+
+    @patch("app.utils.renderer_pool._batch_executor", None)
+    @patch("app.utils.renderer_pool.ProcessPoolExecutor")
+    def test_discard_broken_pool(self, mock_executor_class):
+        """Test a discarded pool is shut down and replaced on the next archive."""
+        from app.utils.renderer_pool import discard_batch_executor, get_batch_executor
+
+        broken_executor, new_executor = MagicMock(), MagicMock()
+        mock_executor_class.side_effect = [broken_executor, new_executor]
+
+        discard_batch_executor(get_batch_executor())
+
+        broken_executor.shutdown.assert_called_once_with(wait=False)
+        self.assertIs(get_batch_executor(), new_executor)
+
+
+class TestPDFDocumentRendererPool(unittest.TestCase):
+    """Test cases for PDFDocument rendering through the pool."""
+
+    @patch("app.utils.document_generator.write_pdf")
+    @patch("app.utils.document_generator.get_renderer_pool")
+    @patch("app.utils.document_generator.render_to_string")
+    def test_generate_uses_pool(self, mock_render, mock_get_pool, mock_write_pdf):
+        """Test only the HTML is rendered in-process when a pool is available."""
+        from app.utils.document_generator import PDFDocument
+
+        mock_render.return_value = "<html></html>"
+        mock_get_pool.return_value.render.return_value = b"PDF content"
+
+        result = PDFDocument.generate(
+            "certificado", "certificado_pdf", {}, compact=False
+        )
+
+        self.assertEqual(result.read(), b"PDF content")
+        mock_get_pool.return_value.render.assert_called_once_with(
+            "<html></html>", False
+        )
+        mock_write_pdf.assert_not_called()
+
+    @patch("app.utils.document_generator.get_renderer_pool")
+    @patch("app.utils.document_generator.render_to_string")
+    def test_generate_propagates_unavailable_pool(self, mock_render, mock_get_pool):
+        """Test a broken pool is not reported as a bad request."""
+        from app.utils.document_generator import PDFDocument
+        from app.utils.renderer_pool import RendererUnavailableError
+
+        mock_render.return_value = "<html></html>"
+        mock_get_pool.return_value.render.side_effect = RendererUnavailableError(
+            "PDF renderer is unavailable, try again later", 5
+        )
+
+        with self.assertRaises(RendererUnavailableError):
+            PDFDocument.generate("certificado", "certificado_pdf", {}, compact=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestSpecialtyViewSet(unittest.TestCase):
@@ -16,19 +17,20 @@ class TestSpecialtyViewSet(unittest.TestCase):
         self.mock_specialty = MagicMock()
         self.mock_specialty.id = 1
 
-    @patch("app.views.specialty.SpecialtyService")
+    @patch("app.views.specialty.SpecialtyViewSet.service")
     @patch("app.views.specialty.SpecialtySerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing specialties successfully."""
         from app.views import SpecialtyViewSet
 
-        mock_service.find_all.return_value = [self.mock_specialty]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_specialty]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.specialty_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = SpecialtyViewSet()
-        request = self.factory.get("/api/specialties/")
+        request = Request(self.factory.get("/api/specialties/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -44,19 +46,20 @@ class TestPlanViewSet(unittest.TestCase):
         self.mock_plan = MagicMock()
         self.mock_plan.id = 1
 
-    @patch("app.views.plan.PlanService")
+    @patch("app.views.plan.PlanViewSet.service")
     @patch("app.views.plan.PlanSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing plans successfully."""
         from app.views import PlanViewSet
 
-        mock_service.find_all.return_value = [self.mock_plan]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_plan]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.plan_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = PlanViewSet()
-        request = self.factory.get("/api/plans/")
+        request = Request(self.factory.get("/api/plans/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -72,19 +75,20 @@ class TestSubjectViewSet(unittest.TestCase):
         self.mock_subject = MagicMock()
         self.mock_subject.id = 1
 
-    @patch("app.views.subject.SubjectService")
+    @patch("app.views.subject.SubjectViewSet.service")
     @patch("app.views.subject.SubjectSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing subjects successfully."""
         from app.views import SubjectViewSet
 
-        mock_service.find_all.return_value = [self.mock_subject]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_subject]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.subject_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = SubjectViewSet()
-        request = self.factory.get("/api/subjects/")
+        request = Request(self.factory.get("/api/subjects/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -101,7 +105,7 @@ class TestSubjectViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = SubjectViewSet()
-        request = self.factory.get("/api/subjects/1/")
+        request = Request(self.factory.get("/api/subjects/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestDedicationTypeViewSet(unittest.TestCase):
@@ -16,19 +17,20 @@ class TestDedicationTypeViewSet(unittest.TestCase):
         self.mock_dedication = MagicMock()
         self.mock_dedication.id = 1
 
-    @patch("app.views.dedication_type.DedicationTypeService")
+    @patch("app.views.dedication_type.DedicationTypeViewSet.service")
     @patch("app.views.dedication_type.DedicationTypeSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing dedication types successfully."""
         from app.views import DedicationTypeViewSet
 
-        mock_service.find_all.return_value = [self.mock_dedication]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_dedication]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.dedication_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = DedicationTypeViewSet()
-        request = self.factory.get("/api/dedication-types/")
+        request = Request(self.factory.get("/api/dedication-types/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -45,7 +47,7 @@ class TestDedicationTypeViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = DedicationTypeViewSet()
-        request = self.factory.get("/api/dedication-types/1/")
+        request = Request(self.factory.get("/api/dedication-types/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -77,19 +79,20 @@ class TestPositionCategoryViewSet(unittest.TestCase):
         self.mock_category = MagicMock()
         self.mock_category.id = 1
 
-    @patch("app.views.position_category.PositionCategoryService")
+    @patch("app.views.position_category.PositionCategoryViewSet.service")
     @patch("app.views.position_category.PositionCategorySerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing position categories successfully."""
         from app.views import PositionCategoryViewSet
 
-        mock_service.find_all.return_value = [self.mock_category]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_category]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.category_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = PositionCategoryViewSet()
-        request = self.factory.get("/api/position-categories/")
+        request = Request(self.factory.get("/api/position-categories/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -106,7 +109,7 @@ class TestPositionCategoryViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = PositionCategoryViewSet()
-        request = self.factory.get("/api/position-categories/1/")
+        request = Request(self.factory.get("/api/position-categories/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -122,19 +125,20 @@ class TestSpecialtyTypeViewSet(unittest.TestCase):
         self.mock_specialty_type = MagicMock()
         self.mock_specialty_type.id = 1
 
-    @patch("app.views.specialty_type.SpecialtyTypeService")
+    @patch("app.views.specialty_type.SpecialtyTypeViewSet.service")
     @patch("app.views.specialty_type.SpecialtyTypeSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing specialty types successfully."""
         from app.views import SpecialtyTypeViewSet
 
-        mock_service.find_all.return_value = [self.mock_specialty_type]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_specialty_type]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.specialty_type_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = SpecialtyTypeViewSet()
-        request = self.factory.get("/api/specialty-types/")
+        request = Request(self.factory.get("/api/specialty-types/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -151,7 +155,7 @@ class TestSpecialtyTypeViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = SpecialtyTypeViewSet()
-        request = self.factory.get("/api/specialty-types/1/")
+        request = Request(self.factory.get("/api/specialty-types/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
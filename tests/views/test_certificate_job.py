@@ -0,0 +1,111 @@
+"""Unit tests for CertificateJobViewSet."""
+
+import unittest
+from io import BytesIO
+from unittest.mock import patch, MagicMock
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.parsers import JSONParser
+from rest_framework.test import APIRequestFactory
+
+
+class TestCertificateJobViewSet(unittest.TestCase):
+    """Test cases for CertificateJobViewSet."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+
+        self.mock_job = MagicMock()
+        self.mock_job.id = 1
+        self.mock_job.student_id = 1
+        self.mock_job.document_type = "pdf"
+        self.mock_job.status = "pending"
+        self.mock_job.error = None
+
+    @patch("app.views.certificate_job.CertificateJobService")
+    def test_create_job_success(self, mock_service):
+        """Test enqueuing a certificate job returns 202."""
+        from app.views import CertificateJobViewSet
+
+        mock_service.create.return_value = self.mock_job
+
+        viewset = CertificateJobViewSet()
+        request = Request(
+            self.factory.post(
+                "/api/v1/certificate_job/",
+                {"student_id": 1, "document_type": "pdf"},
+                format="json",
+            ),
+            parsers=[JSONParser()],
+        )
+        response = viewset.create(request)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        mock_service.create.assert_called_once_with(1, "pdf")
+
+    def test_create_job_invalid_type(self):
+        """Test enqueuing a job with an unsupported type."""
+        from app.views import CertificateJobViewSet
+
+        viewset = CertificateJobViewSet()
+        request = Request(
+            self.factory.post(
+                "/api/v1/certificate_job/",
+                {"student_id": 1, "document_type": "txt"},
+                format="json",
+            ),
+            parsers=[JSONParser()],
+        )
+        response = viewset.create(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("app.views.certificate_job.CertificateJobService")
+    def test_retrieve_job_not_found(self, mock_service):
+        """Test polling a non-existent job."""
+        from app.views import CertificateJobViewSet
+
+        mock_service.find_by_id.return_value = None
+
+        viewset = CertificateJobViewSet()
+        request = Request(self.factory.get("/api/v1/certificate_job/999/"))
+        response = viewset.retrieve(request, pk=999)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("app.views.certificate_job.CertificateJobService")
+    def test_download_job_not_finished(self, mock_service):
+        """Test downloading a job that is still running returns 409."""
+        from app.views import CertificateJobViewSet
+
+        self.mock_job.status = "running"
+        mock_service.find_by_id.return_value = self.mock_job
+
+        viewset = CertificateJobViewSet()
+        request = self.factory.get("/api/v1/certificate_job/1/download/")
+        response = viewset.download(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    @patch("app.views.certificate_job.CertificateJobService")
+    def test_download_job_success(self, mock_service):
+        """Test downloading a finished job streams its file."""
+        from app.views import CertificateJobViewSet
+
+        self.mock_job.status = "done"
+        self.mock_job.result.name = "certificates/jobs/certificado_estudiante_1_1.pdf"
+        self.mock_job.result.open.return_value = BytesIO(b"PDF content")
+        mock_service.find_by_id.return_value = self.mock_job
+
+        viewset = CertificateJobViewSet()
+        request = self.factory.get("/api/v1/certificate_job/1/download/")
+        response = viewset.download(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(b"".join(response.streaming_content), b"PDF content")
+        self.assertIn("certificado_estudiante_1_1.pdf", response["Content-Disposition"])
+
+
+if __name__ == "__main__":
+    unittest.main()
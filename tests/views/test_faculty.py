@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestFacultyViewSet(unittest.TestCase):
@@ -16,19 +17,20 @@ class TestFacultyViewSet(unittest.TestCase):
         self.mock_faculty = MagicMock()
         self.mock_faculty.id = 1
 
-    @patch("app.views.faculty.FacultyService")
+    @patch("app.views.faculty.FacultyViewSet.service")
     @patch("app.views.faculty.FacultySerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing faculties successfully."""
         from app.views import FacultyViewSet
 
-        mock_service.find_all.return_value = [self.mock_faculty]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_faculty]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.faculty_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = FacultyViewSet()
-        request = self.factory.get("/api/faculties/")
+        request = Request(self.factory.get("/api/faculties/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -45,7 +47,7 @@ class TestFacultyViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = FacultyViewSet()
-        request = self.factory.get("/api/faculties/1/")
+        request = Request(self.factory.get("/api/faculties/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -58,7 +60,7 @@ class TestFacultyViewSet(unittest.TestCase):
         mock_service.find_by_id.return_value = None
 
         viewset = FacultyViewSet()
-        request = self.factory.get("/api/faculties/999/")
+        request = Request(self.factory.get("/api/faculties/999/"))
         response = viewset.retrieve(request, pk=999)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class GenericViewSetTestMixin:
@@ -24,16 +25,17 @@ class GenericViewSetTestMixin:
     def test_list_success(self):
         """Test listing entities successfully."""
         with (
-            patch(f"{self.service_path}") as mock_service,
+            patch.object(self.viewset_class, "service") as mock_service,
             patch(f"{self.serializer_path}") as mock_serializer,
         ):
-            mock_service.find_all.return_value = [self.mock_entity]
+            mock_service.find_list_version.return_value = (None, 1)
+            mock_service.find_page_values.return_value = [self.mock_entity]
             mock_serializer_instance = MagicMock()
             mock_serializer_instance.data = [self.valid_data]
             mock_serializer.return_value = mock_serializer_instance
 
             viewset = self.viewset_class()
-            request = self.factory.get(f"{self.url_prefix}/")
+            request = Request(self.factory.get(f"{self.url_prefix}/"))
             response = viewset.list(request)
 
             self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -50,7 +52,7 @@ class GenericViewSetTestMixin:
             mock_serializer.return_value = mock_serializer_instance
 
             viewset = self.viewset_class()
-            request = self.factory.get(f"{self.url_prefix}/1/")
+            request = Request(self.factory.get(f"{self.url_prefix}/1/"))
             response = viewset.retrieve(request, pk=1)
 
             self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -61,7 +63,7 @@ class GenericViewSetTestMixin:
             mock_service.find_by_id.return_value = None
 
             viewset = self.viewset_class()
-            request = self.factory.get(f"{self.url_prefix}/999/")
+            request = Request(self.factory.get(f"{self.url_prefix}/999/"))
             response = viewset.retrieve(request, pk=999)
 
             self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
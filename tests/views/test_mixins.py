@@ -0,0 +1,56 @@
+"""Unit tests for the shared list and export ViewSet mixins."""
+
+import unittest
+from unittest.mock import patch
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+
+class TestExportMixin(unittest.TestCase):
+    """Test cases for ExportMixin."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+
+    @patch("app.views.degree.DegreeViewSet.service")
+    def test_export_uses_viewset_service(self, mock_service):
+        """Test the export reads rows from the ViewSet's service and names the file."""
+        from app.views import DegreeViewSet
+
+        mock_service.export.return_value = iter([{"id": 1, "name": "Ingeniero"}])
+        view = DegreeViewSet.as_view({"get": "export"}, **DegreeViewSet.export.kwargs)
+
+        response = view(self.factory.get("/api/degrees/export/?fields=id,name"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('filename="degrees.csv"', response["Content-Disposition"])
+        self.assertEqual(
+            b"".join(response.streaming_content).decode().splitlines(),
+            ["id,name", "1,Ingeniero"],
+        )
+        mock_service.export.assert_called_once_with(["id", "name"], {})
+
+    def test_every_list_viewset_exports(self):
+        """Test every paginated ViewSet gets the export action."""
+        from app.views.mixins import ExportMixin, PaginatedListMixin
+        import app.views as views
+
+        viewsets = [
+            getattr(views, name)
+            for name in views.__all__
+            if isinstance(getattr(views, name), type)
+            and issubclass(getattr(views, name), PaginatedListMixin)
+        ]
+
+        self.assertEqual(len(viewsets), 17)
+        for viewset in viewsets:
+            self.assertTrue(issubclass(viewset, ExportMixin), viewset)
+            self.assertIsNotNone(viewset.service, viewset)
+            self.assertIn(
+                "export", [action.__name__ for action in viewset.get_extra_actions()]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
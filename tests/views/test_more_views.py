@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestPositionViewSet(unittest.TestCase):
@@ -16,19 +17,20 @@ class TestPositionViewSet(unittest.TestCase):
         self.mock_position = MagicMock()
         self.mock_position.id = 1
 
-    @patch("app.views.position.PositionService")
+    @patch("app.views.position.PositionViewSet.service")
     @patch("app.views.position.PositionSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing positions successfully."""
         from app.views import PositionViewSet
 
-        mock_service.find_all.return_value = [self.mock_position]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_position]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.position_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = PositionViewSet()
-        request = self.factory.get("/api/positions/")
+        request = Request(self.factory.get("/api/positions/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -45,7 +47,7 @@ class TestPositionViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = PositionViewSet()
-        request = self.factory.get("/api/positions/1/")
+        request = Request(self.factory.get("/api/positions/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -61,19 +63,20 @@ class TestAuthorityViewSet(unittest.TestCase):
         self.mock_authority = MagicMock()
         self.mock_authority.id = 1
 
-    @patch("app.views.authority.AuthorityService")
+    @patch("app.views.authority.AuthorityViewSet.service")
     @patch("app.views.authority.AuthoritySerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing authorities successfully."""
         from app.views import AuthorityViewSet
 
-        mock_service.find_all.return_value = [self.mock_authority]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_authority]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.authority_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = AuthorityViewSet()
-        request = self.factory.get("/api/authorities/")
+        request = Request(self.factory.get("/api/authorities/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -89,19 +92,20 @@ class TestOrientationViewSet(unittest.TestCase):
         self.mock_orientation = MagicMock()
         self.mock_orientation.id = 1
 
-    @patch("app.views.orientation.OrientationService")
+    @patch("app.views.orientation.OrientationViewSet.service")
     @patch("app.views.orientation.OrientationSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing orientations successfully."""
         from app.views import OrientationViewSet
 
-        mock_service.find_all.return_value = [self.mock_orientation]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_orientation]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.orientation_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = OrientationViewSet()
-        request = self.factory.get("/api/orientations/")
+        request = Request(self.factory.get("/api/orientations/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -117,19 +121,20 @@ class TestGroupViewSet(unittest.TestCase):
         self.mock_group = MagicMock()
         self.mock_group.id = 1
 
-    @patch("app.views.group.GroupService")
+    @patch("app.views.group.GroupViewSet.service")
     @patch("app.views.group.GroupSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing groups successfully."""
         from app.views import GroupViewSet
 
-        mock_service.find_all.return_value = [self.mock_group]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_group]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.group_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = GroupViewSet()
-        request = self.factory.get("/api/groups/")
+        request = Request(self.factory.get("/api/groups/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -146,7 +151,7 @@ class TestGroupViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = GroupViewSet()
-        request = self.factory.get("/api/groups/1/")
+        request = Request(self.factory.get("/api/groups/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
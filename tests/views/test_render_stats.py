@@ -0,0 +1,31 @@
+"""Unit tests for RenderStatsView."""
+
+import unittest
+from unittest.mock import patch
+from rest_framework import status
+from rest_framework.test import APIRequestFactory
+
+
+class TestRenderStatsView(unittest.TestCase):
+    """Test cases for RenderStatsView."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.factory = APIRequestFactory()
+
+    @patch("app.views.render_stats.get_render_limiter")
+    def test_render_stats(self, mock_get_limiter):
+        """Test the render limiter counters are returned."""
+        from app.views import RenderStatsView
+
+        mock_get_limiter.return_value.get_stats.return_value = {"admitted": 3}
+
+        view = RenderStatsView()
+        response = view.get(self.factory.get("/api/v1/render_stats/"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"admitted": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
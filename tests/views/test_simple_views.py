@@ -4,6 +4,7 @@ import unittest
 from unittest.mock import patch, MagicMock
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestDegreeViewSet(unittest.TestCase):
@@ -16,19 +17,20 @@ class TestDegreeViewSet(unittest.TestCase):
         self.mock_degree = MagicMock()
         self.mock_degree.id = 1
 
-    @patch("app.views.degree.DegreeService")
+    @patch("app.views.degree.DegreeViewSet.service")
     @patch("app.views.degree.DegreeSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing degrees successfully."""
         from app.views import DegreeViewSet
 
-        mock_service.find_all.return_value = [self.mock_degree]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_degree]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.degree_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = DegreeViewSet()
-        request = self.factory.get("/api/degrees/")
+        request = Request(self.factory.get("/api/degrees/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -44,19 +46,20 @@ class TestDocumentTypeViewSet(unittest.TestCase):
         self.mock_doc_type = MagicMock()
         self.mock_doc_type.id = 1
 
-    @patch("app.views.document_type.DocumentTypeService")
+    @patch("app.views.document_type.DocumentTypeViewSet.service")
     @patch("app.views.document_type.DocumentTypeSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing document types successfully."""
         from app.views import DocumentTypeViewSet
 
-        mock_service.find_all.return_value = [self.mock_doc_type]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_doc_type]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.doc_type_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = DocumentTypeViewSet()
-        request = self.factory.get("/api/document-types/")
+        request = Request(self.factory.get("/api/document-types/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -72,19 +75,20 @@ class TestDepartmentViewSet(unittest.TestCase):
         self.mock_department = MagicMock()
         self.mock_department.id = 1
 
-    @patch("app.views.department.DepartmentService")
+    @patch("app.views.department.DepartmentViewSet.service")
     @patch("app.views.department.DepartmentSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing departments successfully."""
         from app.views import DepartmentViewSet
 
-        mock_service.find_all.return_value = [self.mock_department]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_department]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.department_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = DepartmentViewSet()
-        request = self.factory.get("/api/departments/")
+        request = Request(self.factory.get("/api/departments/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -100,19 +104,20 @@ class TestAreaViewSet(unittest.TestCase):
         self.mock_area = MagicMock()
         self.mock_area.id = 1
 
-    @patch("app.views.area.AreaService")
+    @patch("app.views.area.AreaViewSet.service")
     @patch("app.views.area.AreaSerializer")
     def test_list_success(self, mock_serializer, mock_service):
         """Test listing areas successfully."""
         from app.views import AreaViewSet
 
-        mock_service.find_all.return_value = [self.mock_area]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_area]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.area_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = AreaViewSet()
-        request = self.factory.get("/api/areas/")
+        request = Request(self.factory.get("/api/areas/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -129,7 +134,7 @@ class TestAreaViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = AreaViewSet()
-        request = self.factory.get("/api/areas/1/")
+        request = Request(self.factory.get("/api/areas/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -1,8 +1,12 @@
 """Unit tests for StudentViewSet."""
 
 import unittest
+from io import BytesIO
 from unittest.mock import patch, MagicMock
+from django.test import override_settings
 from rest_framework import status
+from rest_framework.parsers import JSONParser
+from rest_framework.request import Request
 from rest_framework.test import APIRequestFactory
 
 
@@ -21,23 +25,317 @@ class TestStudentViewSet(unittest.TestCase):
 
         self.mock_student = MagicMock()
         self.mock_student.id = 1
+        self.student_row = {
+            "id": 1,
+            "first_name": "Juan",
+            "last_name": "Pérez",
+            "document_number": "12345678",
+            "document_type_id": 1,
+            "birth_date": "2000-05-15",
+            "gender": "M",
+            "student_number": 12345,
+            "enrollment_date": "2020-03-01",
+            "specialty_id": 1,
+            "created_at": None,
+            "updated_at": None,
+        }
 
-    @patch("app.views.student.StudentService")
+    @patch("app.views.student.StudentViewSet.service")
     @patch("app.views.student.StudentSerializer")
     def test_list_students_success(self, mock_serializer, mock_service):
         """Test listing students successfully."""
         from app.views import StudentViewSet
 
-        mock_service.find_all.return_value = [self.mock_student]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.mock_student]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.student_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = StudentViewSet()
-        request = self.factory.get("/api/students/")
+        request = Request(self.factory.get("/api/students/"))
+        response = viewset.list(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_filters(self, mock_service):
+        """Test query parameters other than paging are passed on as filters."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 0)
+        mock_service.find_page_values.return_value = []
+
+        viewset = StudentViewSet()
+        request = Request(
+            self.factory.get("/api/students/?specialty=3&gender=F&page_size=5")
+        )
+        response = viewset.list(request)
+
+        filters = {"specialty": "3", "gender": "F"}
+        mock_service.find_list_version.assert_called_once_with(filters)
+        mock_service.count.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_unsupported_filter(self, mock_service):
+        """Test filtering on a column without an index is rejected."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.side_effect = ValueError(
+            "Unsupported filter: email"
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?email=a@b.com"))
+        response = viewset.list(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Unsupported filter: email"})
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_head_students_estimated_count(self, mock_service):
+        """Test HEAD returns the estimated total in a header without a page."""
+        from app.views import StudentViewSet
+
+        mock_service.count_estimate.return_value = 2500000
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.head("/api/students/?gender=F"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Total-Count"], "2500000")
+        mock_service.count_estimate.assert_called_once_with({"gender": "F"})
+        mock_service.count.assert_not_called()
+        mock_service.find_page_values.assert_not_called()
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_head_students_exact_count(self, mock_service):
+        """Test HEAD with ?count=exact runs an exact count."""
+        from app.views import StudentViewSet
+
+        mock_service.count.return_value = 12
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.head("/api/students/?count=exact"))
+        response = viewset.list(request)
+
+        self.assertEqual(response["X-Total-Count"], "12")
+        mock_service.count_estimate.assert_not_called()
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_estimated_count(self, mock_service):
+        """Test ?count=estimate pages with the estimated total."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 0)
+        mock_service.find_page_values.return_value = []
+        mock_service.count_estimate.return_value = 2500000
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?count=estimate"))
+        response = viewset.list(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 2500000)
+        mock_service.count_estimate.assert_called_once_with({})
+        mock_service.count.assert_not_called()
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_estimated_count_etag(self, mock_service):
+        """Test the ETag of an estimated list changes with the estimate."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 3)
+        mock_service.find_page_values.return_value = []
+        mock_service.count_estimate.return_value = 2500000
+        viewset = StudentViewSet()
+
+        def etag():
+            request = Request(self.factory.get("/api/students/?count=estimate"))
+            return viewset.list(request)["ETag"]
+
+        first = etag()
+        mock_service.count_estimate.return_value = 2600000
+
+        self.assertNotEqual(first, etag())
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_exact_count_from_version(self, mock_service):
+        """Test an exact list takes its total from the version, counting once."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 12)
+        mock_service.find_page_values.return_value = []
+
+        viewset = StudentViewSet()
+        response = viewset.list(Request(self.factory.get("/api/students/")))
+
+        self.assertEqual(response.data["count"], 12)
+        self.assertEqual(response["X-Total-Count"], "12")
+        mock_service.find_list_version.assert_called_once_with({})
+        mock_service.count.assert_not_called()
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_invalid_count_mode(self, mock_service):
+        """Test an unknown ?count= mode is rejected."""
+        from app.views import StudentViewSet
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?count=fast"))
+        response = viewset.list(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("count", response.data)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_sparse_fields(self, mock_service):
+        """Test ?fields= shapes the output and is pushed down to the service."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [
+            {"id": 1, "first_name": "Juan", "last_name": "Pérez"}
+        ]
+
+        viewset = StudentViewSet()
+        request = Request(
+            self.factory.get("/api/students/?fields=id,first_name,last_name")
+        )
+        response = viewset.list(request)
+
+        mock_service.find_page_values.assert_called_once_with(
+            0, 1, fields=["id", "first_name", "last_name"], filters={}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [{"id": 1, "first_name": "Juan", "last_name": "Pérez"}],
+        )
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_unknown_field(self, mock_service):
+        """Test requesting an unknown field returns 400."""
+        from app.views import StudentViewSet
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?fields=id,password"))
+        response = viewset.list(request)
+
+        mock_service.find_page_values.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("fields", response.data)
+
+    @patch("app.views.student.StudentService")
+    def test_retrieve_student_sparse_fields(self, mock_service):
+        """Test retrieving a student with ?fields= loads only those fields."""
+        from app.views import StudentViewSet
+
+        self.mock_student.student_number = 12345
+        mock_service.find_by_id.return_value = self.mock_student
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/?fields=student_number"))
+        response = viewset.retrieve(request, pk=1)
+
+        mock_service.find_by_id.assert_called_once_with(
+            1, ["student_number", "updated_at"]
+        )
+        self.assertEqual(response.data, {"student_number": 12345})
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_cursor(self, mock_service):
+        """Test a cursor parameter switches the list to keyset pages."""
+        from app.serializers import StudentSerializer
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 0)
+        mock_service.find_page_after_values.return_value = [
+            dict(self.student_row, id=1),
+            dict(self.student_row, id=2),
+        ]
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?cursor=&page_size=1"))
+        response = viewset.list(request)
+
+        mock_service.find_page_after_values.assert_called_once_with(
+            None, 2, False, fields=StudentSerializer.Meta.fields, filters={}
+        )
+        mock_service.count.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["results"], [dict(self.student_row, id=1)])
+        self.assertIn("cursor=", response.data["next"])
+        self.assertIsNone(response.data["previous"])
+        self.assertNotIn("count", response.data)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_list_students_invalid_cursor(self, mock_service):
+        """Test an invalid cursor returns 404."""
+        from app.views import StudentViewSet
+
+        mock_service.find_list_version.return_value = (None, 0)
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/?cursor=invalid"))
+        response = viewset.list(request)
+
+        mock_service.find_page_after_values.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_export_students_csv(self, mock_service):
+        """Test exporting students streams a CSV attachment."""
+        from app.views import StudentViewSet
+
+        mock_service.export.return_value = iter([])
+        view = StudentViewSet.as_view({"get": "export"}, **StudentViewSet.export.kwargs)
+
+        response = view(self.factory.get("/api/students/export/?specialty=3"))
+
+        fields = mock_service.export.call_args.args[0]
+        mock_service.export.assert_called_once_with(fields, {"specialty": "3"})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertEqual(
+            response["Content-Disposition"], 'attachment; filename="students.csv"'
+        )
+        self.assertEqual(
+            b"".join(response.streaming_content).decode("utf-8"),
+            ",".join(fields) + "\r\n",
+        )
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_export_students_ndjson(self, mock_service):
+        """Test ?format=ndjson streams one JSON object per row."""
+        from app.views import StudentViewSet
+
+        mock_service.export.return_value = iter(
+            [{field: None for field in StudentViewSet.serializer_class.Meta.fields}]
+        )
+        view = StudentViewSet.as_view({"get": "export"}, **StudentViewSet.export.kwargs)
+
+        response = view(self.factory.get("/api/students/export/?format=ndjson"))
+
+        mock_service.export.assert_called_once()
+        self.assertEqual(mock_service.export.call_args.args[1], {})
+        self.assertEqual(
+            response["Content-Type"], "application/x-ndjson; charset=utf-8"
+        )
+        self.assertEqual(len(b"".join(response.streaming_content).splitlines()), 1)
+
+    @patch("app.views.student.StudentViewSet.service")
+    def test_export_students_invalid_filter(self, mock_service):
+        """Test exporting with an unsupported filter returns 400."""
+        from app.views import StudentViewSet
+
+        mock_service.export.side_effect = ValueError("Unsupported filter: email")
+        view = StudentViewSet.as_view({"get": "export"}, **StudentViewSet.export.kwargs)
+
+        response = view(self.factory.get("/api/students/export/?email=x"))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {"error": "Unsupported filter: email"})
 
     @patch("app.views.student.StudentService")
     @patch("app.views.student.StudentSerializer")
@@ -51,7 +349,7 @@ class TestStudentViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = StudentViewSet()
-        request = self.factory.get("/api/students/1/")
+        request = Request(self.factory.get("/api/students/1/"))
         response = viewset.retrieve(request, pk=1)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -64,7 +362,7 @@ class TestStudentViewSet(unittest.TestCase):
         mock_service.find_by_id.return_value = None
 
         viewset = StudentViewSet()
-        request = self.factory.get("/api/students/999/")
+        request = Request(self.factory.get("/api/students/999/"))
         response = viewset.retrieve(request, pk=999)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -94,6 +392,342 @@ class TestStudentViewSet(unittest.TestCase):
         # Should handle invalid data
         self.assertIsNotNone(response)
 
+    def batch_request(self, rows):
+        """Build a JSON POST to the batch endpoint."""
+        return Request(
+            self.factory.post("/api/students/batch/", rows, format="json"),
+            parsers=[JSONParser()],
+        )
+
+    def batch_row(self, student_number):
+        """Build a well-formed batch row."""
+        row = {
+            key: value
+            for key, value in self.student_row.items()
+            if key not in ("id", "created_at", "updated_at")
+        }
+        row["student_number"] = student_number
+        row["document_number"] = str(10000000 + student_number)
+        return row
+
+    @patch("app.views.student.StudentService")
+    def test_create_batch_success(self, mock_service):
+        """Test a valid batch is created and its ids reported."""
+        from app.views import StudentViewSet
+
+        created = [MagicMock(id=7), MagicMock(id=8)]
+        mock_service.create_batch.return_value = (created, {})
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(
+            self.batch_request([self.batch_row(1), self.batch_row(2)])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {"created": 2, "ids": [7, 8]})
+        (students_data,) = mock_service.create_batch.call_args.args
+        self.assertEqual([data["student_number"] for data in students_data], [1, 2])
+
+    @patch("app.views.student.StudentService")
+    def test_create_batch_invalid_rows(self, mock_service):
+        """Test malformed rows and conflicts of the other rows are all reported."""
+        from app.views import StudentViewSet
+
+        mock_service.validate_batch.return_value = {
+            2: {"specialty_id": ["Specialty with id 9 does not exist"]},
+            0: {"student_number": ["Student number 1 is already taken"]},
+        }
+        invalid = {**self.batch_row(2), "first_name": ""}
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(
+            self.batch_request([self.batch_row(1), invalid, self.batch_row(3)])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = response.data["errors"]
+        self.assertEqual([error["index"] for error in errors], [0, 1, 2])
+        self.assertIn("student_number", errors[0]["errors"])
+        self.assertIn("first_name", errors[1]["errors"])
+        self.assertIn("specialty_id", errors[2]["errors"])
+        (students_data,) = mock_service.validate_batch.call_args.args
+        self.assertEqual(sorted(students_data), [0, 2])
+        mock_service.create_batch.assert_not_called()
+
+    @patch("app.views.student.StudentService")
+    def test_create_batch_conflicts(self, mock_service):
+        """Test rows rejected by the service are reported by index."""
+        from app.views import StudentViewSet
+
+        mock_service.create_batch.return_value = (
+            [],
+            {0: {"student_number": ["Student number 1 is already taken"]}},
+        )
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(self.batch_request([self.batch_row(1)]))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["errors"],
+            [
+                {
+                    "index": 0,
+                    "errors": {"student_number": ["Student number 1 is already taken"]},
+                }
+            ],
+        )
+
+    @patch("app.views.student.StudentService")
+    def test_create_batch_concurrent_conflict(self, mock_service):
+        """Test a unique violation raised by the insert is reported as 409."""
+        from django.db import IntegrityError
+        from app.views import StudentViewSet
+
+        mock_service.create_batch.side_effect = IntegrityError("duplicate key")
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(self.batch_request([self.batch_row(1)]))
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+    def test_create_batch_not_a_list(self):
+        """Test the batch must be a non-empty list."""
+        from app.views import StudentViewSet
+
+        viewset = StudentViewSet()
+
+        for payload in ({"first_name": "Juan"}, []):
+            response = viewset.create_batch(self.batch_request(payload))
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @override_settings(STUDENT_BATCH_MAX_SIZE=1)
+    @patch("app.views.student.StudentService")
+    def test_create_batch_too_large(self, mock_service):
+        """Test batches above STUDENT_BATCH_MAX_SIZE are rejected."""
+        from app.views import StudentViewSet
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(
+            self.batch_request([self.batch_row(1), self.batch_row(2)])
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        mock_service.create_batch.assert_not_called()
+
+    @patch("app.views.student.StudentService")
+    def test_create_batch_error(self, mock_service):
+        """Test creating a batch handles errors."""
+        from app.views import StudentViewSet
+
+        mock_service.create_batch.side_effect = Exception("Database error")
+
+        viewset = StudentViewSet()
+        response = viewset.create_batch(self.batch_request([self.batch_row(1)]))
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificates_success(self, mock_service):
+        """Test generating a certificates archive streams a ZIP."""
+        from app.views import StudentViewSet
+
+        mock_service.generate_certificates_archive.return_value = iter([b"PK"])
+
+        viewset = StudentViewSet()
+        request = Request(
+            self.factory.get("/api/students/certificates/?specialty=1&type=pdf")
+        )
+        response = viewset.generate_certificates(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertEqual(b"".join(response.streaming_content), b"PK")
+        mock_service.generate_certificates_archive.assert_called_once_with(
+            "pdf", specialty_id=1, faculty_id=None
+        )
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificates_invalid_request(self, mock_service):
+        """Test generating a certificates archive without specialty or faculty."""
+        from app.views import StudentViewSet
+
+        mock_service.generate_certificates_archive.side_effect = ValueError(
+            "Either specialty or faculty must be provided"
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/certificates/"))
+        response = viewset.generate_certificates(request)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificates_busy(self, mock_service):
+        """Test a rejected archive answers 503 with Retry-After."""
+        from app.views import StudentViewSet
+        from app.utils import RenderRejectedError
+
+        mock_service.generate_certificates_archive.side_effect = RenderRejectedError(
+            "Certificate rendering is busy, try again later", 10
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/certificates/?faculty=1"))
+        response = viewset.generate_certificates(request)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "10")
+
+    @patch("app.views.student.StudentService")
+    def test_generate_merged_certificates_success(self, mock_service):
+        """Test generating a merged certificates PDF for a faculty."""
+        from app.views import StudentViewSet
+
+        mock_service.generate_merged_certificates.return_value = BytesIO(b"PDF")
+
+        viewset = StudentViewSet()
+        request = Request(
+            self.factory.get("/api/students/certificates/merged/?faculty=3")
+        )
+        response = viewset.generate_merged_certificates(request)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertIn("certificados_facultad_3.pdf", response["Content-Disposition"])
+        mock_service.generate_merged_certificates.assert_called_once_with(
+            specialty_id=None, faculty_id=3
+        )
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_success(self, mock_service):
+        """Test the certificate is streamed from the returned file."""
+        from app.views import StudentViewSet
+
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+        mock_service.get_regular_student_certificate.return_value = BytesIO(
+            b"PDF content"
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/certificate/"))
+        response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Content-Length"], "11")
+        self.assertEqual(b"".join(response.streaming_content), b"PDF content")
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_docx_headers(self, mock_service):
+        """Test DOCX certificates get their own content type and filename."""
+        from app.views import StudentViewSet
+
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+        mock_service.get_regular_student_certificate.return_value = BytesIO(b"DOCX")
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/certificate/?type=docx"))
+        response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response["Content-Type"],
+            "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        )
+        self.assertIn(
+            'filename="certificado_estudiante_1.docx"',
+            response["Content-Disposition"],
+        )
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_validators(self, mock_service):
+        """Test certificate responses carry ETag and Last-Modified."""
+        from app.views import StudentViewSet
+
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+        mock_service.get_regular_student_certificate.return_value = BytesIO(b"PDF")
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/certificate/"))
+        response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response["ETag"], '"abc"')
+        self.assertEqual(response["Last-Modified"], "Tue, 14 Nov 2023 22:13:20 GMT")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_not_modified(self, mock_service):
+        """Test a matching If-None-Match answers 304 without rendering."""
+        from app.views import StudentViewSet
+
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+
+        viewset = StudentViewSet()
+        request = Request(
+            self.factory.get("/api/students/1/certificate/", HTTP_IF_NONE_MATCH='"abc"')
+        )
+        response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], '"abc"')
+        mock_service.get_regular_student_certificate.assert_not_called()
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_busy(self, mock_service):
+        """Test a rejected render answers 503 with Retry-After."""
+        from app.utils import RenderRejectedError
+        from app.views import StudentViewSet
+
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+        mock_service.get_regular_student_certificate.side_effect = RenderRejectedError(
+            "Certificate rendering is busy", 10
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/certificate/"))
+        response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_503_SERVICE_UNAVAILABLE)
+        self.assertEqual(response["Retry-After"], "10")
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_sendfile(self, mock_service):
+        """Test cached certificates are offloaded to the web server."""
+        from app.views import StudentViewSet
+
+        mock_file = MagicMock()
+        mock_file.name = "/cache/certificates/ab/abcd.pdf"
+        mock_service.get_certificate_validators.return_value = ('"abc"', 1700000000)
+        mock_service.get_regular_student_certificate.return_value = mock_file
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/1/certificate/"))
+        with override_settings(
+            CERTIFICATE_SENDFILE_HEADER="X-Sendfile", CERTIFICATE_SENDFILE_PREFIX=""
+        ):
+            response = viewset.generate_certificate(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["X-Sendfile"], "/cache/certificates/ab/abcd.pdf")
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        mock_file.close.assert_called_once()
+
+    @patch("app.views.student.StudentService")
+    def test_generate_certificate_student_not_found(self, mock_service):
+        """Test generating the certificate of a non-existent student."""
+        from app.views import StudentViewSet
+
+        mock_service.get_regular_student_certificate.side_effect = ValueError(
+            "Student with id 999 not found"
+        )
+
+        viewset = StudentViewSet()
+        request = Request(self.factory.get("/api/students/999/certificate/"))
+        response = viewset.generate_certificate(request, pk=999)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,12 @@
 """Unit tests for UniversityViewSet."""
 
+import datetime
 import unittest
 from unittest.mock import patch, MagicMock
+from django.test import override_settings
 from rest_framework import status
 from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
 
 
 class TestUniversityViewSet(unittest.TestCase):
@@ -22,34 +25,161 @@ class TestUniversityViewSet(unittest.TestCase):
         self.mock_university.id = 1
         self.mock_university.name = "Universidad Nacional de Córdoba"
         self.mock_university.acronym = "UNC"
+        self.university_row = {
+            "id": 1,
+            "name": "Universidad Nacional de Córdoba",
+            "acronym": "UNC",
+            "created_at": None,
+            "updated_at": None,
+        }
+        self.columns = ["id", "name", "acronym", "created_at", "updated_at"]
+        self.updated_at = datetime.datetime(
+            2024, 1, 1, 12, 0, tzinfo=datetime.timezone.utc
+        )
 
-    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversityViewSet.service")
     @patch("app.views.university.UniversitySerializer")
     def test_list_universities_success(self, mock_serializer, mock_service):
         """Test listing universities successfully."""
         from app.views import UniversityViewSet
 
-        mock_service.find_all.return_value = [self.mock_university]
+        mock_service.find_list_version.return_value = (None, 1)
+        mock_service.find_page_values.return_value = [self.university_row]
         mock_serializer_instance = MagicMock()
         mock_serializer_instance.data = [self.university_data]
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/")
+        request = Request(self.factory.get("/api/universities/"))
         response = viewset.list(request)
 
-        mock_service.find_all.assert_called_once()
+        mock_service.find_page_values.assert_called_once_with(
+            0, 1, fields=self.columns, filters={}
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
-    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversityViewSet.service")
+    @patch("app.views.university.UniversitySerializer")
+    def test_list_universities_page_metadata(self, mock_serializer, mock_service):
+        """Test listing universities returns the requested page and metadata."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (None, 25)
+        mock_service.find_page_values.return_value = [self.university_row]
+        mock_serializer.return_value.data = [self.university_data]
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/?page=2&page_size=10"))
+        response = viewset.list(request)
+
+        mock_service.find_page_values.assert_called_once_with(
+            10, 10, fields=self.columns, filters={}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 25)
+        self.assertEqual(response["X-Total-Count"], "25")
+        self.assertIn("page=3", response.data["next"])
+        self.assertIn("page_size=10", response.data["previous"])
+        self.assertEqual(response.data["results"], [self.university_row])
+
+    @patch("app.views.university.UniversityViewSet.service")
+    @patch("app.views.university.UniversitySerializer")
+    def test_list_universities_page_size_capped(self, mock_serializer, mock_service):
+        """Test the requested page size is capped at API_MAX_PAGE_SIZE."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (None, 5000)
+        mock_service.find_page_values.return_value = []
+        mock_serializer.return_value.data = []
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/?page_size=100000"))
+        with override_settings(API_MAX_PAGE_SIZE=500):
+            viewset.list(request)
+
+        mock_service.find_page_values.assert_called_once_with(
+            0, 500, fields=self.columns, filters={}
+        )
+
+    @patch("app.views.university.UniversityViewSet.service")
+    def test_list_universities_not_modified(self, mock_service):
+        """Test an unchanged list is answered with 304 without loading a page."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (self.updated_at, 1)
+        mock_service.find_page_values.return_value = [self.university_row]
+        viewset = UniversityViewSet()
+        etag = viewset.list(Request(self.factory.get("/api/universities/")))["ETag"]
+        mock_service.find_page_values.reset_mock()
+
+        response = viewset.list(
+            Request(self.factory.get("/api/universities/", HTTP_IF_NONE_MATCH=etag))
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_service.find_page_values.assert_not_called()
+        mock_service.find_list_version.assert_called_with({})
+
+    @patch("app.views.university.UniversityViewSet.service")
+    def test_list_universities_etag_changes(self, mock_service):
+        """Test the list ETag changes with the rows and with the page."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (self.updated_at, 1, 1)
+        mock_service.find_page_values.return_value = []
+        viewset = UniversityViewSet()
+
+        def etag(url):
+            return viewset.list(Request(self.factory.get(url)))["ETag"]
+
+        first = etag("/api/universities/")
+        second_page = etag("/api/universities/?page_size=5")
+        mock_service.find_list_version.return_value = (self.updated_at, 2, 2)
+
+        self.assertNotEqual(first, second_page)
+        self.assertNotEqual(first, etag("/api/universities/"))
+
+    @patch("app.views.university.UniversityViewSet.service")
+    def test_list_universities_etag_changes_on_replaced_row(self, mock_service):
+        """Test deleting a row and inserting another changes the list ETag."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (self.updated_at, 1, 1)
+        mock_service.find_page_values.return_value = []
+        viewset = UniversityViewSet()
+
+        def etag():
+            return viewset.list(Request(self.factory.get("/api/universities/")))["ETag"]
+
+        first = etag()
+        # Same count and latest timestamp, but the row behind them changed
+        mock_service.find_list_version.return_value = (self.updated_at, 1, 2)
+
+        self.assertNotEqual(first, etag())
+
+    @patch("app.views.university.UniversityViewSet.service")
+    def test_list_universities_invalid_page(self, mock_service):
+        """Test requesting a page past the end returns 404."""
+        from app.views import UniversityViewSet
+
+        mock_service.find_list_version.return_value = (None, 5)
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/?page=3"))
+        response = viewset.list(request)
+
+        mock_service.find_page_values.assert_not_called()
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    @patch("app.views.university.UniversityViewSet.service")
     def test_list_universities_error(self, mock_service):
         """Test listing universities handles errors."""
         from app.views import UniversityViewSet
 
-        mock_service.find_all.side_effect = Exception("Database error")
+        mock_service.find_list_version.side_effect = Exception("Database error")
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/")
+        request = Request(self.factory.get("/api/universities/"))
         response = viewset.list(request)
 
         self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -66,11 +196,82 @@ class TestUniversityViewSet(unittest.TestCase):
         mock_serializer.return_value = mock_serializer_instance
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/1/")
+        request = Request(self.factory.get("/api/universities/1/"))
+        response = viewset.retrieve(request, pk=1)
+
+        mock_service.find_by_id.assert_called_once_with(1, None)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @patch("app.views.university.UniversityService")
+    def test_retrieve_university_validators(self, mock_service):
+        """Test a retrieved university carries ETag and Last-Modified."""
+        from app.views import UniversityViewSet
+
+        self.mock_university.updated_at = self.updated_at
+        mock_service.find_by_id.return_value = self.mock_university
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/1/"))
         response = viewset.retrieve(request, pk=1)
 
-        mock_service.find_by_id.assert_called_once_with(1)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertEqual(response["Last-Modified"], "Mon, 01 Jan 2024 12:00:00 GMT")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversitySerializer")
+    def test_retrieve_university_not_modified(self, mock_serializer, mock_service):
+        """Test a current If-None-Match is answered with 304 without serializing."""
+        from app.views import UniversityViewSet
+
+        self.mock_university.updated_at = self.updated_at
+        mock_service.find_by_id.return_value = self.mock_university
+        viewset = UniversityViewSet()
+        etag = viewset.retrieve(
+            Request(self.factory.get("/api/universities/1/")), pk=1
+        )["ETag"]
+
+        request = Request(
+            self.factory.get("/api/universities/1/", HTTP_IF_NONE_MATCH=etag)
+        )
+        with patch.object(viewset, "serializer_class") as serializer_class:
+            response = viewset.retrieve(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        serializer_class.assert_not_called()
+
+    @patch("app.views.university.UniversityService")
+    def test_retrieve_university_modified_since(self, mock_service):
+        """Test If-Modified-Since is answered from the row's updated_at."""
+        from app.views import UniversityViewSet
+
+        self.mock_university.updated_at = self.updated_at
+        mock_service.find_by_id.return_value = self.mock_university
+        viewset = UniversityViewSet()
+
+        current = viewset.retrieve(
+            Request(
+                self.factory.get(
+                    "/api/universities/1/",
+                    HTTP_IF_MODIFIED_SINCE="Mon, 01 Jan 2024 12:00:00 GMT",
+                )
+            ),
+            pk=1,
+        )
+        stale = viewset.retrieve(
+            Request(
+                self.factory.get(
+                    "/api/universities/1/",
+                    HTTP_IF_MODIFIED_SINCE="Sun, 31 Dec 2023 12:00:00 GMT",
+                )
+            ),
+            pk=1,
+        )
+
+        self.assertEqual(current.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(stale.status_code, status.HTTP_200_OK)
 
     @patch("app.views.university.UniversityService")
     def test_retrieve_university_not_found(self, mock_service):
@@ -80,7 +281,7 @@ class TestUniversityViewSet(unittest.TestCase):
         mock_service.find_by_id.return_value = None
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/999/")
+        request = Request(self.factory.get("/api/universities/999/"))
         response = viewset.retrieve(request, pk=999)
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -91,11 +292,156 @@ class TestUniversityViewSet(unittest.TestCase):
         from app.views import UniversityViewSet
 
         viewset = UniversityViewSet()
-        request = self.factory.get("/api/universities/invalid/")
+        request = Request(self.factory.get("/api/universities/invalid/"))
         response = viewset.retrieve(request, pk="invalid")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.StudentService")
+    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversityTreeSerializer")
+    def test_tree_built_and_cached(
+        self, mock_serializer, mock_service, mock_student_service, mock_cache
+    ):
+        """Test a missing tree is built once and stored under its key."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:1:7"
+        mock_cache.get.return_value = None
+        mock_service.find_tree.return_value = self.mock_university
+        mock_serializer.return_value.data = {"id": 1, "faculties": []}
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/1/tree/"))
+        response = viewset.tree(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"id": 1, "faculties": []})
+        self.assertTrue(response["ETag"].startswith('"'))
+        mock_cache.get_key.assert_called_once_with(1, False)
+        mock_service.find_tree.assert_called_once_with(1)
+        mock_student_service.count_by_specialty.assert_not_called()
+        mock_serializer.assert_called_once_with(
+            self.mock_university, context={"student_counts": None}
+        )
+        mock_cache.set.assert_called_once_with(
+            "university-tree:1:7", {"id": 1, "faculties": []}
+        )
+
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.UniversityService")
+    def test_tree_from_cache(self, mock_service, mock_cache):
+        """Test a cached tree is served without touching the database."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:1:7"
+        mock_cache.get.return_value = {"id": 1, "faculties": []}
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/1/tree/"))
+        response = viewset.tree(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"id": 1, "faculties": []})
+        mock_service.find_tree.assert_not_called()
+        mock_cache.set.assert_not_called()
+
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.StudentService")
+    @patch("app.views.university.UniversityService")
+    @patch("app.views.university.UniversityTreeSerializer")
+    def test_tree_with_student_counts(
+        self, mock_serializer, mock_service, mock_student_service, mock_cache
+    ):
+        """Test ?student_counts=true adds the counts of one grouped query."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:1:7:3"
+        mock_cache.get.return_value = None
+        mock_service.find_tree.return_value = self.mock_university
+        mock_student_service.count_by_specialty.return_value = {1: 3}
+        mock_serializer.return_value.data = {"id": 1, "student_count": 3}
+
+        viewset = UniversityViewSet()
+        request = Request(
+            self.factory.get("/api/universities/1/tree/?student_counts=true")
+        )
+        response = viewset.tree(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        mock_cache.get_key.assert_called_once_with(1, True)
+        mock_student_service.count_by_specialty.assert_called_once_with(1)
+        mock_serializer.assert_called_once_with(
+            self.mock_university, context={"student_counts": {1: 3}}
+        )
+
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.UniversityService")
+    def test_tree_not_modified(self, mock_service, mock_cache):
+        """Test a current If-None-Match is answered with 304 from the key."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:1:7"
+        mock_cache.get.return_value = {"id": 1}
+        viewset = UniversityViewSet()
+        etag = viewset.tree(
+            Request(self.factory.get("/api/universities/1/tree/")), pk=1
+        )["ETag"]
+        mock_cache.get.reset_mock()
+
+        request = Request(
+            self.factory.get("/api/universities/1/tree/", HTTP_IF_NONE_MATCH=etag)
+        )
+        response = viewset.tree(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_cache.get.assert_not_called()
+        mock_service.find_tree.assert_not_called()
+
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.UniversityService")
+    def test_tree_not_found(self, mock_service, mock_cache):
+        """Test the tree of a non-existent university."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:999:7"
+        mock_cache.get.return_value = None
+        mock_service.find_tree.return_value = None
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/999/tree/"))
+        response = viewset.tree(request, pk=999)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        mock_cache.set.assert_not_called()
+
+    def test_tree_invalid_id(self):
+        """Test the tree of a university with invalid ID format."""
+        from app.views import UniversityViewSet
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/invalid/tree/"))
+        response = viewset.tree(request, pk="invalid")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @patch("app.views.university.HierarchyCache")
+    @patch("app.views.university.UniversityService")
+    def test_tree_error(self, mock_service, mock_cache):
+        """Test building a tree handles errors."""
+        from app.views import UniversityViewSet
+
+        mock_cache.get_key.return_value = "university-tree:1:7"
+        mock_cache.get.return_value = None
+        mock_service.find_tree.side_effect = Exception("Database error")
+
+        viewset = UniversityViewSet()
+        request = Request(self.factory.get("/api/universities/1/tree/"))
+        response = viewset.tree(request, pk=1)
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
     @patch("app.views.university.UniversityService")
     def test_create_university_success(self, mock_service):
         """Test creating a university successfully."""